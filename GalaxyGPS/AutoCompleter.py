@@ -3,29 +3,51 @@ import logging
 import os
 import queue
 import threading
+import time
 import traceback
 from tkinter import *
 
+from . import http_client
 from .PlaceHolder import PlaceHolder
 from .ui_helpers import style_listbox_for_theme
-from config import appname, user_agent  # type: ignore
-import timeout_session  # type: ignore
+from config import appname  # type: ignore
 
 # We need a name of plugin dir, not AutoCompleter.py dir
 plugin_name = os.path.basename(os.path.dirname(os.path.dirname(__file__)))
 logger = logging.getLogger(f'{appname}.{plugin_name}')
 
+# Wait this long after the last keystroke before querying Spansh
+AUTOCOMPLETE_DEBOUNCE_MS = 250
+# Shortest input that is looked up
+AUTOCOMPLETE_MIN_CHARS = 3
+
 
 class AutoCompleter(PlaceHolder):
-    def __init__(self, parent, placeholder, **kw):
+    def __init__(self, parent, placeholder, system_cache=None, **kw):
+        """
+        Args:
+            parent: Parent widget
+            placeholder: Placeholder text
+            system_cache: Optional SystemNameCache shared between autocompleters
+            **kw: Passed to the Entry and Listbox
+        """
 
         self.parent = parent
+        self.system_cache = system_cache
 
         self.lb = Listbox(self.parent, selectmode=SINGLE, **kw)
         self.lb_up = False
         self.has_selected = False
         self.queue = queue.Queue()
 
+        # Query worker state: one long-lived thread per widget, started on first use.
+        # _pending holds only the latest (seq, prefix, due time); older prefixes are coalesced away.
+        # _seq is bumped on the main thread for every new input, results tagged with an older seq are dropped.
+        self._seq = 0
+        self._pending = None
+        self._pending_cond = threading.Condition()
+        self._worker = None
+
         PlaceHolder.__init__(self, parent, placeholder, **kw)
         self.var.traceid = self.var.trace('w', self.changed)
 
@@ -80,12 +102,65 @@ class AutoCompleter(PlaceHolder):
 
     def changed(self, name=None, index=None, mode=None):
         value = self.var.get()
-        if len(value) < 3 and self.lb_up or self.has_selected:
+        # Any new input makes results of earlier inputs stale
+        self._seq += 1
+        if len(value) < AUTOCOMPLETE_MIN_CHARS and self.lb_up or self.has_selected:
             self.hide_list()
             self.has_selected = False
+            self._cancel_query()
         else:
-            t = threading.Thread(target=self.query_systems, args=[value])
-            t.start()
+            self._request_query(value)
+
+    def _request_query(self, value):
+        """Schedule a lookup of value on the query worker, replacing any lookup not started yet."""
+        inp = value.strip()
+        if inp == self.placeholder or len(inp) < AUTOCOMPLETE_MIN_CHARS:
+            self._cancel_query()
+            return
+        if self.system_cache is not None:
+            cached = self.system_cache.lookup(inp)
+            if cached is not None:
+                # Known prefix (or filtered from a shorter one): no debounce, no network round-trip
+                self._cancel_query()
+                if cached:
+                    self.queue.put((self._seq, cached))
+                else:
+                    # No matches: don't leave the previous prefix's list open
+                    self.hide_list()
+                return
+        due = time.monotonic() + AUTOCOMPLETE_DEBOUNCE_MS / 1000
+        with self._pending_cond:
+            self._pending = (self._seq, inp, due)
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._query_worker, name="AutoCompleter", daemon=True)
+                self._worker.start()
+            self._pending_cond.notify()
+
+    def _cancel_query(self):
+        with self._pending_cond:
+            self._pending = None
+
+    def _query_worker(self):
+        """Worker: wait for the input to settle, look up the latest prefix and queue the results."""
+        while True:
+            with self._pending_cond:
+                # Wait for a request, then until its debounce window passes; a newer request restarts the wait
+                while True:
+                    if self._pending is None:
+                        self._pending_cond.wait()
+                        continue
+                    remaining = self._pending[2] - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._pending_cond.wait(remaining)
+                seq, inp, _due = self._pending
+                self._pending = None
+
+            results = self.query_systems(inp)
+            if results is not None and self.system_cache is not None:
+                self.system_cache.store(inp, results)
+            if results:
+                self.queue.put((seq, results))
 
     def selection(self, event=None):
         if self.lb_up:
@@ -153,29 +228,39 @@ class AutoCompleter(PlaceHolder):
             self.lb_up = False
 
     def query_systems(self, inp):
+        """
+        Look up system names starting with inp on Spansh (called on the query worker).
+
+        Args:
+            inp: Text typed so far
+
+        Returns:
+            List of system names, or None on error
+        """
         inp = inp.strip()
-        if inp != self.placeholder and len(inp) >= 3:
+        if inp != self.placeholder and len(inp) >= AUTOCOMPLETE_MIN_CHARS:
             url = "https://spansh.co.uk/api/systems?"
             try:
-                session = timeout_session.new_session()
-                session.headers['User-Agent'] = user_agent + ' GalaxyGPS'
-                results = session.get(url, params={'q': inp}, timeout=3)
-                lista = json.loads(results.content)
-                if lista:
-                    self.write(lista)
+                # Shared pooled session, so the connection to Spansh is kept alive between lookups
+                results = http_client.get(url, params={'q': inp}, timeout=3)
+                return json.loads(results.content)
             except Exception:
                 logger.warning('!! ' + traceback.format_exc(), exc_info=False)
+        return None
 
     def write(self, lista):
-        self.queue.put(lista)
+        self.queue.put((self._seq, lista))
 
     def clear(self):
-        self.queue.put(None)
+        self.queue.put((self._seq, None))
 
     def update_me(self):
         try:
             while 1:
-                lista = self.queue.get_nowait()
+                seq, lista = self.queue.get_nowait()
+                if seq != self._seq:
+                    # Results for an input that has since changed
+                    continue
                 self.show_results(lista)
                 self.update_idletasks()
         except queue.Empty:
@@ -188,6 +273,9 @@ class AutoCompleter(PlaceHolder):
         else:
             self.set_default_style()
 
+        # Programmatic text replaces whatever was typed; drop lookups still in flight
+        self._seq += 1
+        self._cancel_query()
         try:
             self.var.trace_vdelete("w", self.var.traceid)
         except (AttributeError, ValueError):
@@ -2,11 +2,13 @@ import csv
 import logging
 import os
 import traceback
-from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional
 
 from config import appname  # type: ignore
 
+from .CsvExporter import CsvExporter
+from .timestamps import normalize_timestamp, utc_now_timestamp
+
 # We need a name of plugin dir, not CargoDetailsManager.py dir
 plugin_name = os.path.basename(os.path.dirname(os.path.dirname(__file__)))
 logger = logging.getLogger(f'{appname}.{plugin_name}')
@@ -30,25 +32,88 @@ class CargoDetailsManager:
         'Source Galaxy'
     ]
     
-    def __init__(self, plugin_dir: str):
+    def __init__(self, plugin_dir: str, store=None):
         """
         Initialize the CargoDetailsManager.
         
         Args:
             plugin_dir: Directory where the plugin is installed
+            store: Optional CarrierStore holding the data; the CSV file is then
+                   still exported on every save for other tools
         """
         self.plugin_dir = plugin_dir
         self.cargo_file = os.path.join(plugin_dir, 'fleet_carrier_cargo.csv')
+        self._csv_exporter = CsvExporter(self.cargo_file, self.CSV_HEADERS)
         # Keyed by callsign, value is dict of commodity name -> cargo item
         self.cargo: Dict[str, Dict[str, Dict]] = {}
         
+        self.store = store
+        self.data_version = 0  # Bumped on every change to self.cargo (see save_cargo)
+        # Called with each changed callsign (None for all) after every change
+        self.change_listener: Optional[Callable[[Optional[str]], None]] = None
+        
         # Load existing cargo data
         self.load_cargo()
+        if self.store is not None and not self.store.is_migrated('cargo'):
+            # First start with the store: carry over the CSV data
+            self.store.migrate('cargo', [item for items in self.cargo.values() for item in items.values()])
+        self._normalize_loaded_timestamps()
+    
+    def _normalize_loaded_timestamps(self) -> None:
+        """
+        Cache the epoch of every cargo item's last_updated, rewriting legacy formats as ISO 8601 once.
+        """
+        # All items of a carrier share one timestamp, so each distinct string is parsed once
+        normalized = {}
+        migrated = []
+        for callsign, items in self.cargo.items():
+            changed = False
+            for item in items.values():
+                original = item.get('last_updated', '')
+                if original not in normalized:
+                    normalized[original] = normalize_timestamp(original)
+                timestamp, epoch = normalized[original]
+                item['last_updated_epoch'] = epoch
+                if timestamp != original:
+                    item['last_updated'] = timestamp
+                    changed = True
+            if changed:
+                migrated.append(callsign)
+        if migrated:
+            self.save_cargo(migrated)
+    
+    def _has_newer_data(self, callsign: str, epoch: Optional[int]) -> bool:
+        """
+        Check if the stored cargo of a carrier is newer than an update.
+        
+        Args:
+            callsign: Fleet carrier callsign
+            epoch: Epoch seconds of the update
+            
+        Returns:
+            True if the update is older and must be skipped
+        """
+        if not self.cargo.get(callsign):
+            return False
+        # Get timestamp from any existing cargo item (they all have the same timestamp)
+        existing_epoch = next(iter(self.cargo[callsign].values())).get('last_updated_epoch')
+        if existing_epoch is None or epoch is None:
+            logger.debug(f"Could not compare timestamps for {callsign}. Proceeding with update.")
+            return False
+        return epoch < existing_epoch
     
     def load_cargo(self) -> None:
         """
-        Load cargo details from CSV file.
+        Load cargo details from the store, or from CSV file.
         """
+        if self.store is not None and self.store.is_migrated('cargo'):
+            for row in self.store.load_rows('cargo'):
+                if row['callsign'] and row['commodity']:
+                    self.cargo.setdefault(row['callsign'], {})[row['commodity']] = row
+            total_entries = sum(len(items) for items in self.cargo.values())
+            logger.info(f"Loaded cargo details for {len(self.cargo)} carrier(s), {total_entries} total commodities from database")
+            return
+        
         if not os.path.exists(self.cargo_file):
             logger.debug("No existing fleet carrier cargo file found")
             return
@@ -82,35 +147,56 @@ class CargoDetailsManager:
         except Exception:
             logger.warning('!! Error loading fleet carrier cargo: ' + traceback.format_exc(), exc_info=False)
     
-    def save_cargo(self) -> None:
+    def save_cargo(self, callsigns: Optional[Iterable[str]] = None) -> None:
         """
-        Save cargo details to CSV file.
+        Save cargo details to the store (if any) and the CSV file.
+        
+        Args:
+            callsigns: Carriers whose commodities changed; None for all. With a store only
+                       their rows are replaced, the CSV is always exported whole
+                       (in the background, see CsvExporter).
         """
-        try:
-            with open(self.cargo_file, 'w', encoding='utf-8', newline='') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=self.CSV_HEADERS)
-                writer.writeheader()
-                
-                # Flatten nested dict structure for CSV output
-                for callsign in sorted(self.cargo.keys()):
-                    for commodity in sorted(self.cargo[callsign].keys()):
-                        item = self.cargo[callsign][commodity]
-                        writer.writerow({
-                            'Callsign': item.get('callsign', ''),
-                            'Commodity': item.get('commodity', ''),
-                            'Localized Name': item.get('localized_name', ''),
-                            'Quantity': item.get('quantity', '0'),
-                            'Value Per Unit': item.get('value_per_unit', '0'),
-                            'Total Value': item.get('total_value', '0'),
-                            'Last Updated': item.get('last_updated', ''),
-                            'Source Galaxy': item.get('source_galaxy', '')
-                        })
-            
-            total_entries = sum(len(items) for items in self.cargo.values())
-            logger.debug(f"Saved cargo details for {len(self.cargo)} carrier(s), {total_entries} total commodities")
+        self.data_version += 1
+        if callsigns is not None:
+            callsigns = list(callsigns)
+        if self.change_listener is not None:
+            for callsign in (callsigns if callsigns is not None else [None]):
+                self.change_listener(callsign)
+        if self.store is not None:
+            callsigns = list(self.cargo.keys()) if callsigns is None else callsigns
+            try:
+                self.store.replace_items('cargo', {
+                    callsign: list(self.cargo.get(callsign, {}).values()) for callsign in callsigns
+                })
+                logger.debug(f"Saved cargo details for {', '.join(callsigns)} to database")
+            except Exception:
+                logger.warning('!! Error saving cargo details: ' + traceback.format_exc(), exc_info=False)
         
-        except Exception:
-            logger.warning('!! Error saving fleet carrier cargo: ' + traceback.format_exc(), exc_info=False)
+        # Exported in the background: one carrier's update does not wait for a rewrite of every carrier's rows
+        self._csv_exporter.schedule(self._csv_rows())
+    
+    def _csv_rows(self) -> List[Dict]:
+        """Snapshot the cargo details as CSV row dicts, sorted by callsign."""
+        rows = []
+        # Flatten nested dict structure for CSV output
+        for callsign in sorted(self.cargo.keys()):
+            for commodity in sorted(self.cargo[callsign].keys()):
+                item = self.cargo[callsign][commodity]
+                rows.append({
+                    'Callsign': item.get('callsign', ''),
+                    'Commodity': item.get('commodity', ''),
+                    'Localized Name': item.get('localized_name', ''),
+                    'Quantity': item.get('quantity', '0'),
+                    'Value Per Unit': item.get('value_per_unit', '0'),
+                    'Total Value': item.get('total_value', '0'),
+                    'Last Updated': item.get('last_updated', ''),
+                    'Source Galaxy': item.get('source_galaxy', '')
+                })
+        return rows
+    
+    def flush_csv(self) -> None:
+        """Write a CSV export still waiting for its quiet period (called at plugin stop)."""
+        self._csv_exporter.flush()
     
     def update_cargo_from_capi(self, callsign: str, cargo_array: List[Dict], source_galaxy: str, event_timestamp: Optional[str] = None) -> None:
         """
@@ -132,34 +218,23 @@ class CargoDetailsManager:
             # Get current timestamp - use event timestamp if provided, otherwise use current time
             if event_timestamp:
                 # Journal format: "2021-05-21T10:39:43Z"
-                timestamp = event_timestamp
+                timestamp, epoch = normalize_timestamp(event_timestamp)
             else:
                 # CAPI doesn't have timestamps, so use current time as best estimate
-                timestamp = datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%SZ')
+                timestamp, epoch = utc_now_timestamp()
             
-            # Check if we have existing cargo data and compare timestamps
-            if callsign in self.cargo and self.cargo[callsign]:
-                # Get timestamp from any existing cargo item (they all have the same timestamp)
-                existing_item = next(iter(self.cargo[callsign].values()))
-                existing_timestamp = existing_item.get('last_updated', '')
-                
-                # Compare timestamps - only update if new data is newer
-                try:
-                    existing_dt = datetime.strptime(existing_timestamp, '%Y-%m-%dT%H:%M:%SZ')
-                    new_dt = datetime.strptime(timestamp, '%Y-%m-%dT%H:%M:%SZ')
-                    
-                    if new_dt < existing_dt:
-                        logger.info(f"Skipping CAPI cargo update for {callsign} - existing data is newer (existing: {existing_timestamp}, new: {timestamp})")
-                        return
-                except (ValueError, TypeError) as e:
-                    logger.debug(f"Could not compare timestamps for {callsign}: {e}. Proceeding with update.")
+            # Check if we have existing cargo data and compare timestamps - only update if new data is newer
+            if self._has_newer_data(callsign, epoch):
+                existing_timestamp = next(iter(self.cargo[callsign].values())).get('last_updated', '')
+                logger.info(f"Skipping CAPI cargo update for {callsign} - existing data is newer (existing: {existing_timestamp}, new: {timestamp})")
+                return
             
             # Clear existing cargo for this carrier (replace, don't append)
             self.cargo[callsign] = {}
             
             if not isinstance(cargo_array, list):
                 logger.warning(f"Cargo array is not a list for carrier {callsign}")
-                self.save_cargo()
+                self.save_cargo([callsign])
                 return
             
             # Process each cargo item
@@ -192,13 +267,14 @@ class CargoDetailsManager:
                     'value_per_unit': str(value),
                     'total_value': str(total_value),
                     'last_updated': timestamp,
+                    'last_updated_epoch': epoch,
                     'source_galaxy': source_galaxy
                 }
             
             logger.info(f"Updated cargo details for carrier {callsign}: {len(self.cargo[callsign])} commodities (timestamp: {timestamp})")
             
             # Save to CSV
-            self.save_cargo()
+            self.save_cargo([callsign])
         
         except Exception:
             logger.warning(f'!! Error updating cargo from CAPI for {callsign}: ' + traceback.format_exc(), exc_info=False)
@@ -219,29 +295,19 @@ class CargoDetailsManager:
             return
         
         try:
-            # Check if we have existing cargo data and compare timestamps
-            if callsign in self.cargo and self.cargo[callsign]:
-                # Get timestamp from any existing cargo item (they all have the same timestamp)
-                existing_item = next(iter(self.cargo[callsign].values()))
-                existing_timestamp = existing_item.get('last_updated', '')
-                
-                # Compare timestamps - only update if new data is newer
-                try:
-                    existing_dt = datetime.strptime(existing_timestamp, '%Y-%m-%dT%H:%M:%SZ')
-                    new_dt = datetime.strptime(event_timestamp, '%Y-%m-%dT%H:%M:%SZ')
-                    
-                    if new_dt < existing_dt:
-                        logger.info(f"Skipping Journal cargo update for {callsign} - existing data is newer (existing: {existing_timestamp}, new: {event_timestamp})")
-                        return
-                except (ValueError, TypeError) as e:
-                    logger.debug(f"Could not compare timestamps for {callsign}: {e}. Proceeding with update.")
+            # Check if we have existing cargo data and compare timestamps - only update if new data is newer
+            event_timestamp, epoch = normalize_timestamp(event_timestamp)
+            if self._has_newer_data(callsign, epoch):
+                existing_timestamp = next(iter(self.cargo[callsign].values())).get('last_updated', '')
+                logger.info(f"Skipping Journal cargo update for {callsign} - existing data is newer (existing: {existing_timestamp}, new: {event_timestamp})")
+                return
             
             # Clear existing cargo for this carrier (replace, don't append)
             self.cargo[callsign] = {}
             
             if not isinstance(inventory, list):
                 logger.warning(f"Inventory is not a list for carrier {callsign}")
-                self.save_cargo()
+                self.save_cargo([callsign])
                 return
             
             # Process each cargo item
@@ -270,13 +336,14 @@ class CargoDetailsManager:
                     'value_per_unit': '0',  # Journal doesn't provide this
                     'total_value': '0',  # Can't calculate without value per unit
                     'last_updated': event_timestamp,
+                    'last_updated_epoch': epoch,
                     'source_galaxy': source_galaxy
                 }
             
             logger.info(f"Updated cargo details from journal for carrier {callsign}: {len(self.cargo[callsign])} commodities (timestamp: {event_timestamp})")
             
             # Save to CSV
-            self.save_cargo()
+            self.save_cargo([callsign])
         
         except Exception:
             logger.warning(f'!! Error updating cargo from journal for {callsign}: ' + traceback.format_exc(), exc_info=False)
@@ -329,7 +396,7 @@ class CargoDetailsManager:
         """
         if callsign in self.cargo:
             del self.cargo[callsign]
-            self.save_cargo()
+            self.save_cargo([callsign])
             logger.info(f"Cleared cargo details for carrier {callsign}")
             return True
         return False
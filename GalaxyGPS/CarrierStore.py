@@ -0,0 +1,218 @@
+import logging
+import os
+import threading
+import traceback
+from typing import Dict, Iterable, List, Optional
+
+from config import appname, config  # type: ignore
+
+try:
+    import sqlite3
+except ImportError:  # pragma: no cover - Python built without sqlite3
+    sqlite3 = None  # type: ignore
+
+# We need a name of plugin dir, not CarrierStore.py dir
+plugin_name = os.path.basename(os.path.dirname(os.path.dirname(__file__)))
+logger = logging.getLogger(f'{appname}.{plugin_name}')
+
+CARRIER_STORE_FILENAME = 'fleet_carriers.db'
+# EDMC config key; set to False to keep carrier data in the CSV files only
+CARRIER_STORE_CONFIG_KEY = 'galaxygps_carrier_store'
+
+# Table layout per entity: (key columns, data columns, extra indexes).
+# Columns are the keys of the managers' row dicts; all values are stored as text like the CSV files.
+CARRIER_STORE_TABLES = {
+    'carriers': (
+        ('callsign',),
+        ('name', 'current_system', 'system_address', 'fuel', 'balance', 'state', 'theme',
+         'docking_access', 'notorious_access', 'cargo_count', 'cargo_total_value', 'tritium_in_cargo',
+         'icy_rings', 'pristine', 'last_updated', 'source_galaxy', 'carrier_id'),
+        (('current_system',), ('carrier_id',)),
+    ),
+    'cargo': (
+        ('callsign', 'commodity'),
+        ('localized_name', 'quantity', 'value_per_unit', 'total_value', 'last_updated', 'source_galaxy'),
+        (('commodity',),),
+    ),
+    'ships': (
+        ('callsign', 'ship_id'),
+        ('ship_type', 'ship_name', 'star_system', 'ship_market_id', 'location_type', 'last_updated'),
+        (('ship_id',),),
+    ),
+    'modules': (
+        ('callsign', 'storage_slot'),
+        ('module_name', 'module_name_localized', 'buy_price', 'hot', 'star_system', 'market_id',
+         'engineered', 'engineer', 'level', 'quality', 'last_updated'),
+        (),
+    ),
+}
+
+
+class CarrierStore:
+    """
+    SQLite database holding fleet carriers, their cargo, stored ships and stored modules.
+
+    The source of truth for carrier data once a table is migrated: every entity has
+    its own table keyed by callsign (plus commodity / ship ID / storage slot), so a
+    change to one carrier is a small transaction. Each table is filled once from its
+    CSV file (see is_migrated / migrate); afterwards the managers load from the
+    database and keep exporting the CSV files on every save, for users and other
+    tools that read them.
+
+    The connection is shared by the Tk thread and the carrier write-behind worker,
+    so all access is serialised with a lock.
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Open (and create if needed) the database.
+
+        Args:
+            db_path: Path to the SQLite file
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)')
+            for table, (key_columns, data_columns, indexes) in CARRIER_STORE_TABLES.items():
+                self._create_table(table, key_columns, data_columns, indexes)
+
+    def _create_table(self, table: str, key_columns, data_columns, indexes) -> None:
+        columns = ', '.join(f'{column} TEXT' for column in key_columns + data_columns)
+        self._conn.execute(
+            f'CREATE TABLE IF NOT EXISTS {table} ({columns}, PRIMARY KEY ({", ".join(key_columns)}))'
+        )
+        # Columns added to the layout after the table was created
+        existing = {row['name'] for row in self._conn.execute(f'PRAGMA table_info({table})')}
+        for column in data_columns:
+            if column not in existing:
+                self._conn.execute(f'ALTER TABLE {table} ADD COLUMN {column} TEXT')
+        for index_columns in indexes:
+            self._conn.execute(
+                f'CREATE INDEX IF NOT EXISTS idx_{table}_{"_".join(index_columns)} '
+                f'ON {table} ({", ".join(index_columns)})'
+            )
+
+    @staticmethod
+    def _columns(table: str) -> tuple:
+        key_columns, data_columns, _indexes = CARRIER_STORE_TABLES[table]
+        return key_columns + data_columns
+
+    def _insert_rows(self, table: str, rows: Iterable[Dict]) -> None:
+        columns = self._columns(table)
+        self._conn.executemany(
+            f'INSERT OR REPLACE INTO {table} ({", ".join(columns)}) VALUES ({", ".join("?" * len(columns))})',
+            ([None if row.get(column) is None else str(row.get(column)) for column in columns] for row in rows)
+        )
+
+    def is_migrated(self, table: str) -> bool:
+        """
+        Check if a table has been filled from its CSV file.
+
+        Args:
+            table: Entity table name (carriers, cargo, ships, modules)
+
+        Returns:
+            True if the table is the source of truth for its entity
+        """
+        with self._lock:
+            row = self._conn.execute('SELECT value FROM meta WHERE key = ?', (f'migrated_{table}',)).fetchone()
+        return row is not None
+
+    def migrate(self, table: str, rows: List[Dict]) -> None:
+        """
+        Fill a table with the rows loaded from its CSV file, once.
+
+        Args:
+            table: Entity table name
+            rows: Row dicts loaded from the CSV file
+        """
+        with self._lock, self._conn:
+            self._conn.execute(f'DELETE FROM {table}')
+            self._insert_rows(table, rows)
+            self._conn.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', (f'migrated_{table}', '1'))
+        logger.info(f"Migrated {len(rows)} {table} row(s) from CSV to {os.path.basename(self.db_path)}")
+
+    def load_rows(self, table: str) -> List[Dict]:
+        """
+        Read every row of a table.
+
+        Args:
+            table: Entity table name
+
+        Returns:
+            List of row dicts keyed by column name ('' for NULL)
+        """
+        columns = self._columns(table)
+        with self._lock:
+            cursor = self._conn.execute(f'SELECT {", ".join(columns)} FROM {table}')
+            return [{column: (row[column] if row[column] is not None else '') for column in columns}
+                    for row in cursor]
+
+    def write_carriers(self, changes: Dict[str, Optional[Dict]]) -> None:
+        """
+        Upsert or delete carriers in one transaction.
+
+        Args:
+            changes: Dict of callsign -> carrier row dict, or None to delete the carrier
+        """
+        with self._lock, self._conn:
+            self._insert_rows('carriers', [row for row in changes.values() if row is not None])
+            deleted = [(callsign,) for callsign, row in changes.items() if row is None]
+            if deleted:
+                self._conn.executemany('DELETE FROM carriers WHERE callsign = ?', deleted)
+
+    def replace_items(self, table: str, rows_by_callsign: Dict[str, List[Dict]]) -> None:
+        """
+        Replace the cargo, ships or modules of some carriers in one transaction.
+
+        Rows of carriers not in rows_by_callsign are left alone.
+
+        Args:
+            table: 'cargo', 'ships' or 'modules'
+            rows_by_callsign: Dict of callsign -> complete new list of row dicts (empty to clear)
+        """
+        with self._lock, self._conn:
+            for callsign, rows in rows_by_callsign.items():
+                self._conn.execute(f'DELETE FROM {table} WHERE callsign = ?', (callsign,))
+                self._insert_rows(table, rows)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            try:
+                self._conn.close()
+            except Exception:
+                logger.warning('!! Error closing carrier store: ' + traceback.format_exc(), exc_info=False)
+
+
+def open_carrier_store(plugin_dir: str) -> Optional[CarrierStore]:
+    """
+    Open the carrier database in the plugin directory.
+
+    Args:
+        plugin_dir: Directory where the plugin is installed
+
+    Returns:
+        CarrierStore, or None if the store is switched off (CARRIER_STORE_CONFIG_KEY), SQLite
+        is unavailable or the database cannot be opened (the managers then keep using their CSV files)
+    """
+    try:
+        enabled = config.get_bool(CARRIER_STORE_CONFIG_KEY, default=True)
+    except Exception:
+        enabled = True
+    if not enabled:
+        logger.info("Carrier database switched off, fleet carrier data is stored in CSV files")
+        return None
+    if sqlite3 is None:
+        logger.info("sqlite3 not available, fleet carrier data is stored in CSV files")
+        return None
+    try:
+        return CarrierStore(os.path.join(plugin_dir, CARRIER_STORE_FILENAME))
+    except Exception:
+        logger.warning('!! Error opening carrier store, using CSV files: ' + traceback.format_exc(), exc_info=False)
+        return None
@@ -0,0 +1,99 @@
+import csv
+import logging
+import os
+import threading
+import time
+import traceback
+from typing import Dict, List, Optional
+
+from config import appname  # type: ignore
+
+from .file_helpers import atomic_open
+
+# We need a name of plugin dir, not CsvExporter.py dir
+plugin_name = os.path.basename(os.path.dirname(os.path.dirname(__file__)))
+logger = logging.getLogger(f'{appname}.{plugin_name}')
+
+# Quiet period after the last change before a CSV file is written (coalesces event bursts)
+CSV_EXPORT_DELAY_S = 2.0
+
+
+class CsvExporter:
+    """
+    Write-behind writer of one CSV file, for the cargo, ships and modules managers.
+
+    schedule() takes a snapshot of the rows and returns; a background writer, started
+    on first use, writes the latest snapshot atomically once no newer one arrived for
+    the delay, so bursts of updates produce a single write off the Tk thread.
+    flush() writes any pending snapshot immediately (plugin shutdown).
+    """
+
+    def __init__(self, path: str, fieldnames: List[str], delay: float = CSV_EXPORT_DELAY_S):
+        """
+        Args:
+            path: CSV file to write
+            fieldnames: Column headers, in order
+            delay: Quiet period in seconds before a snapshot is written
+        """
+        self.path = path
+        self.fieldnames = fieldnames
+        self.delay = delay
+        self._pending_rows: Optional[List[Dict]] = None
+        self._save_due = 0.0
+        self._save_cond = threading.Condition()
+        self._write_lock = threading.Lock()  # Keeps snapshots written in order
+        self._writer = None
+
+    def schedule(self, rows: List[Dict]) -> None:
+        """
+        Schedule writing the file, replacing any snapshot not written yet.
+
+        Args:
+            rows: Complete list of row dicts keyed by column header (not modified afterwards)
+        """
+        with self._save_cond:
+            self._pending_rows = rows
+            self._save_due = time.monotonic() + self.delay
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._save_worker, name=f"CsvExport {os.path.basename(self.path)}", daemon=True
+                )
+                self._writer.start()
+            self._save_cond.notify()
+
+    def flush(self) -> None:
+        """Write the pending snapshot now, if any."""
+        self._write_pending_rows()
+
+    def _save_worker(self) -> None:
+        """Worker: write the latest snapshot once changes have been quiet for the delay."""
+        while True:
+            with self._save_cond:
+                # A newer snapshot pushes the due time back, restarting the wait
+                while True:
+                    if self._pending_rows is None:
+                        self._save_cond.wait()
+                        continue
+                    remaining = self._save_due - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._save_cond.wait(remaining)
+            self._write_pending_rows()
+
+    def _write_pending_rows(self) -> None:
+        """Take the pending snapshot, if any, and write it atomically."""
+        with self._write_lock:
+            with self._save_cond:
+                rows = self._pending_rows
+                self._pending_rows = None
+            if rows is None:
+                return
+            try:
+                with atomic_open(self.path, 'w', encoding='utf-8', newline='') as csvfile:
+                    writer = csv.DictWriter(csvfile, fieldnames=self.fieldnames)
+                    writer.writeheader()
+                    writer.writerows(rows)
+                logger.debug(f"Saved {len(rows)} row(s) to {os.path.basename(self.path)}")
+            except Exception:
+                logger.warning(f'!! Error writing {os.path.basename(self.path)}: ' + traceback.format_exc(),
+                               exc_info=False)
@@ -2,20 +2,37 @@ import csv
 import logging
 import os
 import re
+import threading
+import time
 import traceback
-from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
 from config import appname  # type: ignore
 
+from .file_helpers import atomic_open
+from .timestamps import normalize_timestamp, utc_now_timestamp
+
 # We need a name of plugin dir, not FleetCarrierManager.py dir
 plugin_name = os.path.basename(os.path.dirname(os.path.dirname(__file__)))
 logger = logging.getLogger(f'{appname}.{plugin_name}')
 
+# Fleet carrier callsign inside a station name (e.g. "FC A1A-A1A")
+CALLSIGN_PATTERN = re.compile(r'([A-Z0-9]+-[A-Z0-9]+)')
+# Station names whose extracted callsign is remembered
+STATION_CALLSIGN_CACHE_SIZE = 256
+
+# Quiet period after the last change before the carriers CSV is written (coalesces event bursts)
+CARRIERS_SAVE_DELAY_S = 2.0
+
 
 class FleetCarrierManager:
     """
-    Manages fleet carrier data from CAPI, storing it in CSV format.
+    Manages fleet carrier data from CAPI, storing it in CSV format, or in the
+    SQLite CarrierStore when one is given.
+
+    Writes are deferred: save_carriers snapshots the changed data and a background
+    writer saves it once no further change arrived for CARRIERS_SAVE_DELAY_S.
+    flush_carriers writes any pending snapshot immediately (plugin shutdown).
     """
     
     # CSV column headers
@@ -36,27 +53,182 @@ class FleetCarrierManager:
         'Icy Rings',
         'Pristine',
         'Last Updated',
-        'Source Galaxy'
+        'Source Galaxy',
+        'Carrier ID'
     ]
     
-    def __init__(self, plugin_dir: str):
+    def __init__(self, plugin_dir: str, store=None):
         """
         Initialize the FleetCarrierManager.
         
         Args:
             plugin_dir: Directory where the plugin is installed
+            store: Optional CarrierStore holding the carriers; the CSV file is then
+                   still exported on every save for other tools
         """
         self.plugin_dir = plugin_dir
         self.carriers_file = os.path.join(plugin_dir, 'fleet_carriers.csv')
         self.carriers: Dict[str, Dict] = {}  # Keyed by callsign
+        self.store = store
+        self.data_version = 0  # Bumped on every change to self.carriers (see save_carriers)
+        # Called with the changed or removed callsign (None for all) after every change
+        self.change_listener: Optional[Callable[[Optional[str]], None]] = None
+        
+        # Secondary indexes, kept in step with self.carriers by _reindex_carrier (see save_carriers)
+        self._by_system: Dict[str, set] = {}  # Lowercase system name -> callsigns
+        self._by_carrier_id: Dict[str, str] = {}  # CarrierID (the carrier's MarketID) -> callsign
+        self._indexed: Dict[str, tuple] = {}  # Callsign -> (system key, carrier ID) it is indexed under
+        self._most_recent: Optional[str] = None  # Callsign with the newest last_updated
+        self._station_callsigns: Dict[str, Optional[str]] = {}  # Station name -> callsign pattern found in it
+        
+        # Write-behind state: latest unsaved CSV rows, changed carriers for the store, and when to write them
+        self._pending_rows: Optional[List[Dict]] = None
+        self._pending_changes: Dict[str, Optional[Dict]] = {}
+        self._save_due = 0.0
+        self._save_cond = threading.Condition()
+        self._write_lock = threading.Lock()  # Keeps snapshots written in order
+        self._writer = None
         
         # Load existing carrier data
         self.load_carriers()
+        if self.store is not None and not self.store.is_migrated('carriers'):
+            # First start with the store: carry over the CSV data
+            self.store.migrate('carriers', list(self.carriers.values()))
+        self._normalize_loaded_timestamps()
+        self._rebuild_indexes()
+    
+    def _normalize_loaded_timestamps(self) -> None:
+        """
+        Cache the epoch of every carrier's last_updated, and rewrite legacy
+        '%Y-%m-%d %H:%M:%S UTC' values as ISO 8601 once, so freshness checks never parse strings.
+        """
+        migrated = []
+        for callsign, carrier in self.carriers.items():
+            timestamp, epoch = normalize_timestamp(carrier.get('last_updated', ''))
+            carrier['last_updated_epoch'] = epoch
+            if timestamp != carrier.get('last_updated', ''):
+                carrier['last_updated'] = timestamp
+                migrated.append(callsign)
+        for callsign in migrated:
+            self.save_carriers(callsign)
+        if migrated:
+            logger.info(f"Migrated last updated timestamps of {len(migrated)} fleet carrier(s) to ISO 8601")
+    
+    def _set_last_updated(self, callsign: str, timestamp: str, epoch: Optional[int]) -> None:
+        """
+        Set a carrier's last update time.
+        
+        Args:
+            callsign: Fleet carrier callsign
+            timestamp: ISO 8601 timestamp
+            epoch: The same time in epoch seconds (None if it could not be parsed)
+        """
+        self.carriers[callsign]['last_updated'] = timestamp
+        self.carriers[callsign]['last_updated_epoch'] = epoch
+    
+    def _has_newer_data(self, callsign: str, epoch: Optional[int]) -> bool:
+        """
+        Check if the stored data of a carrier is newer than an update.
+        
+        Args:
+            callsign: Fleet carrier callsign
+            epoch: Epoch seconds of the update
+            
+        Returns:
+            True if the update is older and must be skipped; False if it is newer or
+            either time is unknown (update proceeds)
+        """
+        existing_epoch = self.carriers[callsign].get('last_updated_epoch')
+        if existing_epoch is None or epoch is None:
+            logger.debug(f"Could not compare timestamps for {callsign}. Proceeding with update.")
+            return False
+        return epoch < existing_epoch
+    
+    def _rebuild_indexes(self) -> None:
+        """Rebuild all secondary indexes from self.carriers."""
+        self._by_system = {}
+        self._by_carrier_id = {}
+        self._indexed = {}
+        self._most_recent = None
+        for callsign in self.carriers:
+            self._reindex_carrier(callsign)
+    
+    @staticmethod
+    def _recency(carrier: Dict) -> int:
+        epoch = carrier.get('last_updated_epoch')
+        return epoch if epoch is not None else -1
+    
+    def _reindex_carrier(self, callsign: str) -> None:
+        """
+        Update the secondary indexes after a carrier was added, changed or removed.
+        
+        Args:
+            callsign: Fleet carrier callsign
+        """
+        old_system_key, old_carrier_id = self._indexed.pop(callsign, (None, None))
+        if old_system_key is not None:
+            callsigns = self._by_system.get(old_system_key)
+            if callsigns is not None:
+                callsigns.discard(callsign)
+                if not callsigns:
+                    del self._by_system[old_system_key]
+        if old_carrier_id is not None and self._by_carrier_id.get(old_carrier_id) == callsign:
+            del self._by_carrier_id[old_carrier_id]
+        
+        carrier = self.carriers.get(callsign)
+        if carrier is None:
+            if self._most_recent == callsign:
+                # Removed the newest carrier: find the next one
+                self._most_recent = max(self.carriers, key=lambda c: self._recency(self.carriers[c]), default=None)
+            return
+        
+        system_key = (carrier.get('current_system') or '').lower()
+        carrier_id = str(carrier.get('carrier_id') or '')
+        self._by_system.setdefault(system_key, set()).add(callsign)
+        if carrier_id:
+            self._by_carrier_id[carrier_id] = callsign
+        self._indexed[callsign] = (system_key, carrier_id or None)
+        
+        # last_updated only moves forward, so the newest carrier can only be replaced by the one just written
+        if (self._most_recent is None or self._most_recent not in self.carriers
+                or self._recency(carrier) >= self._recency(self.carriers[self._most_recent])):
+            self._most_recent = callsign
+    
+    def _callsign_from_station(self, station_name: str) -> Optional[str]:
+        """
+        Get the known carrier whose callsign appears in a station name.
+        
+        Args:
+            station_name: Station name (e.g. "FC A1A-A1A")
+            
+        Returns:
+            Callsign if it belongs to a known carrier, None otherwise
+        """
+        if not station_name:
+            return None
+        if station_name in self._station_callsigns:
+            potential_callsign = self._station_callsigns[station_name]
+        else:
+            callsign_match = CALLSIGN_PATTERN.search(station_name.upper())
+            potential_callsign = callsign_match.group(1) if callsign_match else None
+            if len(self._station_callsigns) >= STATION_CALLSIGN_CACHE_SIZE:
+                self._station_callsigns.clear()
+            self._station_callsigns[station_name] = potential_callsign
+        if potential_callsign and potential_callsign in self.carriers:
+            return potential_callsign
+        return None
     
     def load_carriers(self) -> None:
         """
-        Load fleet carrier data from CSV file.
+        Load fleet carrier data from the store, or from CSV file.
         """
+        if self.store is not None and self.store.is_migrated('carriers'):
+            for row in self.store.load_rows('carriers'):
+                if row['callsign']:
+                    self.carriers[row['callsign']] = row
+            logger.info(f"Loaded {len(self.carriers)} fleet carrier(s) from database")
+            return
+        
         if not os.path.exists(self.carriers_file):
             logger.debug("No existing fleet carriers file found")
             return
@@ -96,7 +268,8 @@ class FleetCarrierManager:
                             'icy_rings': get_field(row, 'Icy Rings', ''),
                             'pristine': get_field(row, 'Pristine', ''),
                             'last_updated': get_field(row, 'Last Updated', ''),
-                            'source_galaxy': get_field(row, 'Source Galaxy', '')
+                            'source_galaxy': get_field(row, 'Source Galaxy', ''),
+                            'carrier_id': get_field(row, 'Carrier ID', '')
                         }
             
             logger.info(f"Loaded {len(self.carriers)} fleet carrier(s) from CSV")
@@ -104,40 +277,116 @@ class FleetCarrierManager:
         except Exception:
             logger.warning('!! Error loading fleet carriers: ' + traceback.format_exc(), exc_info=False)
     
-    def save_carriers(self) -> None:
+    def _carrier_rows(self) -> List[Dict]:
         """
-        Save fleet carrier data to CSV file.
+        Build the CSV rows of all carriers.
+        
+        Returns:
+            List of row dicts keyed by CSV_HEADERS, sorted by callsign
         """
-        try:
-            with open(self.carriers_file, 'w', encoding='utf-8', newline='') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=self.CSV_HEADERS)
-                writer.writeheader()
-                
-                for carrier in sorted(self.carriers.values(), key=lambda x: x.get('callsign', '')):
-                    writer.writerow({
-                        'Callsign': carrier.get('callsign', ''),
-                        'Name': carrier.get('name', ''),
-                        'Current System': carrier.get('current_system', ''),
-                        'System Address': carrier.get('system_address', ''),
-                        'Fuel (Tritium)': carrier.get('fuel', '0'),
-                        'Balance': carrier.get('balance', '0'),
-                        'State': carrier.get('state', ''),
-                        'Theme': carrier.get('theme', ''),
-                        'Docking Access': carrier.get('docking_access', ''),
-                        'Notorious Access': carrier.get('notorious_access', ''),
-                        'Cargo Count': carrier.get('cargo_count', '0'),
-                        'Cargo Total Value': carrier.get('cargo_total_value', '0'),
-                        'Tritium in Cargo': carrier.get('tritium_in_cargo', '0'),
-                        'Icy Rings': carrier.get('icy_rings', ''),
-                        'Pristine': carrier.get('pristine', ''),
-                        'Last Updated': carrier.get('last_updated', ''),
-                        'Source Galaxy': carrier.get('source_galaxy', '')
-                    })
-            
-            logger.debug(f"Saved {len(self.carriers)} fleet carrier(s) to CSV")
+        rows = []
+        for carrier in sorted(self.carriers.values(), key=lambda x: x.get('callsign', '')):
+            rows.append({
+                'Callsign': carrier.get('callsign', ''),
+                'Name': carrier.get('name', ''),
+                'Current System': carrier.get('current_system', ''),
+                'System Address': carrier.get('system_address', ''),
+                'Fuel (Tritium)': carrier.get('fuel', '0'),
+                'Balance': carrier.get('balance', '0'),
+                'State': carrier.get('state', ''),
+                'Theme': carrier.get('theme', ''),
+                'Docking Access': carrier.get('docking_access', ''),
+                'Notorious Access': carrier.get('notorious_access', ''),
+                'Cargo Count': carrier.get('cargo_count', '0'),
+                'Cargo Total Value': carrier.get('cargo_total_value', '0'),
+                'Tritium in Cargo': carrier.get('tritium_in_cargo', '0'),
+                'Icy Rings': carrier.get('icy_rings', ''),
+                'Pristine': carrier.get('pristine', ''),
+                'Last Updated': carrier.get('last_updated', ''),
+                'Source Galaxy': carrier.get('source_galaxy', ''),
+                'Carrier ID': carrier.get('carrier_id', '')
+            })
+        return rows
+    
+    def save_carriers(self, callsign: Optional[str] = None) -> None:
+        """
+        Schedule saving fleet carrier data to the store (if any) and the CSV file.
         
-        except Exception:
-            logger.warning('!! Error saving fleet carriers: ' + traceback.format_exc(), exc_info=False)
+        Snapshots the current data and returns; the background writer saves it after
+        the quiet period, so bursts of updates produce a single write.
+        
+        Args:
+            callsign: Carrier that changed or was removed; None for all carriers.
+                      With a store only these rows are written, the CSV is always written whole.
+        """
+        # Every change to a carrier ends here, so this is where the lookup indexes follow it
+        self.data_version += 1
+        if callsign:
+            self._reindex_carrier(callsign)
+        else:
+            self._rebuild_indexes()
+        with self._save_cond:
+            if self.store is not None:
+                for changed in ([callsign] if callsign else list(self.carriers.keys())):
+                    carrier = self.carriers.get(changed)
+                    self._pending_changes[changed] = dict(carrier) if carrier is not None else None
+            # The CSV is exported with a store too, so tools reading it do not go stale
+            self._pending_rows = self._carrier_rows()
+            self._save_due = time.monotonic() + CARRIERS_SAVE_DELAY_S
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._save_worker, name="FleetCarrierSave", daemon=True)
+                self._writer.start()
+            self._save_cond.notify()
+        if self.change_listener is not None:
+            self.change_listener(callsign)
+    
+    def flush_carriers(self) -> None:
+        """
+        Write pending fleet carrier data now (called at plugin stop).
+        """
+        self._write_pending_rows()
+    
+    def _save_worker(self) -> None:
+        """Worker: write the latest snapshot once changes have been quiet for the delay."""
+        while True:
+            with self._save_cond:
+                # A newer snapshot pushes the due time back, restarting the wait
+                while True:
+                    if self._pending_rows is None and not self._pending_changes:
+                        self._save_cond.wait()
+                        continue
+                    remaining = self._save_due - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._save_cond.wait(remaining)
+            self._write_pending_rows()
+    
+    def _write_pending_rows(self) -> None:
+        """Take the pending snapshot, if any, and write it atomically."""
+        with self._write_lock:
+            with self._save_cond:
+                rows = self._pending_rows
+                self._pending_rows = None
+                changes = self._pending_changes
+                self._pending_changes = {}
+            if changes:
+                try:
+                    self.store.write_carriers(changes)
+                    logger.debug(f"Saved {len(changes)} fleet carrier(s) to database")
+                except Exception:
+                    logger.warning('!! Error saving fleet carriers: ' + traceback.format_exc(), exc_info=False)
+            if rows is None:
+                return
+            try:
+                with atomic_open(self.carriers_file, 'w', encoding='utf-8', newline='') as csvfile:
+                    writer = csv.DictWriter(csvfile, fieldnames=self.CSV_HEADERS)
+                    writer.writeheader()
+                    writer.writerows(rows)
+                
+                logger.debug(f"Saved {len(rows)} fleet carrier(s) to CSV")
+            
+            except Exception:
+                logger.warning('!! Error saving fleet carriers: ' + traceback.format_exc(), exc_info=False)
     
     def update_carrier_from_capi(self, data, source_galaxy: str, event_timestamp: Optional[str] = None) -> None:
         """
@@ -168,31 +417,16 @@ class FleetCarrierManager:
             
             # Get timestamp - use event timestamp if provided, otherwise use current time
             if event_timestamp:
-                timestamp = event_timestamp
+                timestamp, epoch = normalize_timestamp(event_timestamp)
             else:
                 # CAPI doesn't have timestamps, so use current time as best estimate
-                timestamp = datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%SZ')
+                timestamp, epoch = utc_now_timestamp()
             
-            # Check if we have existing carrier data and compare timestamps
-            if callsign in self.carriers:
+            # Check if we have existing carrier data and compare timestamps - only update if new data is newer
+            if callsign in self.carriers and self._has_newer_data(callsign, epoch):
                 existing_timestamp = self.carriers[callsign].get('last_updated', '')
-                
-                # Compare timestamps - only update if new data is newer
-                try:
-                    # Try new format first (ISO 8601)
-                    try:
-                        existing_dt = datetime.strptime(existing_timestamp, '%Y-%m-%dT%H:%M:%SZ')
-                    except ValueError:
-                        # Fall back to old format for backward compatibility
-                        existing_dt = datetime.strptime(existing_timestamp, '%Y-%m-%d %H:%M:%S UTC')
-                    
-                    new_dt = datetime.strptime(timestamp, '%Y-%m-%dT%H:%M:%SZ')
-                    
-                    if new_dt < existing_dt:
-                        logger.info(f"Skipping CAPI carrier update for {callsign} - existing data is newer (existing: {existing_timestamp}, new: {timestamp})")
-                        return
-                except (ValueError, TypeError) as e:
-                    logger.debug(f"Could not compare timestamps for {callsign}: {e}. Proceeding with update.")
+                logger.info(f"Skipping CAPI carrier update for {callsign} - existing data is newer (existing: {existing_timestamp}, new: {timestamp})")
+                return
             
             # Get current system - can be a string or dict
             current_star_system = carrier_data.get('currentStarSystem', '')
@@ -274,6 +508,11 @@ class FleetCarrierManager:
             icy_rings = existing_carrier.get('icy_rings', '')
             pristine = existing_carrier.get('pristine', '')
             
+            # The carrier's MarketID, which journal events call CarrierID
+            market_info = carrier_data.get('market', {})
+            carrier_id = market_info.get('id', '') if isinstance(market_info, dict) else ''
+            carrier_id = str(carrier_id) if carrier_id else existing_carrier.get('carrier_id', '')
+            
             # Update carrier record
             self.carriers[callsign] = {
                 'callsign': callsign,
@@ -292,13 +531,15 @@ class FleetCarrierManager:
                 'icy_rings': icy_rings,  # Preserve existing or empty string
                 'pristine': pristine,  # Preserve existing or empty string
                 'last_updated': timestamp,
-                'source_galaxy': source_galaxy
+                'last_updated_epoch': epoch,
+                'source_galaxy': source_galaxy,
+                'carrier_id': carrier_id
             }
             
             logger.info(f"Updated fleet carrier {callsign} ({carrier_name}) in {current_system} (timestamp: {timestamp})")
             
             # Save to CSV
-            self.save_carriers()
+            self.save_carriers(callsign)
         
         except Exception:
             logger.warning('!! Error updating fleet carrier from CAPI: ' + traceback.format_exc(), exc_info=False)
@@ -334,10 +575,8 @@ class FleetCarrierManager:
         Returns:
             List of carrier dictionaries in that system
         """
-        return [
-            carrier for carrier in self.carriers.values()
-            if carrier.get('current_system', '').lower() == system_name.lower()
-        ]
+        callsigns = self._by_system.get((system_name or '').lower(), ())
+        return [self.carriers[callsign] for callsign in callsigns if callsign in self.carriers]
     
     def get_carrier_cargo_details(self, callsign: str) -> List[Dict]:
         """
@@ -366,7 +605,7 @@ class FleetCarrierManager:
         """
         if callsign in self.carriers:
             del self.carriers[callsign]
-            self.save_carriers()
+            self.save_carriers(callsign)
             logger.info(f"Removed fleet carrier {callsign}")
             return True
         return False
@@ -409,62 +648,34 @@ class FleetCarrierManager:
         Returns:
             Carrier callsign if found, None otherwise
         """
-        # Method 1: Check if event has MarketID and match by station name pattern
-        # Fleet carrier station names often contain the callsign
-        
-        # Method 2: If Location event and docked at fleet carrier
-        # Method 3: Use CarrierID if stored from CAPI
-        
-        # For now, use most recently updated carrier as fallback
-        # This works well if you only have one carrier
-        
-        # Check if we can extract callsign from station name
+        # Callsign in the event's station name (e.g. "FC A1A-A1A")
         station_name = event_data.get('StationName', '')
         if station_name and 'FC' in station_name.upper():
-            # Try to extract callsign pattern (e.g., "A1A-A1A" or "FC A1A-A1A")
-            callsign_match = re.search(r'([A-Z0-9]+-[A-Z0-9]+)', station_name.upper())
-            if callsign_match:
-                potential_callsign = callsign_match.group(1)
-                if potential_callsign in self.carriers:
-                    return potential_callsign
-        
-        # Check CarrierID if available
-        carrier_id = event_data.get('CarrierID')
-        if carrier_id:
-            # We'd need to store CarrierID from CAPI to match this
-            # For now, skip this method
-            pass
+            callsign = self._callsign_from_station(station_name)
+            if callsign:
+                return callsign
+        
+        # CarrierID (carrier events) or MarketID (docked at the carrier)
+        for id_field in ('CarrierID', 'MarketID'):
+            carrier_id = event_data.get(id_field)
+            if carrier_id:
+                callsign = self._by_carrier_id.get(str(carrier_id))
+                if callsign and callsign in self.carriers:
+                    return callsign
         
         # Use state data if available (Location/Cargo events)
         if state:
-            station_name_from_state = state.get('StationName', '')
             station_type = state.get('StationType', '')
             if station_type and 'fleetcarrier' in station_type.lower():
-                # Try to extract callsign from station name
-                if station_name_from_state:
-                    callsign_match = re.search(r'([A-Z0-9]+-[A-Z0-9]+)', station_name_from_state.upper())
-                    if callsign_match:
-                        potential_callsign = callsign_match.group(1)
-                        if potential_callsign in self.carriers:
-                            return potential_callsign
-                # Also check event_data for station name
-                if station_name:
-                    callsign_match = re.search(r'([A-Z0-9]+-[A-Z0-9]+)', station_name.upper())
-                    if callsign_match:
-                        potential_callsign = callsign_match.group(1)
-                        if potential_callsign in self.carriers:
-                            return potential_callsign
+                # Try to extract callsign from station name, then from the event's
+                callsign = (self._callsign_from_station(state.get('StationName', ''))
+                            or self._callsign_from_station(station_name))
+                if callsign:
+                    return callsign
         
         # Fallback: return most recently updated carrier
-        if self.carriers:
-            sorted_carriers = sorted(
-                self.carriers.values(),
-                key=lambda x: x.get('last_updated', ''),
-                reverse=True
-            )
-            return sorted_carriers[0].get('callsign', '')
-        
-        return None
+        # This works well if you only have one carrier
+        return self._most_recent
     
     def update_carrier_from_journal(self, event_name: str, event_data: Dict, state: Optional[Dict] = None, source_galaxy: str = 'Live') -> bool:
         """
@@ -481,11 +692,13 @@ class FleetCarrierManager:
         Returns:
             True if carrier was updated, False if not found or event not supported
         """
-        # Get event timestamp (all journal events have this)
+        # Get event timestamp (all journal events have this), parsed once for all comparisons below
         event_timestamp = event_data.get('timestamp', '')
-        if not event_timestamp:
+        if event_timestamp:
+            event_timestamp, event_epoch = normalize_timestamp(event_timestamp)
+        else:
             # If no timestamp, use current time (shouldn't happen)
-            event_timestamp = datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%SZ')
+            event_timestamp, event_epoch = utc_now_timestamp()
         
         # Special handling for CarrierStats - this event ONLY fires for carriers you own
         # So we can bootstrap the carrier data even without CAPI
@@ -514,28 +727,16 @@ class FleetCarrierManager:
                         'icy_rings': 'False',
                         'pristine': 'False',
                         'last_updated': event_timestamp,
-                        'source_galaxy': source_galaxy
+                        'last_updated_epoch': event_epoch,
+                        'source_galaxy': source_galaxy,
+                        'carrier_id': str(event_data.get('CarrierID', '') or '')
                     }
                 
                 # Check timestamp before updating existing carrier
-                if callsign in self.carriers:
+                if callsign in self.carriers and self._has_newer_data(callsign, event_epoch):
                     existing_timestamp = self.carriers[callsign].get('last_updated', '')
-                    
-                    try:
-                        # Try new format first (ISO 8601)
-                        try:
-                            existing_dt = datetime.strptime(existing_timestamp, '%Y-%m-%dT%H:%M:%SZ')
-                        except ValueError:
-                            # Fall back to old format for backward compatibility
-                            existing_dt = datetime.strptime(existing_timestamp, '%Y-%m-%d %H:%M:%S UTC')
-                        
-                        new_dt = datetime.strptime(event_timestamp, '%Y-%m-%dT%H:%M:%SZ')
-                        
-                        if new_dt < existing_dt:
-                            logger.debug(f"Skipping Journal carrier update for {callsign} - existing data is newer (existing: {existing_timestamp}, new: {event_timestamp})")
-                            return False
-                    except (ValueError, TypeError) as e:
-                        logger.debug(f"Could not compare timestamps for {callsign}: {e}. Proceeding with update.")
+                    logger.debug(f"Skipping Journal carrier update for {callsign} - existing data is newer (existing: {existing_timestamp}, new: {event_timestamp})")
+                    return False
                 
                 # Now update with CarrierStats data
                 updated = False
@@ -550,6 +751,11 @@ class FleetCarrierManager:
                     self.carriers[callsign]['balance'] = str(carrier_balance)
                     updated = True
                 
+                carrier_id = event_data.get('CarrierID')
+                if carrier_id and self.carriers[callsign].get('carrier_id') != str(carrier_id):
+                    self.carriers[callsign]['carrier_id'] = str(carrier_id)
+                    updated = True
+                
                 # Update cargo from SpaceUsage
                 space_usage = event_data.get('SpaceUsage', {})
                 if isinstance(space_usage, dict):
@@ -561,8 +767,8 @@ class FleetCarrierManager:
                         updated = True
                 
                 if updated:
-                    self.carriers[callsign]['last_updated'] = event_timestamp
-                    self.save_carriers()
+                    self._set_last_updated(callsign, event_timestamp, event_epoch)
+                    self.save_carriers(callsign)
                     logger.info(f"Updated carrier {callsign} stats from CarrierStats (timestamp: {event_timestamp})")
                 
                 return updated
@@ -574,23 +780,10 @@ class FleetCarrierManager:
             return False
         
         # Check timestamp before updating
-        existing_timestamp = self.carriers[callsign].get('last_updated', '')
-        
-        try:
-            # Try new format first (ISO 8601)
-            try:
-                existing_dt = datetime.strptime(existing_timestamp, '%Y-%m-%dT%H:%M:%SZ')
-            except ValueError:
-                # Fall back to old format for backward compatibility
-                existing_dt = datetime.strptime(existing_timestamp, '%Y-%m-%d %H:%M:%S UTC')
-            
-            new_dt = datetime.strptime(event_timestamp, '%Y-%m-%dT%H:%M:%SZ')
-            
-            if new_dt < existing_dt:
-                logger.debug(f"Skipping Journal event {event_name} for {callsign} - existing data is newer (existing: {existing_timestamp}, new: {event_timestamp})")
-                return False
-        except (ValueError, TypeError) as e:
-            logger.debug(f"Could not compare timestamps for {callsign}: {e}. Proceeding with update.")
+        if self._has_newer_data(callsign, event_epoch):
+            existing_timestamp = self.carriers[callsign].get('last_updated', '')
+            logger.debug(f"Skipping Journal event {event_name} for {callsign} - existing data is newer (existing: {existing_timestamp}, new: {event_timestamp})")
+            return False
         
         updated = False
         
@@ -608,7 +801,7 @@ class FleetCarrierManager:
                     # Clear rings status when system changes (will need to be re-queried)
                     self.carriers[callsign]['icy_rings'] = ''
                     self.carriers[callsign]['pristine'] = ''
-                    self.carriers[callsign]['last_updated'] = event_timestamp
+                    self._set_last_updated(callsign, event_timestamp, event_epoch)
                     updated = True
                     logger.info(f"Updated carrier {callsign} location from CarrierJump: {old_system} -> {new_system} (rings status cleared, timestamp: {event_timestamp})")
             
@@ -618,7 +811,7 @@ class FleetCarrierManager:
                 if total_fuel is not None:
                     old_fuel = self.carriers[callsign].get('fuel', '0')
                     self.carriers[callsign]['fuel'] = str(total_fuel)
-                    self.carriers[callsign]['last_updated'] = event_timestamp
+                    self._set_last_updated(callsign, event_timestamp, event_epoch)
                     updated = True
                     logger.info(f"Updated carrier {callsign} fuel from CarrierDepositFuel: {old_fuel} -> {total_fuel} (timestamp: {event_timestamp})")
             
@@ -648,7 +841,7 @@ class FleetCarrierManager:
                         updated = True
                 
                 if updated:
-                    self.carriers[callsign]['last_updated'] = event_timestamp
+                    self._set_last_updated(callsign, event_timestamp, event_epoch)
                     logger.info(f"Updated carrier {callsign} stats from CarrierStats (timestamp: {event_timestamp})")
             
             elif event_name == 'Cargo':
@@ -683,13 +876,13 @@ class FleetCarrierManager:
                     self.carriers[callsign]['cargo_count'] = str(cargo_count)
                     self.carriers[callsign]['cargo_total_value'] = str(cargo_value)
                     self.carriers[callsign]['tritium_in_cargo'] = str(tritium_in_cargo)
-                    self.carriers[callsign]['last_updated'] = event_timestamp
+                    self._set_last_updated(callsign, event_timestamp, event_epoch)
                     updated = True
                     logger.info(f"Updated carrier {callsign} cargo from Cargo event: {cargo_count} items, {cargo_value} cr, Tritium: {tritium_in_cargo} (timestamp: {event_timestamp})")
             
             # Save to CSV if updated
             if updated:
-                self.save_carriers()
+                self.save_carriers(callsign)
                 return True
             
         except Exception:
@@ -716,10 +909,10 @@ class FleetCarrierManager:
             # Store as 'Yes' or 'No' strings
             self.carriers[callsign]['icy_rings'] = 'Yes' if has_icy_rings else 'No'
             self.carriers[callsign]['pristine'] = 'Yes' if has_pristine else 'No'
-            self.carriers[callsign]['last_updated'] = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')
+            self._set_last_updated(callsign, *utc_now_timestamp())
             
             # Save to CSV
-            self.save_carriers()
+            self.save_carriers(callsign)
             
             logger.info(f"Updated carrier {callsign} rings status: Icy Rings={has_icy_rings}, Pristine={has_pristine}")
             return True
@@ -730,8 +923,7 @@ class FleetCarrierManager:
     
     def get_carrier_by_id(self, carrier_id: int) -> Optional[Dict]:
         """
-        Get fleet carrier by carrier ID (stored from CAPI data).
-        Note: This requires storing CarrierID from CAPI.
+        Get fleet carrier by carrier ID (its MarketID, stored from CAPI and CarrierStats).
         
         Args:
             carrier_id: Fleet carrier ID
@@ -739,6 +931,18 @@ class FleetCarrierManager:
         Returns:
             Carrier dictionary or None if not found
         """
-        # We'd need to store carrier ID from CAPI to use this
-        # For now, return None - this can be enhanced later
-        return None
+        if not carrier_id:
+            return None
+        callsign = self._by_carrier_id.get(str(carrier_id))
+        return self.carriers.get(callsign) if callsign else None
+    
+    def get_most_recent_carrier(self) -> Optional[Dict]:
+        """
+        Get the most recently updated fleet carrier.
+        
+        Returns:
+            Carrier dictionary or None if there are no carriers
+        """
+        if self._most_recent is None:
+            return None
+        return self.carriers.get(self._most_recent)
@@ -8,18 +8,19 @@ import re
 import subprocess
 import sys
 import threading
+import time
 import tkinter as tk
 import tkinter.filedialog as filedialog
+import tkinter.font as tkfont
 import tkinter.ttk as ttk
 import traceback
 import urllib.parse
 import webbrowser
-from time import sleep
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from tkinter import *
 
 import requests  # type: ignore
-from config import appname, config, user_agent  # type: ignore
-import timeout_session  # type: ignore
+from config import appname, config  # type: ignore
 from monitor import monitor  # type: ignore
 from ttkHyperlinkLabel import HyperlinkLabel  # type: ignore
 from theme import theme  # type: ignore
@@ -27,9 +28,24 @@ from theme import theme  # type: ignore
 # Import localization function from load.py
 from load import plugin_tl  # type: ignore
 
-from . import AutoCompleter, PlaceHolder
+from . import AutoCompleter, PlaceHolder, api, http_client
 from .updater import SpanshUpdater
+from .CarrierStore import open_carrier_store
+from .CargoDetailsManager import CargoDetailsManager
 from .FleetCarrierManager import FleetCarrierManager
+from .StoredModulesManager import StoredModulesManager
+from .StoredShipsManager import StoredShipsManager
+from .RouteModel import RouteModel
+from .RouteImporter import CsvRouteImporter, run_csv_import_worker
+from .RingCache import RingCache, parse_ring_summary
+from .RingPrefetcher import RING_PREFETCH_WAYPOINTS, RingPrefetcher
+from .RouteCache import (load_column_widths_cache, load_route_cache, remove_route_cache,
+                         save_column_widths_cache, save_route_cache)
+from .spansh_jobs import SpanshJobCancelled, SpanshJobTimeout, wait_for_spansh_job
+from .SystemNameCache import SystemNameCache
+from .column_widths import (ROUTE_TABLE_FONT_FAMILY, ROUTE_TABLE_FONT_SIZE, CharWidthTable,
+                            measure_column_text_widths, run_column_width_worker)
+from .file_helpers import atomic_open
 from .ui_helpers import ThemeSafeCanvas, ThemedCombobox
 from .windows import show_carrier_details_window, show_route_window, refresh_route_window_if_open
 from .ui.message_dialog import showinfo, showwarning, showerror, askyesno
@@ -39,6 +55,20 @@ plugin_name = os.path.basename(os.path.dirname(os.path.dirname(__file__)))
 logger = logging.getLogger(f'{appname}.{plugin_name}')
 
 
+# Quiet period before a changed offset is written to disk (coalesces bursts of waypoint changes)
+OFFSET_SAVE_DEBOUNCE_MS = 1500
+# Fleet carrier panel parts, in the order a coalesced refresh pass updates them
+FLEET_CARRIER_PANELS = ('dropdown', 'system', 'rings', 'tritium', 'balance', 'restock')
+# Delay after the GUI is built before the cargo/ships/modules caches are loaded in the background
+CARRIER_CACHE_PREFETCH_DELAY_MS = 2000
+# API change events raised by the lazily loaded carrier cache managers
+LAZY_MANAGER_EVENTS = {'cargo_manager': api.EVENT_CARGO_CHANGED, 'ships_manager': api.EVENT_SHIPS_CHANGED}
+# Separator between the intermediate systems typed in the plot GUI's "via" field
+PLOT_VIA_SEPARATOR = ';'
+# Spansh route jobs run at once when a route with intermediate systems is plotted leg by leg
+PLOT_LEG_CONCURRENCY = 3
+
+
 def _round_distance(val):
     """Round distance value up to nearest hundredth. Used by Spansh route worker."""
     if not val or val == "":
@@ -50,6 +80,44 @@ def _round_distance(val):
         return str(val) if val is not None else ""
 
 
+def _stitch_route_legs(legs):
+    """
+    Join the system_jumps of consecutive Spansh route legs into one route.
+
+    Every leg after the first starts at the system the previous leg finished at, so
+    that waypoint is dropped. Jumps and distance jumped are per waypoint and are kept
+    (the route model sums them). Distance left keeps Spansh's meaning (the distance
+    from the waypoint to the end of its leg, as Spansh reports it) with the distances
+    of the remaining legs added: each later leg contributes the distance_left of its
+    first waypoint. A one-leg route is therefore returned exactly as Spansh sent it.
+
+    Args:
+        legs: system_jumps lists of the legs, in route order
+
+    Returns:
+        List of waypoint dicts in Spansh's system_jumps format
+    """
+    def leg_distance(leg):
+        try:
+            return float(leg[0].get('distance_left') or 0)
+        except (TypeError, ValueError, IndexError):
+            return 0.0
+
+    route = []
+    for index, leg in enumerate(legs):
+        # Distance of the legs after this one (exactly 0 for the last leg)
+        later = sum(leg_distance(later_leg) for later_leg in legs[index + 1:])
+        for waypoint in (leg[1:] if route else leg):
+            if later:
+                waypoint = dict(waypoint)
+                try:
+                    waypoint['distance_left'] = float(waypoint.get('distance_left') or 0) + later
+                except (TypeError, ValueError):
+                    pass
+            route.append(waypoint)
+    return route
+
+
 class GalaxyGPS():
     def __init__(self, plugin_dir):
         version_file = os.path.join(plugin_dir, "version.json")
@@ -63,15 +131,16 @@ class GalaxyGPS():
                 self.plugin_version = version_content.strip('"\'')
 
         self.update_available = False
+        # Shared SQLite database for carrier data, the CSV files are exported from it
+        # (None: managers fall back to their CSV files)
+        self.carrier_store = open_carrier_store(plugin_dir)
         # Initialize Fleet Carrier Manager for CAPI integration
-        self.fleet_carrier_manager = FleetCarrierManager(plugin_dir)
-        # Initialize cache managers for detailed carrier data
-        from GalaxyGPS.CargoDetailsManager import CargoDetailsManager
-        from GalaxyGPS.StoredShipsManager import StoredShipsManager
-        from GalaxyGPS.StoredModulesManager import StoredModulesManager
-        self.cargo_manager = CargoDetailsManager(plugin_dir)
-        self.ships_manager = StoredShipsManager(plugin_dir)
-        self.modules_manager = StoredModulesManager(plugin_dir)
+        self.fleet_carrier_manager = FleetCarrierManager(plugin_dir, store=self.carrier_store)
+        self.fleet_carrier_manager.change_listener = self._notify_carrier_changed
+        # Cache managers for detailed carrier data are built on first access (see cargo_manager,
+        # ships_manager, modules_manager) or by the prefetch started once the GUI is up
+        self._lazy_managers = {}
+        self._lazy_managers_lock = threading.Lock()
         self.roadtoriches = False
         self.fleetcarrier = False
         self.galaxy = False
@@ -93,9 +162,22 @@ class GalaxyGPS():
         self.save_route_path = os.path.join(plugin_dir, 'route.csv')
         self.export_route_path = os.path.join(plugin_dir, 'Export for TCE.exp')
         self.offset_file_path = os.path.join(plugin_dir, 'offset')
+        self.route_cache_path = os.path.join(plugin_dir, 'route.cache')  # Binary cache of the parsed route.csv
+        self.route_widths_path = os.path.join(plugin_dir, 'route.widths')  # Route table column widths for route.csv
         self.original_csv_path = None  # Store path to original CSV file to preserve all columns
         self.offset = 0
-        self.jumps_left = 0
+        self.route_model = None  # Compiled route (typed columns + prefix sums), see RouteModel
+        self._route_dirty = False  # True when the loaded route differs from route.csv
+        self._saved_offset = None  # Offset last written to the offset file
+        self._offset_save_after_id = None  # Pending debounced offset save
+        self._route_char_widths = None  # CharWidthTable of the route table font, built on first use
+        # Spansh autocomplete results shared by the source and destination inputs
+        self.system_name_cache = SystemNameCache(os.path.join(plugin_dir, 'system_names.json'))
+        # EDSM ring summaries per system, so carriers in known systems need no bodies query
+        self.ring_cache = RingCache(os.path.join(plugin_dir, 'ring_cache.json'))
+        # Both caches are read from disk by start_carrier_cache_prefetch, off the startup path
+        # Warms the ring cache for the next waypoints of a fleet carrier route
+        self.ring_prefetcher = RingPrefetcher(self.ring_cache, self._fetch_ring_summary)
         self.error_txt = tk.StringVar()
         # LANG: Error message when route plotting fails
         self.plot_error = plugin_tl("Error while trying to plot a route, please try again.")
@@ -128,8 +210,99 @@ class GalaxyGPS():
         self.fleet_carrier_separator = None
         self.selected_carrier_callsign = None
         self.fleet_carrier_var = tk.StringVar()
+        # Coalesced fleet carrier panel refresh, see request_fleet_carrier_refresh
+        self._fc_dirty_panels = set()
+        self._fc_refresh_after_id = None
         self._gui_initialized = False  # Track if GUI has been initialized
-        self._route_queue = queue.Queue()
+        self._plot_cancel = None  # threading.Event of the Spansh route calculation in progress
+        self._csv_import_cancel = None  # threading.Event of the streaming CSV import in progress
+        self._notified_route_state = (None, 0, None, None)  # (route, length, offset, next stop) last reported to the API
+
+    #   -- Carrier cache managers --
+    def _get_lazy_manager(self, name, manager_class):
+        """
+        Get a carrier cache manager, loading it on first access.
+
+        Safe to call from the prefetch thread and the main thread at the same time;
+        a caller arriving while the manager loads waits for it instead of loading twice.
+
+        Args:
+            name: Attribute name of the manager
+            manager_class: Manager class, constructed with (plugin_dir, store=...)
+
+        Returns:
+            The manager instance
+        """
+        manager = self._lazy_managers.get(name)
+        if manager is None:
+            with self._lazy_managers_lock:
+                manager = self._lazy_managers.get(name)
+                if manager is None:
+                    manager = manager_class(self.plugin_dir, store=self.carrier_store)
+                    if name in LAZY_MANAGER_EVENTS:
+                        event = LAZY_MANAGER_EVENTS[name]
+                        manager.change_listener = lambda callsign: api._notify(event, callsign=callsign)
+                    self._lazy_managers[name] = manager
+        return manager
+
+    def _notify_carrier_changed(self, callsign):
+        """Forward a FleetCarrierManager change to API subscribers."""
+        if callsign is not None and callsign not in self.fleet_carrier_manager.carriers:
+            api._notify(api.EVENT_CARRIER_REMOVED, callsign=callsign)
+        else:
+            api._notify(api.EVENT_CARRIER_UPDATED, callsign=callsign)
+
+    @property
+    def cargo_manager(self):
+        return self._get_lazy_manager('cargo_manager', CargoDetailsManager)
+
+    @property
+    def ships_manager(self):
+        return self._get_lazy_manager('ships_manager', StoredShipsManager)
+
+    @property
+    def modules_manager(self):
+        return self._get_lazy_manager('modules_manager', StoredModulesManager)
+
+    def start_carrier_cache_prefetch(self):
+        """
+        Load the cargo, ships and modules caches on a background thread shortly after the GUI is up,
+        so opening a details window or the first matching journal event does not wait for them.
+        The autocomplete and ring caches are read from disk first, on the same thread.
+        """
+        def _prefetch():
+            for cache in (self.system_name_cache, self.ring_cache):
+                if getattr(config, 'shutting_down', False):
+                    return
+                try:
+                    cache.load()
+                except Exception:
+                    logger.warning('!! ' + traceback.format_exc(), exc_info=False)
+            for name in ('cargo_manager', 'ships_manager', 'modules_manager'):
+                if getattr(config, 'shutting_down', False):
+                    return
+                try:
+                    getattr(self, name)
+                except Exception:
+                    logger.warning('!! ' + traceback.format_exc(), exc_info=False)
+
+        def _start():
+            if getattr(config, 'shutting_down', False):
+                return
+            threading.Thread(target=_prefetch, name="GalaxyGPS carrier cache prefetch", daemon=True).start()
+
+        if self.parent:
+            self.parent.after(CARRIER_CACHE_PREFETCH_DELAY_MS, _start)
+        else:
+            _start()
+
+    def flush_carrier_csv_exports(self):
+        """Write the CSV exports of loaded cargo, ships and modules caches still waiting for their quiet period."""
+        for manager in list(self._lazy_managers.values()):
+            try:
+                manager.flush_csv()
+            except Exception:
+                logger.warning('!! ' + traceback.format_exc(), exc_info=False)
 
     #   -- GUI part --
     def init_gui(self, parent):
@@ -383,9 +556,11 @@ class GalaxyGPS():
 
             # Plotting GUI
             # LANG: Placeholder text for source system input
-            self.source_ac = AutoCompleter(self.frame, plugin_tl("Source System"), width=30)
+            self.source_ac = AutoCompleter(self.frame, plugin_tl("Source System"), system_cache=self.system_name_cache, width=30)
             # LANG: Placeholder text for destination system input
-            self.dest_ac = AutoCompleter(self.frame, plugin_tl("Destination System"), width=30)
+            self.dest_ac = AutoCompleter(self.frame, plugin_tl("Destination System"), system_cache=self.system_name_cache, width=30)
+            # LANG: Placeholder text for intermediate systems input (separated by ;)
+            self.via_entry = PlaceHolder(self.frame, plugin_tl("Via systems (separate with ;)"), width=30)
             
             # Create container frame for range entry and supercharge toggle (side-by-side)
             range_supercharge_container = tk.Frame(self.frame, bg=self.frame.cget('bg'))
@@ -461,7 +636,7 @@ class GalaxyGPS():
             # LANG: Button to calculate/compute route
             self.plot_route_btn = tk.Button(self.plotting_controls_container, text=plugin_tl("Calculate"), command=self.plot_route)
             # LANG: Button to cancel route plotting
-            self.cancel_plot = tk.Button(self.plotting_controls_container, text=plugin_tl("Cancel"), command=lambda: self.show_plot_gui(False))
+            self.cancel_plot = tk.Button(self.plotting_controls_container, text=plugin_tl("Cancel"), command=self.cancel_plot_route)
             
             # Clear route button remains a child of self.frame
             # LANG: Button to clear current route
@@ -473,18 +648,15 @@ class GalaxyGPS():
             carrier_container.grid(row=row, column=0, columnspan=2, padx=2, pady=2, sticky=tk.W)
             # Store grid info to prevent repositioning
             self._fleet_carrier_row_start = row
-            self.update_fleet_carrier_dropdown()
             row += 1
             # View All and Inara buttons packed together in column 0
             self.fleet_carrier_buttons_container.grid(row=row, column=0, padx=2, pady=2, sticky=tk.W)
             row += 1
             # Fleet carrier system location
             system_container.grid(row=row, column=0, columnspan=2, padx=2, pady=2, sticky=tk.W)
-            self.update_fleet_carrier_system_display()
             row += 1
             # Icy Rings and Pristine status on their own row
             self.fleet_carrier_rings_pristine_container.grid(row=row, column=0, columnspan=2, padx=2, pady=2, sticky=tk.W)
-            self.update_fleet_carrier_rings_status()
             row += 1
             # Fleet carrier Tritium display (clickable to search Inara) with Balance packed next to it
             self.fleet_carrier_tritium_balance_container.grid(row=row, column=0, columnspan=2, padx=2, pady=2, sticky=tk.W)
@@ -492,9 +664,9 @@ class GalaxyGPS():
             self.fleet_carrier_tritium_label.bind("<Button-1>", lambda e: self._on_tritium_click())
             self.fleet_carrier_tritium_label.bind("<Enter>", lambda e: self._on_tritium_enter())
             self.fleet_carrier_tritium_label.bind("<Leave>", lambda e: self._on_tritium_leave())
-            self.update_fleet_carrier_tritium_display()
-            self.update_fleet_carrier_balance_display()
             row += 1
+            # Fill the carrier panel once the layout is done
+            self.request_fleet_carrier_refresh()
             # Separator line
             self.fleet_carrier_separator = tk.Frame(self.frame, height=1, bg="gray")
             self.fleet_carrier_separator.grid(row=row, column=0, columnspan=4, sticky=tk.EW, padx=2, pady=2)
@@ -532,6 +704,8 @@ class GalaxyGPS():
             row += 1
             self.source_ac.grid(row=row, columnspan=4, padx=2, pady=(5,0)) # The AutoCompleter takes two rows to show the list when needed, so we skip one
             row += 2
+            self.via_entry.grid(row=row, columnspan=4, padx=2, pady=(5,0))
+            row += 1
             self.dest_ac.grid(row=row, columnspan=4, padx=2, pady=(5,0))
             row += 2
             self.supercharge_cb.grid(row=row, column=0, padx=2, pady=5, sticky=tk.W)
@@ -726,6 +900,8 @@ class GalaxyGPS():
                     self.source_ac.set_default_style()
                 if hasattr(self, 'dest_ac'):
                     self.dest_ac.set_default_style()
+                if hasattr(self, 'via_entry') and self.via_entry.get() != self.via_entry.placeholder:
+                    self.via_entry.set_default_style()
             except Exception as e:
                 logger.debug(f'[_update_combobox_theme] Error updating AutoCompleter colors: {e}')
             
@@ -794,6 +970,14 @@ class GalaxyGPS():
                 if self.dest_ac.get() == old_placeholder:
                     self.dest_ac.put_placeholder()
             
+            if hasattr(self, 'via_entry'):
+                new_via_placeholder = plugin_tl("Via systems (separate with ;)")
+                old_placeholder = self.via_entry.placeholder
+                self.via_entry.placeholder = new_via_placeholder
+                # If currently showing placeholder text, update it
+                if self.via_entry.get() == old_placeholder:
+                    self.via_entry.put_placeholder()
+            
             if hasattr(self, 'range_entry'):
                 new_range_placeholder = plugin_tl("Range (LY)")
                 old_placeholder = self.range_entry.placeholder
@@ -992,6 +1176,8 @@ class GalaxyGPS():
                 self.source_ac.put_placeholder()
             if not self.dest_ac.var.get() or self.dest_ac.var.get() == self.dest_ac.placeholder:
                 self.dest_ac.put_placeholder()
+            if not self.via_entry.var.get() or self.via_entry.var.get() == self.via_entry.placeholder:
+                self.via_entry.put_placeholder()
             self.source_ac.hide_list()
             self.dest_ac.hide_list()
             # Return to appropriate state
@@ -1027,7 +1213,7 @@ class GalaxyGPS():
         ]
         
         plotting_widgets = [
-            self.source_ac, self.dest_ac,
+            self.source_ac, self.via_entry, self.dest_ac,
             self.supercharge_cb, self.efficiency_slider
         ]
         
@@ -1188,6 +1374,8 @@ class GalaxyGPS():
         """Update the GUI based on current state"""
         if len(self.route) > 0:
             self._update_widget_visibility('route')
+            # Warm the ring cache for the waypoints ahead (fleet carrier routes only)
+            self.prefetch_route_rings()
             # Ensure waypoint button text is updated (especially important for Road to Riches)
             # This handles cases where next_stop might have been updated but button text wasn't refreshed
             if hasattr(self, 'waypoint_btn') and hasattr(self, 'next_stop') and hasattr(self, 'next_wp_label'):
@@ -1200,6 +1388,37 @@ class GalaxyGPS():
                     pass  # Silently fail if button doesn't exist yet
         else:
             self._update_widget_visibility('empty')
+        self._notify_route_changes()
+
+    def _notify_route_changes(self):
+        """
+        Tell API subscribers about a new route or next waypoint since the last call.
+        Runs from update_gui, which follows every route load, clear and waypoint change.
+        """
+        route = self.route if self.route else None
+        state = (route, len(self.route), self.offset, self.next_stop if route else None)
+        last_route, last_length, last_offset, last_next_stop = self._notified_route_state
+        if route is last_route and state[1:] == self._notified_route_state[1:]:
+            return
+        self._notified_route_state = state
+        if route is None:
+            if last_route is not None:
+                api._notify(api.EVENT_ROUTE_CLEARED)
+            return
+        if route is not last_route or len(route) != last_length:
+            api._notify(api.EVENT_ROUTE_LOADED, total_waypoints=len(route), route_type=self._route_type_name())
+        if (self.offset, self.next_stop) != (last_offset, last_next_stop):
+            api._notify(api.EVENT_WAYPOINT_CHANGED, offset=self.offset, next_stop=self.next_stop)
+
+    def _route_type_name(self):
+        """Route type as reported by the API ('roadtoriches', 'fleetcarrier', 'neutron' or 'galaxy')."""
+        if self.roadtoriches:
+            return 'roadtoriches'
+        if self.fleetcarrier:
+            return 'fleetcarrier'
+        if self.neutron:
+            return 'neutron'
+        return 'galaxy'
 
     def show_error(self, error):
         self.error_txt.set(error)
@@ -1214,6 +1433,8 @@ class GalaxyGPS():
             self.source_ac.update_idletasks()
             self.dest_ac.config(state=tk.NORMAL)
             self.dest_ac.update_idletasks()
+            self.via_entry.config(state=tk.NORMAL)
+            self.via_entry.update_idletasks()
             self.efficiency_slider.config(state=tk.NORMAL)
             self.efficiency_slider.update_idletasks()
             self.range_entry.config(state=tk.NORMAL)
@@ -1232,14 +1453,15 @@ class GalaxyGPS():
             self.source_ac.update_idletasks()
             self.dest_ac.config(state=tk.DISABLED)
             self.dest_ac.update_idletasks()
+            self.via_entry.config(state=tk.DISABLED)
+            self.via_entry.update_idletasks()
             self.efficiency_slider.config(state=tk.DISABLED)
             self.efficiency_slider.update_idletasks()
             self.range_entry.config(state=tk.DISABLED)
             self.range_entry.update_idletasks()
             self.plot_route_btn.config(state=tk.DISABLED, text=plugin_tl("Computing..."))  # LANG: Button text during route calculation
             self.plot_route_btn.update_idletasks()
-            self.cancel_plot.config(state=tk.DISABLED)
-            self.cancel_plot.update_idletasks()
+            # Cancel stays enabled: it aborts the calculation
             # supercharge_cb is a Frame containing Canvas and Label - disable interaction by unbinding events
             if hasattr(self, 'supercharge_toggle_canvas'):
                 # Unbind click events to disable interaction during calculation
@@ -1252,6 +1474,30 @@ class GalaxyGPS():
 
     def open_last_route(self):
         try:
+            # Warm start: restore the parsed route from the binary cache instead of re-parsing route.csv
+            if self._load_route_cache():
+                # The offset file is written on every waypoint change and is newer than the cache
+                try:
+                    with open(self.offset_file_path, 'r') as offset_fh:
+                        self.offset = int(offset_fh.readline())
+                except (IOError, OSError, ValueError):
+                    pass
+                self.offset = max(0, min(self.offset, len(self.route) - 1))
+                self._saved_offset = self.offset
+
+                self.next_stop = self._get_system_name_at_index(self.offset) or self.route[self.offset][0]
+                if self.galaxy:
+                    self.pleaserefuel = self.route[self.offset][1] == "Yes" if len(self.route[self.offset]) > 1 else False
+                self.update_bodies_text()
+                self.compute_distances()
+                self.copy_waypoint()
+                self.update_gui()
+                if self.fleetcarrier and hasattr(self, 'check_fleet_carrier_restock_warning'):
+                    self.check_fleet_carrier_restock_warning()
+                # No-op when the cached route already has its column widths
+                self.start_column_width_pass()
+                return
+
             has_headers = False
             with open(self.save_route_path, 'r', encoding='utf-8-sig', newline='') as csvfile:
                 # Check if the file has a header for compatibility with previous versions
@@ -1269,22 +1515,15 @@ class GalaxyGPS():
                         self.offset = int(offset_fh.readline())
                 except (IOError, OSError, ValueError):
                     self.offset = 0
-                
-                # Calculate jumps_left from current offset
-                self.jumps_left = 0
-                for i in range(self.offset, len(self.route)):
-                    row = self.route[i]
-                    if len(row) > 1 and row[1] not in [None, "", []]:
-                        if not self.galaxy:  # galaxy type doesn't have a jumps column
-                            try:
-                                self.jumps_left += int(row[1])
-                            except (ValueError, TypeError):
-                                pass  # Skip rows with non-numeric jumps values
-                        else:
-                            self.jumps_left += 1
+                self._saved_offset = self.offset
+                # Loaded from route.csv, nothing to write back
+                self._route_dirty = False
                 
                 # Set next waypoint
                 if self.route and len(self.route) > 0:
+                    # Cache the parsed route so the next start can skip parsing route.csv
+                    self._save_route_cache()
+
                     self.next_stop = self.route[self.offset][0]
                     self.update_bodies_text()
                     self.compute_distances()
@@ -1295,6 +1534,7 @@ class GalaxyGPS():
                     # Force GUI refresh to ensure all widgets are visible
                     if hasattr(self, 'parent'):
                         self.parent.update_idletasks()
+                    self.start_column_width_pass()
             else:
                 # Old format without headers - legacy support
                 with open(self.save_route_path, 'r', newline='') as csvfile:
@@ -1310,18 +1550,7 @@ class GalaxyGPS():
                 except (IOError, OSError, ValueError):
                     self.offset = 0
                 
-                # Calculate jumps_left
-                self.jumps_left = 0
-                for i in range(self.offset, len(self.route)):
-                    row = self.route[i]
-                    if len(row) > 1 and row[1] not in [None, "", []]:
-                        if not self.galaxy:
-                            try:
-                                self.jumps_left += int(row[1])
-                            except (ValueError, TypeError):
-                                pass
-                        else:
-                            self.jumps_left += 1
+                self.compile_route()
                 
                 if self.route and len(self.route) > 0:
                     self.next_stop = self.route[self.offset][0]
@@ -1794,14 +2023,9 @@ class GalaxyGPS():
                     self.dist_remaining = plugin_tl("Finished")
                     return
             
-            # Not finished yet - sum all remaining jump values from the next row onwards
-            # Jumps are now at index 3
-            s = 0.0
-            for r in self.route[self.offset + 1:]:
-                if len(r) >= 4:
-                    v = safe_flt(r[3])
-                    if v is not None:
-                        s += v
+            # Not finished yet - remaining jump values from the next row onwards (prefix sums)
+            model = self._get_route_model()
+            s = float(model.jumps_after(self.offset)) if model else 0.0
             
             if s > 0:
                 self.dist_remaining = f"{plugin_tl('Remaining jumps afterwards')}: {s:.2f}"
@@ -1815,36 +2039,17 @@ class GalaxyGPS():
         if len(cur) >= 4:
             total_rem = safe_flt(cur[3])
 
-        if total_rem is None:
-            # Try summing distance_to_arrival of subsequent rows (index 2)
-            total = 0.0
-            ok = True
-            for r in self.route[self.offset + 1:]:
-                if len(r) >= 3:
-                    v = safe_flt(r[2])
-                    if v is None:
-                        ok = False
-                        break
-                    total += v
-                else:
-                    ok = False
-                    break
-            if ok:
-                total_rem = total
+        model = self._get_route_model()
+        if total_rem is None and model:
+            # Sum of distance_to_arrival of subsequent rows (index 2), None if any is missing
+            total_rem = model.distance_after(self.offset)
 
         if total_rem is not None:
             self.dist_remaining = f"{plugin_tl('Remaining jumps afterwards')}: {total_rem:.2f}"
         else:
             # final fallback: sum numeric jumps (index 1) as approximate
-            s = 0.0
-            ok = True
-            for r in self.route[self.offset + 1:]:
-                v = safe_flt(r[1])
-                if v is None:
-                    ok = False
-                    break
-                s += v
-            if ok and s > 0:
+            s = model.jumps_after(self.offset, require_all=True) if model else None
+            if s is not None and s > 0:
                 self.dist_remaining = f"{plugin_tl('Remaining jumps afterwards')}: {s:.2f}"
             else:
                 self.dist_remaining = ""
@@ -1873,16 +2078,10 @@ class GalaxyGPS():
                     current_system = carrier.get('current_system', '')
             # If no carrier selected or no carrier data, try to get the most recent carrier
             if not current_system:
-                carriers = self.get_all_fleet_carriers()
-                if carriers:
-                    # Get the most recently updated carrier
-                    sorted_carriers = sorted(
-                        carriers,
-                        key=lambda x: x.get('last_updated', ''),
-                        reverse=True
-                    )
-                    carrier = sorted_carriers[0]
-                    current_system = carrier.get('current_system', '') if carrier else None
+                # Get the most recently updated carrier
+                carrier = self.get_most_recent_fleet_carrier()
+                if carrier:
+                    current_system = carrier.get('current_system', '')
         else:
             # For non-fleet carrier routes, use the player's current system
             current_system = monitor.state.get('SystemName')
@@ -1891,59 +2090,21 @@ class GalaxyGPS():
             # No current system info, start from beginning
             return 0
         
-        current_system_lower = current_system.lower()
-        
-        # Search through route from start to find the best match
         # Strategy: Find the last waypoint we've already visited
         # (i.e., where the system matches), then advance to the next one
-        found_index = -1
-        
-        for idx, waypoint in enumerate(self.route):
-            # Use helper method to get system name (handles empty names for Road to Riches)
-            waypoint_system = self._get_system_name_at_index(idx)
-            if waypoint_system and waypoint_system.lower() == current_system_lower:
-                # Found a match - we're at this waypoint
-                found_index = idx
+        # The compiled route's system-name index makes this a dict lookup instead of a route scan
+        model = self._get_route_model()
+        found_index = model.last_index_of(current_system) if model else -1
         
         if found_index >= 0:
             # We're at a waypoint - advance to the next one with a different system name
-            # Get the current system name to compare against
-            current_waypoint_system = self._get_system_name_at_index(found_index)
-            next_index = found_index + 1
-            
-            # Skip rows with the same system name (for Road to Riches where system names don't repeat)
-            while next_index < len(self.route):
-                next_system_name = self._get_system_name_at_index(next_index)
-                # If we found a different system name (or reached the end), use it
-                if next_system_name != current_waypoint_system:
-                    break
-                next_index += 1
+            # (skips rows with the same system name, e.g. Road to Riches bodies)
+            next_index = model.next_different[found_index]
             
             if next_index >= len(self.route):
                 # We're at or past the last waypoint, stay at the last one
                 next_index = len(self.route) - 1
             
-            # Update jumps_left to account for skipping waypoints we've already passed
-            for idx in range(next_index):
-                if idx < len(self.route) and len(self.route[idx]) > 1:
-                    try:
-                        if self.fleetcarrier:
-                            # Fleet carrier routes: each row is 1 jump
-                            self.jumps_left -= 1
-                        elif self.neutron:
-                            # Neutron routes: jumps are at index 3
-                            if len(self.route[idx]) > 3 and self.route[idx][3] not in [None, "", []]:
-                                self.jumps_left -= int(self.route[idx][3])
-                        elif self.galaxy:
-                            # Galaxy routes: each row is 1 jump
-                            self.jumps_left -= 1
-                        else:
-                            # Generic routes: jumps are at index 1
-                            if len(self.route[idx]) > 1 and self.route[idx][1] not in [None, "", []]:
-                                self.jumps_left -= int(self.route[idx][1])
-                    except (ValueError, TypeError):
-                        pass
-            
             return next_index
         else:
             # Not at any waypoint - check if we're between waypoints
@@ -1951,6 +2112,141 @@ class GalaxyGPS():
             # Could enhance this later to check distance to nearest waypoint
             return 0
     
+    def compile_route(self):
+        """
+        Build the compiled route model for the currently loaded route.
+        Must be called whenever self.route is replaced or its route type flags change.
+        Compiling does not mark the route as changed; the code replacing the route does.
+        """
+        if not self.route:
+            self.route_model = None
+            return
+        self.route_model = RouteModel(
+            self.route,
+            neutron=self.neutron,
+            fleetcarrier=self.fleetcarrier,
+            galaxy=self.galaxy,
+            roadtoriches=self.roadtoriches,
+        )
+
+    def _get_route_model(self):
+        """
+        Get the compiled route model, recompiling it if the route was replaced since it was built.
+        Returns None if no route is loaded.
+        """
+        if not self.route:
+            return None
+        if self.route_model is None or not self.route_model.is_current(
+                self.route, neutron=self.neutron, fleetcarrier=self.fleetcarrier, galaxy=self.galaxy,
+                roadtoriches=self.roadtoriches):
+            self.compile_route()
+        return self.route_model
+
+    def _get_route_char_widths(self):
+        """Get the character width table of the route table font (built once, on the main thread)."""
+        if self._route_char_widths is None:
+            self._route_char_widths = CharWidthTable(
+                tkfont.Font(family=ROUTE_TABLE_FONT_FAMILY, size=ROUTE_TABLE_FONT_SIZE)
+            )
+        return self._route_char_widths
+
+    def _route_column_fields(self):
+        """Get the lowercase field names of the loaded route's full data."""
+        if self.route_fieldnames:
+            return [name.lower() for name in self.route_fieldnames]
+        if self.route_full_data:
+            return list(self.route_full_data[0].keys())
+        return []
+
+    def start_column_width_pass(self):
+        """
+        Measure the route table column widths on a worker thread, once per loaded route.
+        The widths are stored on the compiled route (and with it in the route cache),
+        so opening or refreshing the route window does not measure any cells.
+        """
+        model = self._get_route_model()
+        if model is None or not self.route_full_data or len(self.route_full_data) != model.length:
+            return
+        try:
+            char_table = self._get_route_char_widths()
+        except Exception:
+            logger.warning('!! ' + traceback.format_exc(), exc_info=False)
+            return
+        if model.column_text_widths is not None and model.column_widths_key == char_table.key:
+            return
+        if not self._route_dirty:
+            # Measured in an earlier session for the same route.csv
+            cached = load_column_widths_cache(self.route_widths_path, self.save_route_path, str(self.plugin_version))
+            if cached is not None and cached[0] == char_table.key:
+                model.column_widths_key, model.column_text_widths = cached
+                return
+
+        result_queue = queue.Queue()
+        threading.Thread(
+            target=run_column_width_worker,
+            args=(list(self.route_full_data), self._route_column_fields(), char_table, result_queue),
+            daemon=True,
+        ).start()
+        self.frame.after(100, self._poll_column_widths, result_queue, model, char_table.key)
+
+    def _poll_column_widths(self, result_queue, model, widths_key):
+        """Main-thread polling for the column width pass: store the widths on the compiled route."""
+        if getattr(config, 'shutting_down', False):
+            return
+        try:
+            r = result_queue.get_nowait()
+        except queue.Empty:
+            self.frame.after(100, self._poll_column_widths, result_queue, model, widths_key)
+            return
+
+        if r['type'] != 'done' or model is not self.route_model:
+            # Failed, or the route was replaced in the meantime
+            return
+        model.column_text_widths = r['widths']
+        model.column_widths_key = widths_key
+        if not self._route_dirty:
+            # route.csv is up to date: keep the widths for it so they survive a restart
+            save_column_widths_cache(self.route_widths_path, self.save_route_path, widths_key, r['widths'],
+                                     str(self.plugin_version))
+
+    def get_route_column_widths(self, route_data):
+        """
+        Get the widest cell text of each route table column.
+        Uses the widths cached on the compiled route; if the background pass has not
+        finished yet they are computed now from the character width table.
+
+        Args:
+            route_data: Route rows shown in the route window
+
+        Returns:
+            Dict of lowercase field name -> width in pixels (without padding)
+        """
+        char_table = self._get_route_char_widths()
+        model = self._get_route_model()
+        is_loaded_route = (model is not None and route_data is self.route_full_data
+                           and len(route_data) == model.length)
+        if (is_loaded_route and model.column_text_widths is not None
+                and model.column_widths_key == char_table.key):
+            return model.column_text_widths
+
+        if is_loaded_route:
+            fields = self._route_column_fields()
+        else:
+            fields = list(route_data[0].keys()) if route_data else []
+        column_widths = measure_column_text_widths(route_data, fields, char_table)
+        if is_loaded_route:
+            model.column_text_widths = column_widths
+            model.column_widths_key = char_table.key
+        return column_widths
+
+    @property
+    def jumps_left(self):
+        """Estimated jumps left from the current offset (O(1) via the compiled route model)."""
+        model = self._get_route_model()
+        if model is None:
+            return 0
+        return model.jumps_left(self.offset if self.offset is not None else 0)
+
     def _get_system_name_at_index(self, idx):
         """
         Get the system name at a given route index, handling empty system names for Road to Riches.
@@ -1959,6 +2255,11 @@ class GalaxyGPS():
         if idx < 0 or idx >= len(self.route):
             return None
         
+        # Resolved names are precomputed (forward-filled for Road to Riches) in the compiled route
+        model = self._get_route_model()
+        if model:
+            return model.system_name_at(idx)
+        
         system_name = self.route[idx][0] if len(self.route[idx]) > 0 else ""
         
         # For Road to Riches, if system name is empty, look backwards for the last non-empty name
@@ -1998,79 +2299,25 @@ class GalaxyGPS():
             self.update_gui()
             return
 
-        # Get current system name (handling empty names for Road to Riches)
-        current_system_name = self._get_system_name_at_index(self.offset)
-        # Handle None case - if we can't get system name, use empty string for comparison
-        if current_system_name is None:
-            current_system_name = ""
-
         try:
             if direction > 0:
                 # Moving forward: skip to next row with different system name
-                # First, subtract jumps for current offset (if present)
-                if self.fleetcarrier:
-                    # Fleet carrier routes: each row is 1 jump
-                    self.jumps_left -= 1
-                elif self.neutron:
-                    # Neutron routes: jumps are at index 3
-                    if len(self.route[self.offset]) > 3 and self.route[self.offset][3] not in [None, "", []]:
-                        self.jumps_left -= int(self.route[self.offset][3])
-                elif self.galaxy:
-                    # Galaxy routes: each row is 1 jump
-                    self.jumps_left -= 1
-                else:
-                    # Generic routes: jumps are at index 1
-                    if len(self.route[self.offset]) > 1 and self.route[self.offset][1] not in [None, "", []]:
-                        self.jumps_left -= int(self.route[self.offset][1])
-                
-                # Find next row with different system name
-                new_offset = self.offset
-                while new_offset < len(self.route) - 1:
-                    new_offset += 1
-                    next_system_name = self._get_system_name_at_index(new_offset)
-                    # Handle None case
-                    if next_system_name is None:
-                        next_system_name = ""
-                    # If we found a different system name (or reached the end), use it
-                    if next_system_name != current_system_name:
-                        self.offset = new_offset
-                        break
+                # (jumps_left follows the offset through the compiled route model)
+                model = self._get_route_model()
+                new_offset = model.next_different[self.offset]
+                if new_offset < len(self.route):
+                    self.offset = new_offset
                 else:
                     # Reached end of route without finding different system
                     self.offset = len(self.route) - 1
             else:
                 # Moving backward: skip to previous row with different system name
                 if self.offset > 0:
-                    # Find previous row with different system name
-                    new_offset = self.offset
-                    while new_offset > 0:
-                        new_offset -= 1
-                        prev_system_name = self._get_system_name_at_index(new_offset)
-                        # Handle None case
-                        if prev_system_name is None:
-                            prev_system_name = ""
-                        # If we found a different system name, use it
-                        if prev_system_name != current_system_name:
-                            self.offset = new_offset
-                            # Add jumps for the new offset (if present)
-                            if self.fleetcarrier:
-                                # Fleet carrier routes: each row is 1 jump
-                                self.jumps_left += 1
-                            elif self.neutron:
-                                # Neutron routes: jumps are at index 3
-                                if len(self.route[self.offset]) > 3 and self.route[self.offset][3] not in [None, "", []]:
-                                    self.jumps_left += int(self.route[self.offset][3])
-                            elif self.galaxy:
-                                # Galaxy routes: each row is 1 jump
-                                self.jumps_left += 1
-                            else:
-                                # Generic routes: jumps are at index 1
-                                if len(self.route[self.offset]) > 1 and self.route[self.offset][1] not in [None, "", []]:
-                                    self.jumps_left += int(self.route[self.offset][1])
-                            break
-                    else:
-                        # Reached beginning without finding different system, stay at current
-                        pass
+                    model = self._get_route_model()
+                    new_offset = model.prev_different[self.offset]
+                    if new_offset >= 0:
+                        self.offset = new_offset
+                    # else: reached beginning without finding different system, stay at current
         except Exception:
             # If something odd in route contents, try to recover by resetting offset to 0
             logger.warning('!! ' + traceback.format_exc(), exc_info=False)
@@ -2279,7 +2526,8 @@ class GalaxyGPS():
                     except Exception:
                         pass
 
-        self.save_offset()
+        # Only progress changed: debounce the offset write instead of saving the route
+        self.schedule_offset_save()
 
     def goto_changelog_page(self):
         changelog_url = 'https://github.com/Fenris159/EDMC_GalaxyGPS/blob/master/CHANGELOG.md#'
@@ -2296,33 +2544,15 @@ class GalaxyGPS():
 
         if filename.__len__() > 0:
             try:
-                ftype_supported = False
                 if filename.endswith(".csv"):
-                    ftype_supported = True
-                    # Store the original CSV path so we can read all columns later
-                    self.original_csv_path = filename
-                    self.plot_csv(filename)
+                    # Large exports are streamed on a worker thread; the route is
+                    # finalized and saved by _poll_csv_import once parsing completes.
+                    # The original CSV path is kept so we can read all columns later
+                    self.plot_csv_async(filename)
 
                 elif filename.endswith(".txt"):
-                    ftype_supported = True
                     self.plot_edts(filename)
-
-                if ftype_supported:
-                    # Find where we are in the route based on current system location
-                    self.offset = self.find_current_waypoint_in_route()
-                    
-                    self.next_stop = self.route[self.offset][0] if self.route else ""
-                    if self.galaxy:
-                        self.pleaserefuel = self.route[self.offset][1] == "Yes" if self.route and len(self.route[self.offset]) > 1 else False
-                    self.update_bodies_text()
-                    self.compute_distances()
-                    self.copy_waypoint()
-                    self.update_gui()
-                    # Check fleet carrier restock warning
-                    if self.fleetcarrier and hasattr(self, 'check_fleet_carrier_restock_warning'):
-                        self.check_fleet_carrier_restock_warning()
-                    # Save route to cache (now preserves all columns via route_full_data)
-                    self.save_all_route()
+                    self._finish_route_import()
                 else:
                     self.show_error("Unsupported file type")
             except Exception:
@@ -2342,462 +2572,175 @@ class GalaxyGPS():
                 self.has_fuel_used = False  # Reset flag when clearing route
 
             route_reader = csv.DictReader(csvfile)
-            fieldnames = route_reader.fieldnames if route_reader.fieldnames else []
-            
-            # Store full CSV data for View Route window (preserve all columns)
-            self.route_full_data = []
-            self.route_fieldnames = fieldnames  # Preserve original fieldnames for display
-            
-            # Create case-insensitive fieldname mapping
-            fieldname_map = {name.lower(): name for name in fieldnames}
-            
-            def get_field(row, field_name, default=""):
-                """Get field value from row using case-insensitive lookup"""
-                key = fieldname_map.get(field_name.lower(), field_name)
-                return row.get(key, default)
-            
-            def has_field(field_name):
-                """Check if field exists in header (case-insensitive)"""
-                return field_name.lower() in fieldname_map
-            
-            headerline = ','.join(fieldnames) if fieldnames else ""
-            headerline_lower = headerline.lower()
-
-            internalbasicheader1 = "System Name"
-            internalbasicheader2 = "System Name,Jumps"
-            internalrichesheader = "System Name,Jumps,Body Name,Body Subtype"
-            internalfleetcarrierheader_with_distances = "System Name,Distance,Distance Remaining,Tritium in tank,Tritium in market,Fuel Used,Icy Ring,Pristine,Restock Tritium"
-            internalfleetcarrierheader = "System Name,Distance,Distance Remaining,Tritium in tank,Tritium in market,Fuel Used,Icy Ring,Pristine,Restock Tritium"
-            internalgalaxyheader = "System Name,Refuel"
-            neutronimportheader = "System Name,Distance To Arrival,Distance Remaining,Neutron Star,Jumps"
-            road2richesimportheader = "System Name,Body Name,Body Subtype,Is Terraformable,Distance To Arrival,Estimated Scan Value,Estimated Mapping Value,Jumps"
-            fleetcarrierimportheader = "System Name,Distance,Distance Remaining,Tritium in tank,Tritium in market,Fuel Used,Icy Ring,Pristine,Restock Tritium"
-            galaxyimportheader = "System Name,Distance,Distance Remaining,Fuel Left,Fuel Used,Refuel,Neutron Star"
-
-            def get_distance_fields(row):
-                dist_to_arrival = get_field(row, "Distance To Arrival", "") or get_field(row, "Distance", "")
-                dist_remaining = get_field(row, "Distance Remaining", "")
-                
-                # Round distance values UP to nearest hundredth (2 decimal places)
-                def round_distance(value):
-                    if not value or value == "":
-                        return ""
-                    try:
-                        val = float(value)
-                        # Round UP to nearest hundredth: multiply by 100, ceil, divide by 100
-                        rounded = math.ceil(val * 100) / 100
-                        return f"{rounded:.2f}"
-                    except (ValueError, TypeError):
-                        return value  # Return as-is if not a number
-                
-                return round_distance(dist_to_arrival), round_distance(dist_remaining)
+            importer = CsvRouteImporter(route_reader.fieldnames if route_reader.fieldnames else [])
+            self._apply_csv_importer(importer)
 
-            # --- neutron import ---
-            if headerline_lower == neutronimportheader.lower():
-                self.neutron = True  # Flag neutron routes for special cumulative jump handling
-                logger.info(f"[plot_csv] Importing neutron route with headers: {fieldnames}")
-                for row in route_reader:
-                    if row not in (None, "", []):
-                        # Store full row data (all columns)
-                        full_row_data = {}
-                        for field_name in fieldnames:
-                            full_row_data[field_name.lower()] = get_field(row, field_name, '')
-                        self.route_full_data.append(full_row_data)
-                        
-                        # Store minimal route data for route planner
-                        # Neutron format: [System Name, Distance To Arrival, Distance Remaining, Jumps]
-                        dist_to_arrival, dist_remaining = get_distance_fields(row)
-                        jumps_value = get_field(row, self.jumps_header, "")
-                        route_row = [
-                            get_field(row, self.system_header),
-                            dist_to_arrival,
-                            dist_remaining,
-                            jumps_value
-                        ]
-                        self.route.append(route_row)
-                        logger.debug(f"[plot_csv] Neutron row: {route_row}")
-                        try:
-                            jumps_val = get_field(row, self.jumps_header, "0")
-                            self.jumps_left += int(jumps_val)
-                        except (ValueError, TypeError):
-                            pass
+            for row in route_reader:
+                if row not in (None, "", []):
+                    route_row, full_row_data = importer.convert_row(row)
+                    # Store full row data for View Route window (preserve all columns)
+                    self.route_full_data.append(full_row_data)
+                    # Store minimal route data for route planner
+                    self.route.append(route_row)
 
-            # --- Check for Road to Riches import ---
-            if headerline_lower == road2richesimportheader.lower():
-                self.roadtoriches = True
-                logger.info(f"[plot_csv] Detected Road to Riches route with headers: {fieldnames}")
+            self.compile_route()
 
-            # --- simple internal ---
-            if headerline_lower in (internalbasicheader1.lower(), internalbasicheader2.lower()):
-                for row in route_reader:
-                    if row not in (None, "", []):
-                        # Store full row data (all columns)
-                        full_row_data = {}
-                        for field_name in fieldnames:
-                            full_row_data[field_name.lower()] = get_field(row, field_name, '')
-                        self.route_full_data.append(full_row_data)
-                        
-                        # Store minimal route data for route planner
-                        self.route.append([
-                            get_field(row, self.system_header),
-                            get_field(row, self.jumps_header, "")
-                        ])
-                        try:
-                            jumps_val = get_field(row, self.jumps_header, "0")
-                            self.jumps_left += int(jumps_val)
-                        except (ValueError, TypeError):
-                            pass
+            if self.route:
+                # Find where we are in the route based on current system location
+                self.offset = self.find_current_waypoint_in_route()
+                
+                self.next_stop = self.route[self.offset][0]
+                self.update_bodies_text()  # Update bodies text for Road to Riches routes
+                self.compute_distances()
+                self.update_gui()
+                # Check fleet carrier restock warning
+                if self.fleetcarrier and hasattr(self, 'check_fleet_carrier_restock_warning'):
+                    self.check_fleet_carrier_restock_warning()
 
-            # --- internal fleetcarrier WITH distances (load after restart) ---
-            elif headerline_lower == internalfleetcarrierheader_with_distances.lower():
-                self.fleetcarrier = True
-                self.has_fuel_used = has_field('Fuel Used')
+    def _apply_csv_importer(self, importer):
+        """Take over route type flags and fieldnames detected from a CSV header."""
+        self.route_full_data = []
+        self.route_fieldnames = importer.fieldnames  # Preserve original fieldnames for display
+        self.roadtoriches = importer.roadtoriches
+        self.fleetcarrier = importer.fleetcarrier
+        self.galaxy = importer.galaxy
+        self.neutron = importer.neutron
+        if importer.kind != 'basic':
+            self.has_fuel_used = importer.has_fuel_used
+
+    def plot_csv_async(self, filename):
+        """
+        Import a route CSV on a worker thread.
+        Rows are parsed in chunks and appended on the main thread as they arrive,
+        so the first waypoint is usable before the rest of the file has been parsed.
+        """
+        self.clear_route(False)
+        self.has_fuel_used = False
+        self.original_csv_path = filename
 
-                for row in route_reader:
-                    if row not in (None, "", []):
-                        # Store full row data (all columns)
-                        full_row_data = {}
-                        for field_name in fieldnames:
-                            full_row_data[field_name.lower()] = get_field(row, field_name, '')
-                        self.route_full_data.append(full_row_data)
-                        
-                        # Store minimal route data for route planner
-                        # Fleet Carrier format: [System Name, Distance, Distance Remaining, Tritium in tank, Tritium in market, Fuel Used, Icy Ring, Pristine, Restock Tritium]
-                        dist_to_arrival, dist_remaining = get_distance_fields(row)
-                        
-                        route_entry = [
-                            get_field(row, self.system_header),                    # 0: System Name
-                            dist_to_arrival,                                       # 1: Distance
-                            dist_remaining,                                        # 2: Distance Remaining
-                            get_field(row, 'Tritium in tank', ''),                # 3: Tritium in tank
-                            get_field(row, 'Tritium in market', ''),              # 4: Tritium in market
-                        ]
-                        
-                        # Add Fuel Used if present
-                        if self.has_fuel_used:
-                            fuel_used_raw = get_field(row, 'Fuel Used', '')
-                            if fuel_used_raw:
-                                try:
-                                    val = float(fuel_used_raw)
-                                    rounded_val = math.ceil(val * 100) / 100
-                                    route_entry.append(f"{rounded_val:.2f}")       # 5: Fuel Used
-                                except (ValueError, TypeError):
-                                    route_entry.append(fuel_used_raw)
-                            else:
-                                route_entry.append('')
-                        else:
-                            route_entry.append('')  # 5: Fuel Used placeholder
-                        
-                        route_entry.append(get_field(row, 'Icy Ring', ''))        # 6: Icy Ring
-                        route_entry.append(get_field(row, 'Pristine', ''))        # 7: Pristine
-                        route_entry.append(get_field(row, self.restocktritium_header, ''))  # 8: Restock Tritium
-                        
-                        self.route.append(route_entry)
-                        # For internal format with distances, each row is 1 jump
-                        self.jumps_left += 1
+        result_queue = queue.Queue()
+        self._csv_import_cancel = threading.Event()
+        threading.Thread(
+            target=run_csv_import_worker,
+            args=(filename, result_queue, self._csv_import_cancel),
+            daemon=True,
+        ).start()
+        # LANG: Status while a route file is being imported
+        self.show_error(f"{plugin_tl('Importing route...')} 0%")
+        self.frame.after(100, self._poll_csv_import, result_queue, self._csv_import_cancel)
 
-            # --- internal fleetcarrier (legacy, no distances) ---
-            elif headerline_lower == internalfleetcarrierheader.lower():
-                self.fleetcarrier = True
-                self.has_fuel_used = has_field('Fuel Used')
+    def _poll_csv_import(self, result_queue, cancel_event):
+        """Main-thread polling for the streaming CSV import: apply parsed chunks and report progress."""
+        if getattr(config, 'shutting_down', False):
+            cancel_event.set()
+            return
+        if cancel_event.is_set() or cancel_event is not self._csv_import_cancel:
+            # Import was cancelled (route cleared or another import started)
+            return
 
-                for row in route_reader:
-                    if row not in (None, "", []):
-                        # Store full row data (all columns)
-                        full_row_data = {}
-                        for field_name in fieldnames:
-                            full_row_data[field_name.lower()] = get_field(row, field_name, '')
-                        self.route_full_data.append(full_row_data)
-                        
-                        # Store minimal route data for route planner
-                        # Fleet Carrier format: [System Name, Distance, Distance Remaining, Tritium in tank, Tritium in market, Fuel Used, Icy Ring, Pristine, Restock Tritium]
-                        route_entry = [
-                            get_field(row, self.system_header),                    # 0: System Name
-                            "",                                                    # 1: Distance (placeholder)
-                            "",                                                    # 2: Distance Remaining (placeholder)
-                            get_field(row, 'Tritium in tank', ''),                # 3: Tritium in tank
-                            get_field(row, 'Tritium in market', ''),              # 4: Tritium in market
-                        ]
-                        
-                        # Add Fuel Used if present
-                        if self.has_fuel_used:
-                            fuel_used_raw = get_field(row, 'Fuel Used', '')
-                            if fuel_used_raw:
-                                try:
-                                    val = float(fuel_used_raw)
-                                    rounded_val = math.ceil(val * 100) / 100
-                                    route_entry.append(f"{rounded_val:.2f}")       # 5: Fuel Used
-                                except (ValueError, TypeError):
-                                    route_entry.append(fuel_used_raw)
-                            else:
-                                route_entry.append('')
-                        else:
-                            route_entry.append('')  # 5: Fuel Used placeholder
-                        
-                        route_entry.append(get_field(row, 'Icy Ring', ''))        # 6: Icy Ring
-                        route_entry.append(get_field(row, 'Pristine', ''))        # 7: Pristine
-                        route_entry.append(get_field(row, self.restocktritium_header, ''))  # 8: Restock Tritium
-                        
-                        self.route.append(route_entry)
-                        # Legacy format, each row is 1 jump
-                        self.jumps_left += 1
+        first_chunk = False
+        try:
+            while True:
+                try:
+                    r = result_queue.get_nowait()
+                except queue.Empty:
+                    break
 
-            # --- EXTERNAL fleetcarrier import (WITH LY SUPPORT) ---
-            elif headerline_lower == fleetcarrierimportheader.lower():
-                self.fleetcarrier = True
-                self.has_fuel_used = has_field('Fuel Used')
+                if r['type'] == 'header':
+                    self._apply_csv_importer(r['importer'])
+                elif r['type'] == 'chunk':
+                    first_chunk = first_chunk or not self.route
+                    self.route.extend(r['route'])
+                    self.route_full_data.extend(r['route_full_data'])
+                    # LANG: Status while a route file is being imported
+                    self.show_error(f"{plugin_tl('Importing route...')} {int(r['progress'] * 100)}%")
+                elif r['type'] == 'done':
+                    self._csv_import_cancel = None
+                    self.hide_error()
+                    self._finish_route_import()
+                    logger.info(f"[plot_csv_async] Imported {r['rows']} rows from CSV")
+                    return
+                else:
+                    self._fail_csv_import(cancel_event)
+                    return
 
-                for row in route_reader:
-                    if row not in (None, "", []):
-                        # Store full row data (all columns)
-                        full_row_data = {}
-                        for field_name in fieldnames:
-                            field_value = get_field(row, field_name, '')
-                            # Round distance values if present
-                            if field_name.lower() in ["distance to arrival", "distance remaining", "distance"]:
-                                if field_value:
-                                    try:
-                                        val = float(field_value)
-                                        rounded_val = math.ceil(val * 100) / 100
-                                        field_value = f"{rounded_val:.2f}"
-                                    except (ValueError, TypeError):
-                                        pass
-                            full_row_data[field_name.lower()] = field_value
-                        self.route_full_data.append(full_row_data)
-                        
-                        # Store minimal route data for route planner
-                        # Fleet Carrier format: [System Name, Distance, Distance Remaining, Tritium in tank, Tritium in market, Fuel Used, Icy Ring, Pristine, Restock Tritium]
-                        dist_to_arrival, dist_remaining = get_distance_fields(row)
-
-                        route_entry = [
-                            get_field(row, self.system_header),                    # 0: System Name
-                            dist_to_arrival,                                       # 1: Distance
-                            dist_remaining,                                        # 2: Distance Remaining
-                            get_field(row, 'Tritium in tank', ''),                # 3: Tritium in tank
-                            get_field(row, 'Tritium in market', ''),              # 4: Tritium in market
-                        ]
-                        
-                        # Store Fuel Used if present (round UP to nearest hundredth)
-                        if self.has_fuel_used:
-                            fuel_used_raw = get_field(row, 'Fuel Used', '')
-                            if fuel_used_raw:
-                                try:
-                                    val = float(fuel_used_raw)
-                                    rounded_val = math.ceil(val * 100) / 100
-                                    route_entry.append(f"{rounded_val:.2f}")       # 5: Fuel Used
-                                except (ValueError, TypeError):
-                                    route_entry.append(fuel_used_raw)
-                            else:
-                                route_entry.append('')
-                        else:
-                            route_entry.append('')  # 5: Fuel Used placeholder
-                        
-                        # Store Icy Ring and Pristine if present (for route view window)
-                        if has_field('Icy Ring'):
-                            route_entry.append(get_field(row, 'Icy Ring', ''))    # 6: Icy Ring
-                        else:
-                            route_entry.append('')
-                        
-                        if has_field('Pristine'):
-                            route_entry.append(get_field(row, 'Pristine', ''))    # 7: Pristine
-                        else:
-                            route_entry.append('')
-                        
-                        route_entry.append(get_field(row, self.restocktritium_header, ''))  # 8: Restock Tritium
-                        
-                        self.route.append(route_entry)
-                        self.jumps_left += 1
+            if first_chunk:
+                # Make the first waypoint usable while the rest of the file is still being parsed
+                self.offset = 0
+                self.next_stop = self.route[0][0]
+                self.compute_distances()
+                self.update_gui()
+        except Exception:
+            logger.warning('!! ' + traceback.format_exc(), exc_info=False)
+            self._fail_csv_import(cancel_event)
+            return
 
-            # --- galaxy ---
-            elif has_field("Refuel") and has_field(self.system_header):
-                self.galaxy = True
-                self.has_fuel_used = has_field('Fuel Used')
-                has_fuel_left = has_field('Fuel Left')
+        self.frame.after(100, self._poll_csv_import, result_queue, cancel_event)
 
-                for row in route_reader:
-                    if row not in (None, "", []):
-                        # Store full row data (all columns)
-                        full_row_data = {}
-                        for field_name in fieldnames:
-                            field_value = get_field(row, field_name, '')
-                            # Round distance values if present
-                            if field_name.lower() in ["distance to arrival", "distance remaining", "distance"]:
-                                if field_value:
-                                    try:
-                                        val = float(field_value)
-                                        rounded_val = math.ceil(val * 100) / 100
-                                        field_value = f"{rounded_val:.2f}"
-                                    except (ValueError, TypeError):
-                                        pass
-                            full_row_data[field_name.lower()] = field_value
-                        self.route_full_data.append(full_row_data)
-                        
-                        # Store minimal route data for route planner
-                        dist_to_arrival, dist_remaining = get_distance_fields(row)
+    def _fail_csv_import(self, cancel_event):
+        """Abandon a streaming CSV import: stop the worker, drop the partial route and report the error."""
+        cancel_event.set()
+        self._csv_import_cancel = None
+        try:
+            self.clear_route(False)
+        except Exception:
+            logger.warning('!! ' + traceback.format_exc(), exc_info=False)
+        self.enable_plot_gui(True)
+        self.show_error("(1) An error occured while reading the file.")
 
-                        route_row = [
-                            get_field(row, self.system_header, ""),
-                            get_field(row, self.refuel_header, "")
-                        ]
+    def _finish_route_import(self):
+        """Finalize a route loaded from a file: locate the current waypoint, refresh the UI and save."""
+        self._route_dirty = True
+        self.compile_route()
+        if not self.route:
+            self.update_gui()
+            return
 
-                        if dist_to_arrival or dist_remaining:
-                            route_row.append(dist_to_arrival)
-                            route_row.append(dist_remaining)
-                            
-                            # Store Fuel Left if present at index 4 (round UP to nearest hundredth)
-                            if has_fuel_left:
-                                fuel_left_raw = get_field(row, 'Fuel Left', '')
-                                if fuel_left_raw:
-                                    try:
-                                        val = float(fuel_left_raw)
-                                        rounded_val = math.ceil(val * 100) / 100
-                                        route_row.append(f"{rounded_val:.2f}")
-                                    except (ValueError, TypeError):
-                                        route_row.append(fuel_left_raw)
-                                else:
-                                    route_row.append('')
-                            else:
-                                # No Fuel Left column - add empty placeholder
-                                route_row.append("")
-                        
-                        # Store Fuel Used if present at index 5 (round UP to nearest hundredth)
-                        if self.has_fuel_used:
-                            fuel_used_raw = get_field(row, 'Fuel Used', '')
-                            if fuel_used_raw:
-                                try:
-                                    val = float(fuel_used_raw)
-                                    rounded_val = math.ceil(val * 100) / 100
-                                    route_row.append(f"{rounded_val:.2f}")
-                                except (ValueError, TypeError):
-                                    route_row.append(fuel_used_raw)
-                            else:
-                                route_row.append('')
+        # Find where we are in the route based on current system location
+        self.offset = self.find_current_waypoint_in_route()
 
-                        self.route.append(route_row)
-                        self.jumps_left += 1
+        self.next_stop = self.route[self.offset][0]
+        if self.galaxy:
+            self.pleaserefuel = self.route[self.offset][1] == "Yes" if len(self.route[self.offset]) > 1 else False
+        self.update_bodies_text()
+        self.compute_distances()
+        self.copy_waypoint()
+        self.update_gui()
+        # Check fleet carrier restock warning
+        if self.fleetcarrier and hasattr(self, 'check_fleet_carrier_restock_warning'):
+            self.check_fleet_carrier_restock_warning()
+        self.refresh_route_window_if_open()
+        # Save route to cache (now preserves all columns via route_full_data)
+        self.save_all_route()
+        self.start_column_width_pass()
 
-            else:
-                # Generic CSV import - check if it's a fleet carrier route with Icy Ring/Pristine
-                has_icy_ring_in_file = has_field('Icy Ring')
-                has_pristine_in_file = has_field('Pristine')
-                if has_icy_ring_in_file or has_pristine_in_file:
-                    self.fleetcarrier = True
-                
-                # Check if Fuel Used column exists
-                self.has_fuel_used = has_field('Fuel Used')
-                
-                for row in route_reader:
-                    if row not in (None, "", []):
-                        # Store full row data (all columns) - preserve everything
-                        full_row_data = {}
-                        for field_name in fieldnames:
-                            field_value = get_field(row, field_name, '')
-                            # Round distance values if present
-                            if field_name.lower() in ["distance to arrival", "distance remaining", "distance"]:
-                                if field_value:
-                                    try:
-                                        val = float(field_value)
-                                        rounded_val = math.ceil(val * 100) / 100
-                                        field_value = f"{rounded_val:.2f}"
-                                    except (ValueError, TypeError):
-                                        pass
-                            full_row_data[field_name.lower()] = field_value
-                        self.route_full_data.append(full_row_data)
-                        
-                        # Store minimal route data for route planner
-                        system = get_field(row, self.system_header, "")
-                        
-                        # For fleet carrier routes, use the new format
-                        if self.fleetcarrier:
-                            # Fleet Carrier format: [System Name, Distance, Distance Remaining, Tritium in tank, Tritium in market, Fuel Used, Icy Ring, Pristine, Restock Tritium]
-                            dist_to_arrival, dist_remaining = get_distance_fields(row)
-                            route_entry = [
-                                system,                                            # 0: System Name
-                                dist_to_arrival if dist_to_arrival else "",        # 1: Distance
-                                dist_remaining if dist_remaining else "",          # 2: Distance Remaining
-                                get_field(row, 'Tritium in tank', ''),            # 3: Tritium in tank
-                                get_field(row, 'Tritium in market', ''),          # 4: Tritium in market
-                            ]
-                            
-                            # Add Fuel Used if present (round UP to nearest hundredth)
-                            if self.has_fuel_used:
-                                fuel_used_raw = get_field(row, 'Fuel Used', '')
-                                if fuel_used_raw:
-                                    try:
-                                        val = float(fuel_used_raw)
-                                        rounded_val = math.ceil(val * 100) / 100
-                                        route_entry.append(f"{rounded_val:.2f}")   # 5: Fuel Used
-                                    except (ValueError, TypeError):
-                                        route_entry.append(fuel_used_raw)
-                                else:
-                                    route_entry.append('')
-                            else:
-                                route_entry.append('')  # 5: Fuel Used placeholder
-                            
-                            # Add Icy Ring and Pristine if present
-                            if has_icy_ring_in_file:
-                                route_entry.append(get_field(row, 'Icy Ring', ''))  # 6: Icy Ring
-                            else:
-                                route_entry.append('')
-                            
-                            if has_pristine_in_file:
-                                route_entry.append(get_field(row, 'Pristine', ''))  # 7: Pristine
-                            else:
-                                route_entry.append('')
-                            
-                            route_entry.append(get_field(row, self.restocktritium_header, ''))  # 8: Restock Tritium
-                            
-                            self.route.append(route_entry)
-                            self.jumps_left += 1
-                        else:
-                            # Generic route format: [System, Jumps, Fuel Used?, ...]
-                            jumps = get_field(row, self.jumps_header, "")
-                            route_entry = [system, jumps]
-                            
-                            # Add Fuel Used if present (round UP to nearest hundredth)
-                            if self.has_fuel_used:
-                                fuel_used_raw = get_field(row, 'Fuel Used', '')
-                                if fuel_used_raw:
-                                    try:
-                                        val = float(fuel_used_raw)
-                                        rounded_val = math.ceil(val * 100) / 100
-                                        route_entry.append(f"{rounded_val:.2f}")
-                                    except (ValueError, TypeError):
-                                        route_entry.append(fuel_used_raw)
-                                else:
-                                    route_entry.append('')
-                            
-                            self.route.append(route_entry)
-                            try:
-                                self.jumps_left += int(jumps) if jumps else 0
-                            except (ValueError, TypeError):
-                                pass
+    def _plot_spansh_leg(self, source, dest, efficiency, range_ly, supercharge_multiplier,
+                         cancel_event, on_progress):
+        """
+        Worker: submit one source -> dest route job to Spansh and wait for its waypoints.
 
-            if self.route:
-                # Find where we are in the route based on current system location
-                self.offset = self.find_current_waypoint_in_route()
-                
-                self.next_stop = self.route[self.offset][0]
-                self.update_bodies_text()  # Update bodies text for Road to Riches routes
-                self.compute_distances()
-                self.update_gui()
-                # Check fleet carrier restock warning
-                if self.fleetcarrier and hasattr(self, 'check_fleet_carrier_restock_warning'):
-                    self.check_fleet_carrier_restock_warning()
+        Args:
+            source: Starting system of the leg
+            dest: Finishing system of the leg
+            efficiency: Efficiency slider value
+            range_ly: Jump range
+            supercharge_multiplier: 4, or 6 with overcharge
+            cancel_event: Set to abandon the leg
+            on_progress: Passed to wait_for_spansh_job
 
-    def _run_plot_route_worker(self, source, dest, efficiency, range_ly, supercharge_multiplier):
-        """Worker: run Spansh HTTP + poll + parse off main thread, put result in queue."""
-        def put_error(err, source_red=False, dest_red=False):
-            self._route_queue.put({
-                'ok': False, 'error': err, 'source_red': source_red, 'dest_red': dest_red,
-            })
+        Returns:
+            {'ok': True, 'system_jumps': [...]}, {'ok': False, 'error': ..., 'source_red': ...,
+            'dest_red': ...}, or None if the leg was cancelled
+        """
+        def leg_error(err, source_red=False, dest_red=False):
+            return {'ok': False, 'error': err, 'source_red': source_red, 'dest_red': dest_red}
 
+        if cancel_event.is_set():
+            return None
         try:
             job_url = "https://spansh.co.uk/api/route?"
-            session = timeout_session.new_session()
-            session.headers['User-Agent'] = user_agent + ' GalaxyGPS'
             try:
-                results = session.post(
+                results = http_client.post(
                     job_url,
                     params={
                         "efficiency": efficiency,
@@ -2810,8 +2753,7 @@ class GalaxyGPS():
                 )
             except Exception as e:
                 logger.warning(f"Failed to submit route query: {e}")
-                put_error(self.plot_error)
-                return
+                return leg_error(self.plot_error)
 
             if results.status_code != 202:
                 logger.warning(
@@ -2825,103 +2767,48 @@ class GalaxyGPS():
                 err = failure.get("error", self.plot_error) if results.status_code == 400 else self.plot_error
                 source_red = bool(results.status_code == 400 and "error" in failure and "starting system" in failure["error"])
                 dest_red = bool(results.status_code == 400 and "error" in failure and "finishing system" in failure["error"])
-                put_error(err, source_red, dest_red)
-                return
+                return leg_error(err, source_red, dest_red)
 
             try:
                 response = json.loads(results.content)
             except (json.JSONDecodeError, ValueError) as e:
                 logger.warning(f"Failed to parse Spansh response: {e}")
-                put_error("Invalid response from Spansh. Please try again.")
-                return
+                return leg_error("Invalid response from Spansh. Please try again.")
 
             job = response.get("job")
             if not job:
                 logger.warning("No job ID in Spansh response")
-                put_error("Failed to start route calculation. Please try again.")
-                return
-
-            tries = 0
-            route_response = None
-            while tries < 20:
-                try:
-                    route_response = session.get(
-                        f"https://spansh.co.uk/api/results/{job}",
-                        timeout=5,
-                    )
-                except (requests.RequestException, requests.Timeout) as e:
-                    logger.warning(f"Error polling Spansh results: {e}")
-                    route_response = None
-                    break
-                if route_response.status_code != 202:
-                    break
-                tries += 1
-                sleep(1)
+                return leg_error("Failed to start route calculation. Please try again.")
 
-            if not route_response:
-                logger.warning("Query to Spansh timed out")
-                put_error("The query to Spansh timed out. Please try again.")
-                return
+            if cancel_event.is_set():
+                return None
+            try:
+                route_response = wait_for_spansh_job(job, cancel_event, on_progress=on_progress)
+            except SpanshJobCancelled:
+                logger.info(f"Route calculation cancelled (Spansh job {job})")
+                return None
+            except SpanshJobTimeout as e:
+                logger.warning(f"Query to Spansh timed out: {e}")
+                return leg_error("The query to Spansh timed out. Please try again.")
+            except requests.RequestException as e:
+                logger.warning(f"Error polling Spansh results: {e}")
+                return leg_error("The query to Spansh timed out. Please try again.")
 
             if route_response.status_code == 200:
                 try:
                     response_data = json.loads(route_response.content)
                     if "result" not in response_data or "system_jumps" not in response_data["result"]:
                         logger.warning(f"Unexpected Spansh response structure: {response_data}")
-                        put_error("Invalid route data from Spansh. Please try again.")
-                        return
+                        return leg_error("Invalid route data from Spansh. Please try again.")
                     route = response_data["result"]["system_jumps"]
                 except (json.JSONDecodeError, ValueError, KeyError) as e:
                     logger.warning(f"Invalid data from Spansh: {e}")
-                    put_error(self.plot_error)
-                    return
+                    return leg_error(self.plot_error)
 
                 if not route or len(route) == 0:
                     logger.warning("Empty route returned from Spansh")
-                    put_error("No route found between the specified systems.")
-                    return
-
-                route_rows = []
-                route_full_data = []
-                route_fieldnames = ['System Name', 'Jumps', 'Distance To Arrival', 'Distance Remaining']
-                jumps_left = 0
-                for waypoint in route:
-                    system = waypoint.get("system", "")
-                    jumps = waypoint.get("jumps", 0)
-                    distance_to_arrival = _round_distance(waypoint.get("distance_jumped", ""))
-                    distance_remaining = _round_distance(waypoint.get("distance_left", ""))
-                    route_rows.append([system, str(jumps), distance_to_arrival, distance_remaining])
-                    full_row_data = {
-                        'system name': system,
-                        'jumps': str(jumps),
-                        'distance to arrival': distance_to_arrival,
-                        'distance remaining': distance_remaining,
-                    }
-                    for key, value in waypoint.items():
-                        if key not in ['system', 'jumps', 'distance_jumped', 'distance_left']:
-                            field_name = key.lower().replace('_', ' ')
-                            full_row_data[field_name] = str(value) if value else ''
-                            display_name = key.replace('_', ' ').title()
-                            if display_name not in route_fieldnames:
-                                route_fieldnames.append(display_name)
-                    route_full_data.append(full_row_data)
-                    try:
-                        jumps_left += int(jumps)
-                    except (ValueError, TypeError):
-                        pass
-
-                if len(route_rows) == 0:
-                    put_error("Failed to process route data. Please try again.")
-                    return
-
-                self._route_queue.put({
-                    'ok': True,
-                    'route': route_rows,
-                    'route_full_data': route_full_data,
-                    'route_fieldnames': route_fieldnames,
-                    'jumps_left': jumps_left,
-                })
-                return
+                    return leg_error("No route found between the specified systems.")
+                return {'ok': True, 'system_jumps': route}
 
             logger.warning(
                 f"Failed final route fetch: {route_response.status_code}; "
@@ -2937,27 +2824,152 @@ class GalaxyGPS():
                 err = failure["error"]
                 source_red = "starting system" in failure["error"]
                 dest_red = "finishing system" in failure["error"]
-            put_error(err, source_red, dest_red)
+            return leg_error(err, source_red, dest_red)
 
         except Exception:
             logger.warning('!! ' + traceback.format_exc(), exc_info=False)
+            return leg_error(self.plot_error)
+
+    def _run_plot_route_worker(self, stops, efficiency, range_ly, supercharge_multiplier,
+                               result_queue, cancel_event):
+        """
+        Worker: plot the route through stops off main thread, put result in queue.
+
+        Each pair of consecutive stops is a leg plotted as its own Spansh job; up to
+        PLOT_LEG_CONCURRENCY jobs run at once and the legs are stitched into one route,
+        so a route with several intermediate systems takes about as long as its slowest leg.
+        The first leg that fails cancels the others.
+        Progress messages ({'progress': seconds}) are queued while Spansh works on the jobs;
+        nothing more is queued once cancel_event is set.
+        """
+        def put_error(err, red_stops=()):
+            last = len(stops) - 1
+            result_queue.put({
+                'ok': False, 'error': err,
+                'source_red': 0 in red_stops,
+                'via_red': any(0 < index < last for index in red_stops),
+                'dest_red': last in red_stops,
+            })
+
+        legs = list(zip(stops, stops[1:]))
+        started = time.monotonic()
+        legs_done = 0
+
+        def on_progress(_elapsed, status):
+            message = {'progress': time.monotonic() - started, 'status': status}
+            if len(legs) > 1:
+                message['legs'] = (legs_done, len(legs))
+            result_queue.put(message)
+
+        # Set when the user cancels or a leg fails; cancel_event itself only belongs to the UI
+        legs_cancel = threading.Event()
+        leg_results = [None] * len(legs)
+        try:
+            with ThreadPoolExecutor(max_workers=min(PLOT_LEG_CONCURRENCY, len(legs)),
+                                    thread_name_prefix="GalaxyGPSPlotLeg") as pool:
+                futures = {
+                    pool.submit(self._plot_spansh_leg, leg_source, leg_dest, efficiency, range_ly,
+                                supercharge_multiplier, legs_cancel, on_progress): index
+                    for index, (leg_source, leg_dest) in enumerate(legs)
+                }
+                pending = set(futures)
+                while pending:
+                    done, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                    if cancel_event.is_set():
+                        legs_cancel.set()
+                        for future in pending:
+                            future.cancel()
+                        return
+                    for future in done:
+                        index = futures[future]
+                        leg = future.result()
+                        if leg is None or not leg['ok']:
+                            legs_cancel.set()
+                            for other in pending:
+                                other.cancel()
+                            if leg is None:
+                                put_error(self.plot_error)
+                                return
+                            if len(legs) > 1:
+                                logger.warning(f"Leg {index + 1} of {len(legs)} ({legs[index][0]} -> {legs[index][1]}) failed")
+                            red_stops = []
+                            if leg.get('source_red'):
+                                red_stops.append(index)
+                            if leg.get('dest_red'):
+                                red_stops.append(index + 1)
+                            put_error(leg['error'], red_stops)
+                            return
+                        leg_results[index] = leg['system_jumps']
+                        legs_done += 1
+
+            route = _stitch_route_legs(leg_results)
+            route_rows = []
+            route_full_data = []
+            route_fieldnames = ['System Name', 'Jumps', 'Distance To Arrival', 'Distance Remaining']
+            for waypoint in route:
+                system = waypoint.get("system", "")
+                jumps = waypoint.get("jumps", 0)
+                distance_to_arrival = _round_distance(waypoint.get("distance_jumped", ""))
+                distance_remaining = _round_distance(waypoint.get("distance_left", ""))
+                route_rows.append([system, str(jumps), distance_to_arrival, distance_remaining])
+                full_row_data = {
+                    'system name': system,
+                    'jumps': str(jumps),
+                    'distance to arrival': distance_to_arrival,
+                    'distance remaining': distance_remaining,
+                }
+                for key, value in waypoint.items():
+                    if key not in ['system', 'jumps', 'distance_jumped', 'distance_left']:
+                        field_name = key.lower().replace('_', ' ')
+                        full_row_data[field_name] = str(value) if value else ''
+                        display_name = key.replace('_', ' ').title()
+                        if display_name not in route_fieldnames:
+                            route_fieldnames.append(display_name)
+                route_full_data.append(full_row_data)
+
+            if len(route_rows) == 0:
+                put_error("Failed to process route data. Please try again.")
+                return
+
+            result_queue.put({
+                'ok': True,
+                'route': route_rows,
+                'route_full_data': route_full_data,
+                'route_fieldnames': route_fieldnames,
+            })
+
+        except Exception:
+            logger.warning('!! ' + traceback.format_exc(), exc_info=False)
+            legs_cancel.set()
             put_error(self.plot_error)
 
-    def _poll_route_result(self):
+    def _poll_route_result(self, result_queue, cancel_event):
         """Main-thread polling: when worker puts result, apply it and update UI."""
         if getattr(config, 'shutting_down', False):
             return
+        if cancel_event.is_set():
+            # Cancelled from the UI (already re-enabled); whatever the worker still sends is dropped
+            return
+        r = None
         try:
-            r = self._route_queue.get_nowait()
+            while r is None:
+                message = result_queue.get_nowait()
+                if 'progress' in message:
+                    self._show_plot_progress(message['progress'], message.get('status', ''), message.get('legs'))
+                else:
+                    r = message
         except queue.Empty:
-            self.frame.after(200, self._poll_route_result)
+            self.frame.after(200, lambda: self._poll_route_result(result_queue, cancel_event))
             return
 
+        self._plot_cancel = None
         self.enable_plot_gui(True)
         if not r['ok']:
             self.show_error(r['error'])
             if r.get('source_red') and hasattr(self, 'source_ac'):
                 self.source_ac["fg"] = "red"
+            if r.get('via_red') and hasattr(self, 'via_entry'):
+                self.via_entry["fg"] = "red"
             if r.get('dest_red') and hasattr(self, 'dest_ac'):
                 self.dest_ac["fg"] = "red"
             return
@@ -2966,7 +2978,8 @@ class GalaxyGPS():
         self.route = r['route']
         self.route_full_data = r['route_full_data']
         self.route_fieldnames = r['route_fieldnames']
-        self.jumps_left = r['jumps_left']
+        self._route_dirty = True
+        self.compile_route()
 
         self.show_plot_gui(False)
         current_system = monitor.state.get('SystemName') if monitor and hasattr(monitor, 'state') else None
@@ -2983,12 +2996,38 @@ class GalaxyGPS():
         if self.fleetcarrier and hasattr(self, 'check_fleet_carrier_restock_warning'):
             self.check_fleet_carrier_restock_warning()
         self.save_all_route()
+        self.start_column_width_pass()
         logger.info(f"Route calculated successfully: {len(self.route)} waypoints")
 
+    def _show_plot_progress(self, elapsed, status, legs=None):
+        """Show how long Spansh has been working on the route (and legs finished) on the Calculate button."""
+        try:
+            # LANG: Button text during route calculation, with seconds elapsed
+            text = plugin_tl("Computing... {SECONDS}s").format(SECONDS=int(elapsed))
+            if legs:
+                # LANG: Appended to the route calculation button text: legs of a route with intermediate systems finished
+                text += " " + plugin_tl("({DONE}/{TOTAL} legs)").format(DONE=legs[0], TOTAL=legs[1])
+            elif status:
+                text += f" ({status})"
+            self.plot_route_btn.config(text=text)
+        except Exception:
+            pass  # Plot GUI gone
+
+    def cancel_plot_route(self):
+        """Cancel button: abort the route calculation in progress, or close the plot GUI."""
+        if self._plot_cancel is None:
+            self.show_plot_gui(False)
+            return
+        self._plot_cancel.set()
+        self._plot_cancel = None
+        logger.info("Route calculation cancelled by user")
+        self.enable_plot_gui(True)
+
     def plot_route(self):
         self.hide_error()
         source = self.source_ac.get().strip()
         dest = self.dest_ac.get().strip()
+        via = self.via_entry.get().strip()
         efficiency = self.efficiency_slider.get()
 
         self.source_ac.hide_list()
@@ -3001,6 +3040,16 @@ class GalaxyGPS():
             # LANG: Warning when destination system is missing in route planner
             self.show_error(plugin_tl("Please provide a destination system."))
             return
+        if via == self.via_entry.placeholder:
+            via = ""
+        # Source, intermediate systems and destination; a system repeated back to back is one stop
+        stops = []
+        for system in [source] + via.split(PLOT_VIA_SEPARATOR) + [dest]:
+            system = system.strip()
+            if system and (not stops or stops[-1].lower() != system.lower()):
+                stops.append(system)
+        if len(stops) < 2:
+            stops = [source, dest]
         try:
             range_ly = float(self.range_entry.get())
         except ValueError:
@@ -3009,12 +3058,16 @@ class GalaxyGPS():
 
         supercharge_multiplier = 6 if self.supercharge_overcharge.get() else 4
         self.enable_plot_gui(False)
+        # Each calculation gets its own queue and cancel event, so a cancelled one cannot deliver late
+        result_queue = queue.Queue()
+        cancel_event = threading.Event()
+        self._plot_cancel = cancel_event
         threading.Thread(
             target=self._run_plot_route_worker,
-            args=(source, dest, efficiency, range_ly, supercharge_multiplier),
+            args=(stops, efficiency, range_ly, supercharge_multiplier, result_queue, cancel_event),
             daemon=True,
         ).start()
-        self.frame.after(200, self._poll_route_result)
+        self.frame.after(200, lambda: self._poll_route_result(result_queue, cancel_event))
 
     def plot_edts(self, filename):
         try:
@@ -3025,7 +3078,6 @@ class GalaxyGPS():
                     if row not in (None, "", []):
                         if row.lstrip().startswith('==='):
                             jumps = int(re.findall(r"\d+ jump", row)[0].rstrip(' jumps'))
-                            self.jumps_left += jumps
 
                             system = row[row.find('>') + 1:]
                             if ',' in system:
@@ -3033,9 +3085,9 @@ class GalaxyGPS():
                                 for system in systems:
                                     self.route.append([system.strip(), jumps])
                                     jumps = 1
-                                    self.jumps_left += jumps
                             else:
                                 self.route.append([system.strip(), jumps])
+                self.compile_route()
         except Exception:
             logger.warning('!! ' + traceback.format_exc(), exc_info=False)
             self.enable_plot_gui(True)
@@ -3073,12 +3125,16 @@ class GalaxyGPS():
             self.route_full_data = []  # Clear full CSV data
             self.route_fieldnames = []  # Clear fieldnames
             self.next_waypoint = ""
-            self.jumps_left = 0
+            self.route_model = None
             self.roadtoriches = False
             self.fleetcarrier = False
             self.galaxy = False
             self.neutron = False
             self.original_csv_path = None  # Clear original CSV path reference
+            # Stop any streaming CSV import still feeding the old route
+            if self._csv_import_cancel is not None:
+                self._csv_import_cancel.set()
+                self._csv_import_cancel = None
             try:
                 os.remove(self.save_route_path)
             except (IOError, OSError):
@@ -3087,30 +3143,90 @@ class GalaxyGPS():
                 os.remove(self.offset_file_path)
             except (IOError, OSError):
                 logger.debug("No offset file to delete")
+            remove_route_cache(self.route_cache_path)
+            remove_route_cache(self.route_widths_path)
+            self._saved_offset = None
+            self._route_dirty = True
 
             self.update_gui()
 
+    def _save_route_cache(self):
+        """Write the binary route cache matching the route.csv that was just written."""
+        state = {
+            'route': self.route,
+            'route_full_data': self.route_full_data,
+            'route_fieldnames': self.route_fieldnames,
+            'roadtoriches': self.roadtoriches,
+            'fleetcarrier': self.fleetcarrier,
+            'galaxy': self.galaxy,
+            'neutron': self.neutron,
+            'has_fuel_used': self.has_fuel_used,
+            'offset': self.offset,
+            'route_model': self._get_route_model(),
+        }
+        save_route_cache(self.route_cache_path, self.save_route_path, state, str(self.plugin_version))
+
+    def _load_route_cache(self):
+        """
+        Restore the route from the binary route cache if it matches route.csv.
+
+        Returns:
+            True if the route was restored from the cache
+        """
+        state = load_route_cache(self.route_cache_path, self.save_route_path, str(self.plugin_version))
+        if not state or not state.get('route'):
+            return False
+
+        try:
+            self.route = state['route']
+            self.route_full_data = state['route_full_data']
+            self.route_fieldnames = state['route_fieldnames']
+            self.roadtoriches = state['roadtoriches']
+            self.fleetcarrier = state['fleetcarrier']
+            self.galaxy = state['galaxy']
+            self.neutron = state['neutron']
+            self.has_fuel_used = state['has_fuel_used']
+            self.offset = state['offset']
+            self.route_model = state['route_model']
+        except (KeyError, TypeError):
+            logger.warning('!! ' + traceback.format_exc(), exc_info=False)
+            self.clear_route(False)
+            return False
+
+        logger.debug(f"Restored route from cache: {len(self.route)} waypoints")
+        return True
+
     def save_all_route(self):
         self.save_route()
         self.save_offset()
 
     def save_route(self):
         """
-        Save route to CSV cache file.
-        Uses route_full_data if available to preserve ALL original columns,
-        otherwise falls back to saving self.route with appropriate headers.
+        Save route to CSV cache file, then refresh the binary route cache for it.
         """
         if len(self.route) == 0:
             try:
                 os.remove(self.save_route_path)
             except (IOError, OSError):
                 pass
+            remove_route_cache(self.route_cache_path)
+            remove_route_cache(self.route_widths_path)
             return
 
+        self._write_route_csv()
+        self._route_dirty = False
+        self._save_route_cache()
+
+    def _write_route_csv(self):
+        """
+        Write route.csv.
+        Uses route_full_data if available to preserve ALL original columns,
+        otherwise falls back to saving self.route with appropriate headers.
+        """
         try:
             # PRIORITY 1: Use route_full_data if available (preserves ALL original columns)
             if self.route_full_data and len(self.route_full_data) > 0 and self.route_fieldnames:
-                with open(self.save_route_path, 'w', encoding='utf-8-sig', newline='') as csvfile:
+                with atomic_open(self.save_route_path, 'w', encoding='utf-8-sig', newline='') as csvfile:
                     writer = csv.DictWriter(csvfile, fieldnames=self.route_fieldnames)
                     writer.writeheader()
                     for row_data in self.route_full_data:
@@ -3133,7 +3249,7 @@ class GalaxyGPS():
                     self.bodyname_header,
                     self.bodysubtype_header
                 ]
-                with open(self.save_route_path, 'w', newline='') as csvfile:
+                with atomic_open(self.save_route_path, 'w', newline='') as csvfile:
                     writer = csv.writer(csvfile)
                     writer.writerow(fieldnames)
                     writer.writerows(self.route)
@@ -3157,7 +3273,7 @@ class GalaxyGPS():
                 if has_pristine_in_route:
                     fieldnames.append("Pristine")
                 
-                with open(self.save_route_path, 'w', newline='') as csvfile:
+                with atomic_open(self.save_route_path, 'w', newline='') as csvfile:
                     writer = csv.writer(csvfile)
                     writer.writerow(fieldnames)
                     for row in self.route:
@@ -3183,7 +3299,7 @@ class GalaxyGPS():
                     "Distance To Arrival",
                     "Distance Remaining"
                 ]
-                with open(self.save_route_path, 'w', newline='') as csvfile:
+                with atomic_open(self.save_route_path, 'w', newline='') as csvfile:
                     writer = csv.writer(csvfile)
                     writer.writerow(fieldnames)
                     for row in self.route:
@@ -3219,7 +3335,7 @@ class GalaxyGPS():
                         "Distance Remaining"
                     ]
                 
-                with open(self.save_route_path, 'w', newline='') as csvfile:
+                with atomic_open(self.save_route_path, 'w', newline='') as csvfile:
                     writer = csv.writer(csvfile)
                     writer.writerow(fieldnames)
                     writer.writerows(self.route)
@@ -3234,7 +3350,7 @@ class GalaxyGPS():
                     "Neutron Star",
                     "Jumps"
                 ]
-                with open(self.save_route_path, 'w', newline='') as csvfile:
+                with atomic_open(self.save_route_path, 'w', newline='') as csvfile:
                     writer = csv.writer(csvfile)
                     writer.writerow(fieldnames)
                     for row in self.route:
@@ -3248,7 +3364,7 @@ class GalaxyGPS():
                 return
 
             # --- Fallback ---
-            with open(self.save_route_path, 'w', newline='') as csvfile:
+            with atomic_open(self.save_route_path, 'w', newline='') as csvfile:
                 writer = csv.writer(csvfile)
                 writer.writerow([self.system_header, self.jumps_header])
                 writer.writerows(self.route)
@@ -3257,11 +3373,58 @@ class GalaxyGPS():
             logger.warning('!! ' + traceback.format_exc(), exc_info=False)
 
 
+    def schedule_offset_save(self):
+        """
+        Save the offset after a short quiet period.
+        Repeated calls (e.g. several waypoint changes in a row) are coalesced into one write.
+        """
+        if not self.parent:
+            self.save_offset()
+            return
+        try:
+            if self._offset_save_after_id is not None:
+                self.parent.after_cancel(self._offset_save_after_id)
+            self._offset_save_after_id = self.parent.after(OFFSET_SAVE_DEBOUNCE_MS, self.save_offset)
+        except Exception:
+            self.save_offset()
+
+    def flush_route_persistence(self):
+        """
+        Write pending route state to disk (called at plugin_stop).
+        The route itself is only rewritten if it changed since the last save.
+        A streaming CSV import still in progress is cancelled and nothing is written,
+        so a partially imported route never replaces route.csv.
+        """
+        if self._csv_import_cancel is not None:
+            self._csv_import_cancel.set()
+            self._csv_import_cancel = None
+            logger.info("Route import interrupted by shutdown, partial route not saved")
+            return
+        if self._route_dirty:
+            self.save_route()
+        self.save_offset()
+
     def save_offset(self):
+        # A direct save supersedes any pending debounced save
+        if self._offset_save_after_id is not None:
+            try:
+                if self.parent:
+                    self.parent.after_cancel(self._offset_save_after_id)
+            except Exception:
+                pass
+            self._offset_save_after_id = None
+
         if len(self.route) != 0:
-            with open(self.offset_file_path, 'w') as offset_fh:
-                offset_fh.write(str(self.offset))
+            if self._saved_offset == self.offset and os.path.exists(self.offset_file_path):
+                return
+            try:
+                with atomic_open(self.offset_file_path, 'w') as offset_fh:
+                    offset_fh.write(str(self.offset))
+                self._saved_offset = self.offset
+            except (IOError, OSError):
+                logger.warning('!! ' + traceback.format_exc(), exc_info=False)
         else:
+            self._saved_offset = None
             try:
                 os.remove(self.offset_file_path)
             except (IOError, OSError):
@@ -3416,9 +3579,7 @@ class GalaxyGPS():
         self.cleanup_old_version()
         version_url = f"https://raw.githubusercontent.com/{github_repo}/{github_branch}/version.json"
         try:
-            session = timeout_session.new_session()
-            session.headers['User-Agent'] = user_agent + ' GalaxyGPS'
-            response = session.get(version_url, timeout=2)
+            response = http_client.get(version_url, timeout=2)
             if response.status_code == 200:
                 remote_version_content = response.text.strip()
                 try:
@@ -3465,6 +3626,67 @@ class GalaxyGPS():
             return self.fleet_carrier_manager.get_all_carriers()
         return []
     
+    def request_fleet_carrier_refresh(self, *panels: str):
+        """
+        Mark fleet carrier panel parts for refresh.
+
+        All requests made before Tk goes idle are coalesced into one refresh pass, so a burst
+        of carrier events or a dropdown update repaints each widget once.
+
+        Args:
+            *panels: Parts to refresh, any of FLEET_CARRIER_PANELS; none means all of them
+        """
+        self._fc_dirty_panels.update(panels or FLEET_CARRIER_PANELS)
+        if self._fc_refresh_after_id is not None or not self.parent:
+            # A pass is already scheduled or running, or the GUI is not built yet (init_gui requests one)
+            return
+        try:
+            self._fc_refresh_after_id = self.parent.after_idle(self._run_fleet_carrier_refresh)
+        except Exception:
+            logger.warning('!! Error scheduling fleet carrier refresh: ' + traceback.format_exc(), exc_info=False)
+
+    def _run_fleet_carrier_refresh(self):
+        """Refresh every dirty fleet carrier panel part once, dropdown first."""
+        if getattr(config, 'shutting_down', False):
+            self._fc_dirty_panels.clear()
+            self._fc_refresh_after_id = None
+            return
+        refreshers = {
+            'dropdown': self.update_fleet_carrier_dropdown,
+            'system': self.update_fleet_carrier_system_display,
+            'rings': self.update_fleet_carrier_rings_status,
+            'tritium': self.update_fleet_carrier_tritium_display,
+            'balance': self.update_fleet_carrier_balance_display,
+            'restock': self.check_fleet_carrier_restock_warning,
+        }
+        try:
+            # Refreshers run earlier in the pass (dropdown, carrier selection) may request later
+            # ones; _fc_refresh_after_id stays set so those land in this pass instead of a new one
+            for panel in FLEET_CARRIER_PANELS:
+                if panel not in self._fc_dirty_panels:
+                    continue
+                self._fc_dirty_panels.discard(panel)
+                try:
+                    refreshers[panel]()
+                except Exception:
+                    logger.warning(f'!! Error refreshing fleet carrier {panel}: ' + traceback.format_exc(), exc_info=False)
+        finally:
+            self._fc_refresh_after_id = None
+            if self._fc_dirty_panels:
+                # Requested after its turn in the pass (e.g. the dropdown re-requested by a refresher)
+                self.request_fleet_carrier_refresh(*self._fc_dirty_panels)
+
+    def get_most_recent_fleet_carrier(self):
+        """
+        Get the most recently updated fleet carrier.
+        
+        Returns:
+            Carrier dictionary or None
+        """
+        if self.fleet_carrier_manager:
+            return self.fleet_carrier_manager.get_most_recent_carrier()
+        return None
+    
     def update_fleet_carrier_dropdown(self):
         """
         Update the fleet carrier dropdown with available carriers.
@@ -3498,14 +3720,7 @@ class GalaxyGPS():
                     else:
                         # Already have a selection: refresh display data for current selection
                         # This ensures system and balance update after CAPI refresh
-                        if hasattr(self, 'update_fleet_carrier_system_display'):
-                            self.update_fleet_carrier_system_display()
-                        if hasattr(self, 'update_fleet_carrier_balance_display'):
-                            self.update_fleet_carrier_balance_display()
-                        if hasattr(self, 'update_fleet_carrier_tritium_display'):
-                            self.update_fleet_carrier_tritium_display()
-                        if hasattr(self, 'update_fleet_carrier_rings_status'):
-                            self.update_fleet_carrier_rings_status()
+                        self.request_fleet_carrier_refresh('system', 'balance', 'tritium', 'rings')
                     # Enable Inara button if carrier is selected
                     if self.fleet_carrier_inara_btn:
                         self.fleet_carrier_inara_btn.config(state=tk.NORMAL)
@@ -3516,10 +3731,7 @@ class GalaxyGPS():
                 if self.fleet_carrier_inara_btn:
                     self.fleet_carrier_inara_btn.config(state=tk.DISABLED)
                 # Set displays to Unknown when no data
-                if hasattr(self, 'update_fleet_carrier_system_display'):
-                    self.update_fleet_carrier_system_display()
-                if hasattr(self, 'update_fleet_carrier_balance_display'):
-                    self.update_fleet_carrier_balance_display()
+                self.request_fleet_carrier_refresh('system', 'balance')
         except Exception:
             logger.warning('!! Error updating fleet carrier dropdown: ' + traceback.format_exc(), exc_info=False)
             self.fleet_carrier_combobox['values'] = ["Error loading carrier data"]
@@ -3537,14 +3749,7 @@ class GalaxyGPS():
                 if self.fleet_carrier_inara_btn:
                     self.fleet_carrier_inara_btn.config(state=tk.DISABLED)
                 # Update warning check and system display
-                if hasattr(self, 'check_fleet_carrier_restock_warning'):
-                    self.check_fleet_carrier_restock_warning()
-                if hasattr(self, 'update_fleet_carrier_system_display'):
-                    self.update_fleet_carrier_system_display()
-                if hasattr(self, 'update_fleet_carrier_rings_status'):
-                    self.update_fleet_carrier_rings_status()
-                if hasattr(self, 'update_fleet_carrier_balance_display'):
-                    self.update_fleet_carrier_balance_display()
+                self.request_fleet_carrier_refresh('restock', 'system', 'rings', 'balance')
                 return
             
             # Extract callsign from selection (format: "Name (CALLSIGN) | System | ...")
@@ -3569,17 +3774,8 @@ class GalaxyGPS():
             if self.fleet_carrier_inara_btn and self.selected_carrier_callsign:
                 self.fleet_carrier_inara_btn.config(state=tk.NORMAL)
             
-                # Update warning check, system display, rings status, Tritium display, and balance display when carrier selection changes
-            if hasattr(self, 'check_fleet_carrier_restock_warning'):
-                self.check_fleet_carrier_restock_warning()
-            if hasattr(self, 'update_fleet_carrier_system_display'):
-                self.update_fleet_carrier_system_display()
-            if hasattr(self, 'update_fleet_carrier_rings_status'):
-                self.update_fleet_carrier_rings_status()
-            if hasattr(self, 'update_fleet_carrier_tritium_display'):
-                self.update_fleet_carrier_tritium_display()
-            if hasattr(self, 'update_fleet_carrier_balance_display'):
-                self.update_fleet_carrier_balance_display()
+            # Update warning check, system display, rings status, Tritium display, and balance display when carrier selection changes
+            self.request_fleet_carrier_refresh('restock', 'system', 'rings', 'tritium', 'balance')
         except Exception:
             logger.warning('!! Error handling carrier selection: ' + traceback.format_exc(), exc_info=False)
     
@@ -3768,14 +3964,9 @@ class GalaxyGPS():
             
             # If no carrier selected, try to get the first/primary carrier
             if not carrier_system:
-                carriers = self.get_all_fleet_carriers()
-                if carriers:
-                    sorted_carriers = sorted(
-                        carriers,
-                        key=lambda x: x.get('last_updated', ''),
-                        reverse=True
-                    )
-                    carrier_system = sorted_carriers[0].get('current_system', '').strip()
+                carrier = self.get_most_recent_fleet_carrier()
+                if carrier:
+                    carrier_system = carrier.get('current_system', '').strip()
             
             if not carrier_system:
                 # LANG: Warning when carrier system unknown
@@ -3827,10 +4018,8 @@ class GalaxyGPS():
             
             if not callsign:
                 # No selection - try to get most recent carrier
-                carriers = self.get_all_fleet_carriers()
-                if carriers:
-                    sorted_carriers = sorted(carriers, key=lambda x: x.get('last_updated', ''), reverse=True)
-                    callsign = sorted_carriers[0].get('callsign', '') if sorted_carriers else None
+                carrier = self.get_most_recent_fleet_carrier()
+                callsign = carrier.get('callsign', '') if carrier else None
             
             if not callsign:
                 self.current_fc_system = None
@@ -3890,18 +4079,7 @@ class GalaxyGPS():
             
             # If no carrier selected, use the most recently updated carrier
             if not carrier:
-                try:
-                    sorted_carriers = sorted(
-                        carriers,
-                        key=lambda x: str(x.get('last_updated', '')),
-                        reverse=True
-                    )
-                    if sorted_carriers:
-                        carrier = sorted_carriers[0]
-                except (KeyError, IndexError, TypeError):
-                    # If sorting fails, just use first carrier
-                    if carriers:
-                        carrier = carriers[0]
+                carrier = self.get_most_recent_fleet_carrier()
             
             # Get carrier's current system
             if carrier:
@@ -3926,45 +4104,67 @@ class GalaxyGPS():
             # LANG: Error opening Inara tritium search
             showerror(self.parent, plugin_tl("Error"), plugin_tl("Failed to open Inara Tritium search."))
     
+    def _fetch_ring_summary(self, system_name):
+        """
+        Query EDSM for the bodies of a system and summarise its rings (called on worker threads).
+
+        Args:
+            system_name: System name
+
+        Returns:
+            Ring summary dict (see parse_ring_summary), or None if EDSM could not be queried
+        """
+        encoded_system = urllib.parse.quote(system_name)
+        url = f"https://www.edsm.net/api-system-v1/bodies?systemName={encoded_system}"
+        try:
+            response = http_client.get(url, timeout=5)
+        except requests.RequestException as e:
+            logger.warning(f'!! Error querying EDSM API for system bodies: {e}')
+            return None
+        if response.status_code != 200:
+            return None
+        return parse_ring_summary(response.json())
+
     def _run_rings_worker(self, callsign, carrier_system, result_queue):
-        """Worker: query EDSM for system bodies (icy/pristine rings) off main thread, put result in queue."""
+        """
+        Worker: query EDSM for system bodies (icy/pristine rings) off main thread, put result in queue.
+        The carrier itself is updated by _poll_rings_result on the main thread.
+        """
         has_icy_rings = False
         has_pristine = False
+        queried = False
         try:
-            encoded_system = urllib.parse.quote(carrier_system)
-            url = f"https://www.edsm.net/api-system-v1/bodies?systemName={encoded_system}"
-            session = timeout_session.new_session()
-            session.headers['User-Agent'] = user_agent + ' GalaxyGPS'
-            response = session.get(url, timeout=5)
-            if response.status_code == 200:
-                system_data = response.json()
-                if 'bodies' in system_data and isinstance(system_data['bodies'], list):
-                    for body in system_data['bodies']:
-                        if 'rings' in body and isinstance(body['rings'], list):
-                            for ring in body['rings']:
-                                ring_type = ring.get('type', '').strip()
-                                reserve_level = ring.get('reserveLevel', '').strip()
-                                if ring_type.lower() == 'icy':
-                                    has_icy_rings = True
-                                    if reserve_level.lower() == 'pristine':
-                                        has_pristine = True
-                                        break
-                            if has_icy_rings and has_pristine:
-                                break
-                if self.fleet_carrier_manager:
-                    self.fleet_carrier_manager.update_rings_status(callsign, has_icy_rings, has_pristine)
-        except requests.RequestException as e:
-            logger.warning(f'!! Error querying EDSM API for system bodies: {e}')
-            has_icy_rings = False
-            has_pristine = False
+            summary = self._fetch_ring_summary(carrier_system)
+            if summary is not None:
+                self.ring_cache.store(carrier_system, summary)
+                has_icy_rings = summary['icy']
+                has_pristine = summary['pristine']
+                queried = True
         except Exception:
             logger.warning('!! Error checking fleet carrier rings status: ' + traceback.format_exc(), exc_info=False)
             has_icy_rings = False
             has_pristine = False
-        result_queue.put({'has_icy_rings': has_icy_rings, 'has_pristine': has_pristine})
+        result_queue.put({
+            'callsign': callsign, 'queried': queried,
+            'has_icy_rings': has_icy_rings, 'has_pristine': has_pristine,
+        })
+
+    def prefetch_route_rings(self):
+        """
+        Look up the rings of the next waypoints of a fleet carrier route in the background,
+        so the Icy Rings / Pristine toggles are known as soon as the carrier arrives.
+        """
+        if not self.fleetcarrier or not self.route:
+            return
+        try:
+            end = min(len(self.route), self.offset + RING_PREFETCH_WAYPOINTS)
+            systems = [self._get_system_name_at_index(idx) for idx in range(max(0, self.offset), end)]
+            self.ring_prefetcher.request(systems)
+        except Exception:
+            logger.warning('!! Error starting rings prefetch: ' + traceback.format_exc(), exc_info=False)
 
     def _poll_rings_result(self, result_queue):
-        """Main-thread polling: when rings worker puts result, update vars and redraw toggles."""
+        """Main-thread polling: when rings worker puts result, store it on the carrier, update vars and redraw toggles."""
         if getattr(config, 'shutting_down', False):
             return
         try:
@@ -3973,6 +4173,9 @@ class GalaxyGPS():
             if hasattr(self, 'frame') and self.frame:
                 self.frame.after(200, lambda: self._poll_rings_result(result_queue))
             return
+        if r['queried'] and self.fleet_carrier_manager:
+            # Carrier indexes and change listeners are only touched on the main thread
+            self.fleet_carrier_manager.update_rings_status(r['callsign'], r['has_icy_rings'], r['has_pristine'])
         self.fleet_carrier_icy_rings_var.set(r['has_icy_rings'])
         self.fleet_carrier_pristine_var.set(r['has_pristine'])
         self._draw_icy_rings_toggle()
@@ -3981,7 +4184,8 @@ class GalaxyGPS():
     def update_fleet_carrier_rings_status(self):
         """
         Update the Icy Rings and Pristine checkboxes from CSV data.
-        Only queries EDSM API if data is missing from CSV (e.g., after system change or initial load).
+        If data is missing from CSV (e.g., after system change or initial load) it is taken from
+        the ring cache, and only queries EDSM API for systems not in the cache.
         Updates are stored back to the CSV managed by FleetCarrierManager.
         Uses the same data source as the "View All" window (CSV data).
         """
@@ -4007,19 +4211,9 @@ class GalaxyGPS():
                         break
             
             if not carrier:
-                try:
-                    sorted_carriers = sorted(
-                        carriers,
-                        key=lambda x: str(x.get('last_updated', '')),
-                        reverse=True
-                    )
-                    if sorted_carriers:
-                        carrier = sorted_carriers[0]
-                        callsign = carrier.get('callsign', '').strip()
-                except (KeyError, IndexError, TypeError):
-                    if carriers:
-                        carrier = carriers[0]
-                        callsign = carrier.get('callsign', '').strip()
+                carrier = self.get_most_recent_fleet_carrier()
+                if carrier:
+                    callsign = carrier.get('callsign', '').strip()
             
             if not carrier or not callsign:
                 self.fleet_carrier_icy_rings_var.set(False)
@@ -4046,8 +4240,16 @@ class GalaxyGPS():
                 has_icy_rings = (icy_rings_stored.lower() == 'yes')
                 has_pristine = (pristine_stored.lower() == 'yes')
             else:
-                need_api_query = True
-                logger.info(f"No stored rings status for carrier {callsign} in system {carrier_system}, querying API")
+                cached = self.ring_cache.lookup(carrier_system)
+                if cached is not None:
+                    # System seen before (by this or another carrier)
+                    has_icy_rings = cached['icy']
+                    has_pristine = cached['pristine']
+                    if self.fleet_carrier_manager:
+                        self.fleet_carrier_manager.update_rings_status(callsign, has_icy_rings, has_pristine)
+                else:
+                    need_api_query = True
+                    logger.info(f"No stored rings status for carrier {callsign} in system {carrier_system}, querying API")
             
             if need_api_query:
                 if not (hasattr(self, 'frame') and self.frame):
@@ -4098,18 +4300,7 @@ class GalaxyGPS():
             
             # If no carrier selected, use the most recently updated carrier
             if not carrier:
-                try:
-                    sorted_carriers = sorted(
-                        carriers,
-                        key=lambda x: str(x.get('last_updated', '')),
-                        reverse=True
-                    )
-                    if sorted_carriers:
-                        carrier = sorted_carriers[0]
-                except (KeyError, IndexError, TypeError):
-                    # If sorting fails, just use first carrier
-                    if carriers:
-                        carrier = carriers[0]
+                carrier = self.get_most_recent_fleet_carrier()
             
             # Get Tritium data from carrier (same logic as "View All" window)
             if carrier:
@@ -4188,10 +4379,8 @@ class GalaxyGPS():
             
             if not callsign:
                 # No selection - try to get most recent carrier
-                carriers = self.get_all_fleet_carriers()
-                if carriers:
-                    sorted_carriers = sorted(carriers, key=lambda x: x.get('last_updated', ''), reverse=True)
-                    callsign = sorted_carriers[0].get('callsign', '') if sorted_carriers else None
+                carrier = self.get_most_recent_fleet_carrier()
+                callsign = carrier.get('callsign', '') if carrier else None
             
             if not callsign:
                 self.fleet_carrier_balance_value.config(text="Unknown", foreground="gray")
@@ -4240,6 +4429,6 @@ class GalaxyGPS():
         """
         Refresh the route window if it's currently open.
         This is called when the next waypoint changes to update the highlight.
-        Uses the seamless refresh from windows.py that preserves scroll position.
+        The highlight is updated in place; the window is only rebuilt if the route was replaced.
         """
         refresh_route_window_if_open(self)
@@ -0,0 +1,192 @@
+import json
+import logging
+import os
+import threading
+import time
+import traceback
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from config import appname  # type: ignore
+
+from .file_helpers import atomic_open
+
+# We need a name of plugin dir, not RingCache.py dir
+plugin_name = os.path.basename(os.path.dirname(os.path.dirname(__file__)))
+logger = logging.getLogger(f'{appname}.{plugin_name}')
+
+# Bump when the file layout changes (2: summaries of systems unknown to EDSM are no longer cached)
+RING_CACHE_VERSION = 2
+# Most recently used systems kept
+RING_CACHE_MAX_ENTRIES = 5000
+# Rings and reserve levels practically never change, so summaries are kept for 90 days
+RING_CACHE_TTL = 90 * 24 * 3600
+
+
+def parse_ring_summary(system_data) -> Dict:
+    """
+    Summarise the rings of an EDSM api-system-v1/bodies response.
+
+    Args:
+        system_data: Decoded JSON response
+
+    Returns:
+        Dict with 'icy' / 'pristine' flags (the system has an icy ring / a pristine icy ring),
+        the names of the bodies with such rings in 'icy_bodies' / 'pristine_bodies', and
+        'known' (False if EDSM returned no bodies list, i.e. it does not know the system)
+    """
+    icy_bodies = []
+    pristine_bodies = []
+    bodies = system_data.get('bodies') if isinstance(system_data, dict) else None
+    if isinstance(bodies, list):
+        for body in bodies:
+            rings = body.get('rings') if isinstance(body, dict) else None
+            if not isinstance(rings, list):
+                continue
+            body_name = str(body.get('name', ''))
+            for ring in rings:
+                if str(ring.get('type', '')).strip().lower() != 'icy':
+                    continue
+                if body_name not in icy_bodies:
+                    icy_bodies.append(body_name)
+                if str(ring.get('reserveLevel', '')).strip().lower() == 'pristine' and body_name not in pristine_bodies:
+                    pristine_bodies.append(body_name)
+    return {
+        'known': isinstance(bodies, list),
+        'icy': bool(icy_bodies),
+        'pristine': bool(pristine_bodies),
+        'icy_bodies': icy_bodies,
+        'pristine_bodies': pristine_bodies,
+    }
+
+
+class RingCache:
+    """
+    LRU cache of EDSM ring summaries (see parse_ring_summary), keyed by lowercase system name.
+
+    Lets a carrier that returns to a known system, or a second carrier in the same
+    system, get its Icy Rings / Pristine status without querying EDSM. Entries expire
+    after a long TTL. Lookups run on the Tk thread and stores on the rings worker, so
+    all access is locked. The cache is persisted as JSON in the plugin directory and
+    loaded in the background once the GUI is up.
+    """
+
+    def __init__(self, path: str, max_entries: int = RING_CACHE_MAX_ENTRIES, ttl: float = RING_CACHE_TTL):
+        """
+        Args:
+            path: JSON file the cache is persisted to
+            max_entries: Maximum number of cached systems
+            ttl: Seconds a cached summary stays valid
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # system -> (timestamp, summary)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._dirty = False
+        self._loaded = False  # load() finished (the file is read in the background after start)
+        self._lock = threading.Lock()
+
+    def _fresh(self, entry, now: float) -> bool:
+        return now - entry[0] <= self.ttl
+
+    def lookup(self, system: str) -> Optional[Dict]:
+        """
+        Get the cached ring summary of a system.
+
+        Args:
+            system: System name
+
+        Returns:
+            Ring summary dict, or None if EDSM has to be asked
+        """
+        key = system.strip().lower()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if not self._fresh(entry, time.time()):
+                del self._entries[key]
+                self._dirty = True
+                return None
+            self._entries.move_to_end(key)
+            return dict(entry[1])
+
+    def store(self, system: str, summary: Dict) -> None:
+        """
+        Cache the ring summary of a system.
+
+        Summaries of systems EDSM does not know are not cached, so the system is
+        queried again next time (it may have been explored since).
+
+        Args:
+            system: System name
+            summary: Dict returned by parse_ring_summary
+        """
+        key = system.strip().lower()
+        if not key or not isinstance(summary, dict) or not summary.get('known'):
+            return
+        with self._lock:
+            self._entries[key] = (time.time(), dict(summary))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._dirty = True
+
+    def _read(self) -> Optional[Dict]:
+        """Read the persisted cache file; None if missing, unreadable or of another version."""
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, 'r', encoding='utf-8') as cache_fh:
+                data = json.load(cache_fh)
+        except Exception:
+            logger.warning('!! Error reading ring cache: ' + traceback.format_exc(), exc_info=False)
+            return None
+        if not isinstance(data, dict) or data.get('version') != RING_CACHE_VERSION:
+            return None
+        return data
+
+    def load(self) -> None:
+        """
+        Load the persisted cache, dropping expired entries.
+
+        Called in the background after start, so entries stored in the meantime are
+        kept: they are newer than the file's.
+        """
+        data = self._read()
+        now = time.time()
+        with self._lock:
+            self._loaded = True
+            if data is None:
+                return
+            # Stored least recently used first; entries of this session stay the most recent
+            entries: "OrderedDict[str, tuple]" = OrderedDict()
+            for key, timestamp, summary in data.get('entries', []):
+                entry = (timestamp, summary)
+                if key not in self._entries and self._fresh(entry, now):
+                    entries[key] = entry
+            entries.update(self._entries)
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+            self._entries = entries
+        logger.debug(f"Loaded {len(self._entries)} cached system ring summaries")
+
+    def save(self) -> None:
+        """Write the cache to disk if it changed since it was loaded or last saved."""
+        if not self._loaded:
+            # Stopped before the background load: merge the file first so its entries are kept
+            self.load()
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {
+                'version': RING_CACHE_VERSION,
+                'entries': [[key, entry[0], entry[1]] for key, entry in self._entries.items()],
+            }
+            self._dirty = False
+        try:
+            with atomic_open(self.path, 'w', encoding='utf-8') as cache_fh:
+                json.dump(data, cache_fh, separators=(',', ':'))
+        except Exception:
+            logger.warning('!! Error writing ring cache: ' + traceback.format_exc(), exc_info=False)
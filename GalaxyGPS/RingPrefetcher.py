@@ -0,0 +1,120 @@
+import logging
+import os
+import threading
+import time
+import traceback
+from typing import Callable, Dict, Iterable, List, Optional
+
+from config import appname  # type: ignore
+
+from .RingCache import RingCache
+
+# We need a name of plugin dir, not RingPrefetcher.py dir
+plugin_name = os.path.basename(os.path.dirname(os.path.dirname(__file__)))
+logger = logging.getLogger(f'{appname}.{plugin_name}')
+
+# Upcoming fleet carrier waypoints whose rings are looked up ahead of time
+RING_PREFETCH_WAYPOINTS = 8
+# EDSM queries in flight at once
+RING_PREFETCH_CONCURRENCY = 2
+# Minimum seconds between the starts of two prefetch queries
+RING_PREFETCH_INTERVAL_S = 1.0
+
+
+class RingPrefetcher:
+    """
+    Background warm-up of the ring cache for systems the fleet carrier is about to jump to.
+
+    request() replaces the list of wanted systems (the latest route window wins);
+    systems already cached are skipped. A small pool of worker threads, started on
+    first use, takes systems in route order: at most `concurrency` queries run at
+    once and query starts are spaced `interval` seconds apart, to stay polite to EDSM.
+    """
+
+    def __init__(self, ring_cache: RingCache, fetch_summary: Callable[[str], Optional[Dict]],
+                 concurrency: int = RING_PREFETCH_CONCURRENCY, interval: float = RING_PREFETCH_INTERVAL_S):
+        """
+        Args:
+            ring_cache: Cache the summaries are stored in
+            fetch_summary: Called on a worker as fetch_summary(system); returns the ring
+                summary or None if it could not be fetched
+            concurrency: Maximum number of queries in flight
+            interval: Minimum seconds between query starts
+        """
+        self.ring_cache = ring_cache
+        self.fetch_summary = fetch_summary
+        self.concurrency = max(1, concurrency)
+        self.interval = interval
+        self._pending: List[str] = []
+        self._in_flight = set()
+        self._next_start = 0.0
+        self._stopped = False
+        self._cond = threading.Condition()
+        self._workers: List[threading.Thread] = []
+
+    def request(self, systems: Iterable[str]) -> None:
+        """
+        Prefetch the rings of these systems, in order, dropping any earlier request not started yet.
+
+        Args:
+            systems: System names
+        """
+        wanted = []
+        seen = set()
+        for system in systems:
+            system = (system or '').strip()
+            key = system.lower()
+            if not system or key in seen:
+                continue
+            seen.add(key)
+            if self.ring_cache.lookup(system) is None:
+                wanted.append(system)
+        with self._cond:
+            if self._stopped:
+                return
+            self._pending = [system for system in wanted if system.lower() not in self._in_flight]
+            if not self._pending:
+                return
+            while len(self._workers) < min(self.concurrency, len(self._pending)):
+                worker = threading.Thread(target=self._worker, name="RingPrefetcher", daemon=True)
+                self._workers.append(worker)
+                worker.start()
+            self._cond.notify_all()
+
+    def stop(self) -> None:
+        """Drop pending systems and let the workers exit (queries in flight still finish)."""
+        with self._cond:
+            self._stopped = True
+            self._pending = []
+            self._cond.notify_all()
+
+    def _worker(self) -> None:
+        """Worker: take the next wanted system once the rate limit allows, fetch and cache its rings."""
+        while True:
+            with self._cond:
+                while True:
+                    if self._stopped:
+                        return
+                    if not self._pending:
+                        self._cond.wait()
+                        continue
+                    remaining = self._next_start - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                system = self._pending.pop(0)
+                key = system.lower()
+                self._in_flight.add(key)
+                self._next_start = time.monotonic() + self.interval
+
+            try:
+                if self.ring_cache.lookup(system) is None:
+                    summary = self.fetch_summary(system)
+                    if summary is not None and summary['known']:
+                        self.ring_cache.store(system, summary)
+                        logger.debug(f"Prefetched rings of {system}")
+            except Exception:
+                logger.warning('!! Error prefetching rings: ' + traceback.format_exc(), exc_info=False)
+            finally:
+                with self._cond:
+                    self._in_flight.discard(key)
@@ -0,0 +1,185 @@
+import logging
+import os
+import pickle
+import traceback
+from typing import Any, Dict, Optional, Tuple
+
+from config import appname  # type: ignore
+
+from .file_helpers import atomic_open
+
+# We need a name of plugin dir, not RouteCache.py dir
+plugin_name = os.path.basename(os.path.dirname(os.path.dirname(__file__)))
+logger = logging.getLogger(f'{appname}.{plugin_name}')
+
+# Bump when the cached structure (route rows, RouteModel attributes) changes
+ROUTE_CACHE_VERSION = 2
+
+
+def _csv_signature(csv_path: str) -> Optional[Dict[str, int]]:
+    """Get the mtime/size signature of the route CSV, or None if it does not exist."""
+    try:
+        stat = os.stat(csv_path)
+    except OSError:
+        return None
+    return {'csv_mtime_ns': stat.st_mtime_ns, 'csv_size': stat.st_size}
+
+
+def save_route_cache(cache_path: str, csv_path: str, state: Dict[str, Any], plugin_version: str = "") -> bool:
+    """
+    Write the binary route cache for the route CSV that was just saved.
+
+    Args:
+        cache_path: Path of the cache file
+        csv_path: Path of the route CSV the cache belongs to
+        state: Route state to cache (route rows, full data, fieldnames, flags, offset, compiled model)
+        plugin_version: Plugin version, cache is ignored after an update
+
+    Returns:
+        True if the cache was written
+    """
+    signature = _csv_signature(csv_path)
+    if signature is None:
+        remove_route_cache(cache_path)
+        return False
+
+    payload = {
+        'version': ROUTE_CACHE_VERSION,
+        'plugin_version': plugin_version,
+        **signature,
+        'state': state,
+    }
+    try:
+        with atomic_open(cache_path, 'wb') as cache_fh:
+            pickle.dump(payload, cache_fh, protocol=pickle.HIGHEST_PROTOCOL)
+        return True
+    except Exception:
+        logger.warning('!! Error writing route cache: ' + traceback.format_exc(), exc_info=False)
+        return False
+
+
+def load_route_cache(cache_path: str, csv_path: str, plugin_version: str = "") -> Optional[Dict[str, Any]]:
+    """
+    Load the binary route cache if it is still valid for the route CSV.
+
+    Args:
+        cache_path: Path of the cache file
+        csv_path: Path of the route CSV the cache belongs to
+        plugin_version: Current plugin version
+
+    Returns:
+        Cached route state, or None if missing, stale or unreadable
+    """
+    if not os.path.exists(cache_path):
+        return None
+
+    signature = _csv_signature(csv_path)
+    if signature is None:
+        return None
+
+    try:
+        with open(cache_path, 'rb') as cache_fh:
+            payload = pickle.load(cache_fh)
+    except Exception:
+        logger.warning('!! Error reading route cache: ' + traceback.format_exc(), exc_info=False)
+        return None
+
+    if not isinstance(payload, dict) or payload.get('version') != ROUTE_CACHE_VERSION:
+        logger.debug("Route cache version mismatch, ignoring")
+        return None
+    if payload.get('plugin_version') != plugin_version:
+        logger.debug("Route cache was written by another plugin version, ignoring")
+        return None
+    if (payload.get('csv_mtime_ns') != signature['csv_mtime_ns']
+            or payload.get('csv_size') != signature['csv_size']):
+        logger.debug("Route cache does not match route.csv, ignoring")
+        return None
+
+    return payload.get('state')
+
+
+def save_column_widths_cache(widths_path: str, csv_path: str, widths_key: Any, widths: Dict[str, int],
+                             plugin_version: str = "") -> bool:
+    """
+    Write the route table column widths measured for the route CSV.
+
+    Kept in a small file next to the route cache, so storing the widths does not
+    rewrite (and re-pickle) the whole route.
+
+    Args:
+        widths_path: Path of the widths file
+        csv_path: Path of the route CSV the widths belong to
+        widths_key: Key of the font metrics the widths were measured with
+        widths: Dict of lowercase field name -> width in pixels
+        plugin_version: Plugin version, the widths are ignored after an update
+
+    Returns:
+        True if the widths were written
+    """
+    signature = _csv_signature(csv_path)
+    if signature is None:
+        remove_route_cache(widths_path)
+        return False
+
+    payload = {
+        'version': ROUTE_CACHE_VERSION,
+        'plugin_version': plugin_version,
+        **signature,
+        'widths_key': widths_key,
+        'widths': widths,
+    }
+    try:
+        with atomic_open(widths_path, 'wb') as widths_fh:
+            pickle.dump(payload, widths_fh, protocol=pickle.HIGHEST_PROTOCOL)
+        return True
+    except Exception:
+        logger.warning('!! Error writing column widths cache: ' + traceback.format_exc(), exc_info=False)
+        return False
+
+
+def load_column_widths_cache(widths_path: str, csv_path: str, plugin_version: str = "") -> Optional[Tuple[Any, Dict[str, int]]]:
+    """
+    Load the route table column widths if they were measured for the current route CSV.
+
+    Args:
+        widths_path: Path of the widths file
+        csv_path: Path of the route CSV the widths belong to
+        plugin_version: Current plugin version
+
+    Returns:
+        (font metrics key, widths), or None if missing, stale or unreadable
+    """
+    if not os.path.exists(widths_path):
+        return None
+
+    signature = _csv_signature(csv_path)
+    if signature is None:
+        return None
+
+    try:
+        with open(widths_path, 'rb') as widths_fh:
+            payload = pickle.load(widths_fh)
+    except Exception:
+        logger.warning('!! Error reading column widths cache: ' + traceback.format_exc(), exc_info=False)
+        return None
+
+    if (not isinstance(payload, dict) or payload.get('version') != ROUTE_CACHE_VERSION
+            or payload.get('plugin_version') != plugin_version
+            or payload.get('csv_mtime_ns') != signature['csv_mtime_ns']
+            or payload.get('csv_size') != signature['csv_size']):
+        return None
+
+    return payload.get('widths_key'), payload.get('widths')
+
+
+def remove_route_cache(cache_path: str) -> None:
+    """
+    Delete the binary route cache.
+
+    Args:
+        cache_path: Path of the cache file
+    """
+    try:
+        os.remove(cache_path)
+    except (IOError, OSError):
+        pass
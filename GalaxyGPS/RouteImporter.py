@@ -0,0 +1,273 @@
+import csv
+import logging
+import math
+import os
+import threading
+import traceback
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from config import appname  # type: ignore
+
+# We need a name of plugin dir, not RouteImporter.py dir
+plugin_name = os.path.basename(os.path.dirname(os.path.dirname(__file__)))
+logger = logging.getLogger(f'{appname}.{plugin_name}')
+
+# Number of CSV rows parsed per chunk when streaming an import
+CSV_IMPORT_CHUNK_SIZE = 2000
+
+SYSTEM_HEADER = "System Name"
+JUMPS_HEADER = "Jumps"
+REFUEL_HEADER = "Refuel"
+RESTOCK_TRITIUM_HEADER = "Restock Tritium"
+
+INTERNAL_BASIC_HEADER_1 = "System Name"
+INTERNAL_BASIC_HEADER_2 = "System Name,Jumps"
+INTERNAL_FLEETCARRIER_HEADER = "System Name,Distance,Distance Remaining,Tritium in tank,Tritium in market,Fuel Used,Icy Ring,Pristine,Restock Tritium"
+NEUTRON_IMPORT_HEADER = "System Name,Distance To Arrival,Distance Remaining,Neutron Star,Jumps"
+ROAD2RICHES_IMPORT_HEADER = "System Name,Body Name,Body Subtype,Is Terraformable,Distance To Arrival,Estimated Scan Value,Estimated Mapping Value,Jumps"
+
+DISTANCE_FIELDS = ["distance to arrival", "distance remaining", "distance"]
+
+
+def _round_up(value):
+    """Round a numeric string UP to nearest hundredth. Non-numeric values are returned as-is."""
+    if not value or value == "":
+        return value
+    try:
+        return f"{math.ceil(float(value) * 100) / 100:.2f}"
+    except (ValueError, TypeError):
+        return value
+
+
+class CsvRouteImporter:
+    """
+    Converts rows of a route CSV (Spansh exports or the plugin's own route.csv)
+    into the internal route rows and full row data used by GalaxyGPS.
+
+    The route type is detected once from the header. Rows can then be converted
+    one at a time, so the same conversion serves both the synchronous loader and
+    the chunked, streaming import that runs on a worker thread.
+    """
+
+    def __init__(self, fieldnames: List[str]):
+        """
+        Detect the route type from the CSV header.
+
+        Args:
+            fieldnames: CSV header fields
+        """
+        self.fieldnames = list(fieldnames) if fieldnames else []
+        # Case-insensitive fieldname mapping
+        self.fieldname_map = {name.lower(): name for name in self.fieldnames}
+
+        self.roadtoriches = False
+        self.fleetcarrier = False
+        self.galaxy = False
+        self.neutron = False
+        self.has_fuel_used = False
+        self.has_fuel_left = False
+        self.has_icy_ring = self.has_field('Icy Ring')
+        self.has_pristine = self.has_field('Pristine')
+        # Whether distance columns in the full row data get rounded up
+        self.round_full_data = True
+
+        headerline_lower = ','.join(self.fieldnames).lower()
+
+        if headerline_lower == NEUTRON_IMPORT_HEADER.lower():
+            self.kind = 'neutron'
+            self.neutron = True  # Flag neutron routes for special cumulative jump handling
+            self.round_full_data = False
+            logger.info(f"[plot_csv] Importing neutron route with headers: {self.fieldnames}")
+            return
+
+        if headerline_lower == ROAD2RICHES_IMPORT_HEADER.lower():
+            self.roadtoriches = True
+            logger.info(f"[plot_csv] Detected Road to Riches route with headers: {self.fieldnames}")
+
+        if headerline_lower in (INTERNAL_BASIC_HEADER_1.lower(), INTERNAL_BASIC_HEADER_2.lower()):
+            self.kind = 'basic'
+            self.round_full_data = False
+        elif headerline_lower == INTERNAL_FLEETCARRIER_HEADER.lower():
+            # Internal fleet carrier format (also the Spansh fleet carrier export header)
+            self.kind = 'fleetcarrier'
+            self.fleetcarrier = True
+            self.has_fuel_used = self.has_field('Fuel Used')
+            self.round_full_data = False
+        elif self.has_field(REFUEL_HEADER) and self.has_field(SYSTEM_HEADER):
+            self.kind = 'galaxy'
+            self.galaxy = True
+            self.has_fuel_used = self.has_field('Fuel Used')
+            self.has_fuel_left = self.has_field('Fuel Left')
+        else:
+            # Generic CSV import - fleet carrier route if it has Icy Ring/Pristine
+            self.kind = 'generic'
+            if self.has_icy_ring or self.has_pristine:
+                self.fleetcarrier = True
+            self.has_fuel_used = self.has_field('Fuel Used')
+
+    def has_field(self, field_name: str) -> bool:
+        """Check if field exists in header (case-insensitive)"""
+        return field_name.lower() in self.fieldname_map
+
+    def get_field(self, row: Dict, field_name: str, default: str = "") -> str:
+        """Get field value from row using case-insensitive lookup"""
+        key = self.fieldname_map.get(field_name.lower(), field_name)
+        return row.get(key, default)
+
+    def _get_distance_fields(self, row: Dict) -> Tuple[str, str]:
+        dist_to_arrival = self.get_field(row, "Distance To Arrival", "") or self.get_field(row, "Distance", "")
+        dist_remaining = self.get_field(row, "Distance Remaining", "")
+        return _round_up(dist_to_arrival) or "", _round_up(dist_remaining) or ""
+
+    def _get_rounded_field(self, row: Dict, field_name: str) -> str:
+        raw = self.get_field(row, field_name, '')
+        return _round_up(raw) if raw else ''
+
+    def _fleetcarrier_entry(self, row: Dict) -> list:
+        # Fleet Carrier format: [System Name, Distance, Distance Remaining, Tritium in tank, Tritium in market, Fuel Used, Icy Ring, Pristine, Restock Tritium]
+        dist_to_arrival, dist_remaining = self._get_distance_fields(row)
+        return [
+            self.get_field(row, SYSTEM_HEADER, ""),                                   # 0: System Name
+            dist_to_arrival,                                                          # 1: Distance
+            dist_remaining,                                                           # 2: Distance Remaining
+            self.get_field(row, 'Tritium in tank', ''),                               # 3: Tritium in tank
+            self.get_field(row, 'Tritium in market', ''),                             # 4: Tritium in market
+            self._get_rounded_field(row, 'Fuel Used') if self.has_fuel_used else '',  # 5: Fuel Used
+            self.get_field(row, 'Icy Ring', '') if self.has_icy_ring else '',         # 6: Icy Ring
+            self.get_field(row, 'Pristine', '') if self.has_pristine else '',         # 7: Pristine
+            self.get_field(row, RESTOCK_TRITIUM_HEADER, ''),                          # 8: Restock Tritium
+        ]
+
+    def convert_row(self, row: Dict) -> Tuple[list, Dict[str, str]]:
+        """
+        Convert one CSV row.
+
+        Args:
+            row: Row as returned by csv.DictReader
+
+        Returns:
+            Tuple of (internal route row, full row data keyed by lowercase field name)
+        """
+        # Store full row data (all columns)
+        full_row_data = {}
+        for field_name in self.fieldnames:
+            field_value = self.get_field(row, field_name, '')
+            if self.round_full_data and field_name.lower() in DISTANCE_FIELDS and field_value:
+                field_value = _round_up(field_value)
+            full_row_data[field_name.lower()] = field_value
+
+        if self.kind == 'neutron':
+            # Neutron format: [System Name, Distance To Arrival, Distance Remaining, Jumps]
+            dist_to_arrival, dist_remaining = self._get_distance_fields(row)
+            route_row = [
+                self.get_field(row, SYSTEM_HEADER),
+                dist_to_arrival,
+                dist_remaining,
+                self.get_field(row, JUMPS_HEADER, ""),
+            ]
+        elif self.kind == 'basic':
+            route_row = [
+                self.get_field(row, SYSTEM_HEADER),
+                self.get_field(row, JUMPS_HEADER, ""),
+            ]
+        elif self.kind == 'fleetcarrier' or (self.kind == 'generic' and self.fleetcarrier):
+            route_row = self._fleetcarrier_entry(row)
+        elif self.kind == 'galaxy':
+            dist_to_arrival, dist_remaining = self._get_distance_fields(row)
+            route_row = [
+                self.get_field(row, SYSTEM_HEADER, ""),
+                self.get_field(row, REFUEL_HEADER, ""),
+            ]
+            if dist_to_arrival or dist_remaining:
+                route_row.append(dist_to_arrival)
+                route_row.append(dist_remaining)
+                # Fuel Left at index 4 (empty placeholder if the column is missing)
+                route_row.append(self._get_rounded_field(row, 'Fuel Left') if self.has_fuel_left else "")
+            # Fuel Used at index 5
+            if self.has_fuel_used:
+                route_row.append(self._get_rounded_field(row, 'Fuel Used'))
+        else:
+            # Generic route format: [System, Jumps, Fuel Used?, ...]
+            route_row = [
+                self.get_field(row, SYSTEM_HEADER, ""),
+                self.get_field(row, JUMPS_HEADER, ""),
+            ]
+            if self.has_fuel_used:
+                route_row.append(self._get_rounded_field(row, 'Fuel Used'))
+
+        return route_row, full_row_data
+
+    def iter_chunks(self, reader: Iterator[Dict], chunk_size: int = CSV_IMPORT_CHUNK_SIZE,
+                    cancel_event: Optional[threading.Event] = None) -> Iterator[Tuple[List[list], List[Dict[str, str]]]]:
+        """
+        Convert rows from a csv.DictReader in chunks.
+
+        Args:
+            reader: csv.DictReader positioned after the header
+            chunk_size: Number of rows per chunk
+            cancel_event: Optional event; iteration stops when it is set
+
+        Yields:
+            Tuple of (internal route rows, full row data) for each chunk
+        """
+        route_rows = []
+        full_rows = []
+        for row in reader:
+            if row in (None, "", []):
+                continue
+            route_row, full_row_data = self.convert_row(row)
+            route_rows.append(route_row)
+            full_rows.append(full_row_data)
+            if len(route_rows) >= chunk_size:
+                yield route_rows, full_rows
+                if cancel_event is not None and cancel_event.is_set():
+                    return
+                route_rows = []
+                full_rows = []
+        if route_rows:
+            yield route_rows, full_rows
+
+
+def run_csv_import_worker(filename: str, result_queue, cancel_event: threading.Event,
+                          chunk_size: int = CSV_IMPORT_CHUNK_SIZE) -> None:
+    """
+    Worker: stream a route CSV in chunks off the main thread.
+
+    Puts messages on result_queue:
+        {'type': 'header', 'importer': CsvRouteImporter}
+        {'type': 'chunk', 'route': [...], 'route_full_data': [...], 'progress': float 0-1}
+        {'type': 'done', 'rows': int}
+        {'type': 'error'}
+    """
+    try:
+        total_size = max(1, os.path.getsize(filename))
+        consumed = [0]
+
+        with open(filename, 'r', encoding='utf-8-sig', newline='') as csvfile:
+            def counting_lines():
+                # csv reader consumes lines; count characters read for progress reporting
+                for line in csvfile:
+                    consumed[0] += len(line)
+                    yield line
+
+            route_reader = csv.DictReader(counting_lines())
+            importer = CsvRouteImporter(route_reader.fieldnames or [])
+            result_queue.put({'type': 'header', 'importer': importer})
+
+            rows = 0
+            for route_rows, full_rows in importer.iter_chunks(route_reader, chunk_size, cancel_event):
+                if cancel_event.is_set():
+                    return
+                rows += len(route_rows)
+                result_queue.put({
+                    'type': 'chunk',
+                    'route': route_rows,
+                    'route_full_data': full_rows,
+                    'progress': min(1.0, consumed[0] / total_size),
+                })
+
+        if not cancel_event.is_set():
+            result_queue.put({'type': 'done', 'rows': rows})
+    except Exception:
+        logger.warning('!! ' + traceback.format_exc(), exc_info=False)
+        result_queue.put({'type': 'error'})
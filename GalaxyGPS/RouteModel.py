@@ -0,0 +1,301 @@
+import logging
+import math
+import os
+from typing import Dict, List, Optional
+
+from config import appname  # type: ignore
+
+# We need a name of plugin dir, not RouteModel.py dir
+plugin_name = os.path.basename(os.path.dirname(os.path.dirname(__file__)))
+logger = logging.getLogger(f'{appname}.{plugin_name}')
+
+
+def _parse_distance(value) -> Optional[float]:
+    """Convert a route cell to float, rounding UP to nearest hundredth. None if not numeric."""
+    if value is None or value == "":
+        return None
+    try:
+        return math.ceil(float(value) * 100) / 100
+    except (ValueError, TypeError):
+        return None
+
+
+def _parse_jumps(value) -> Optional[int]:
+    """Convert a route cell to an integer jump count. None if not numeric."""
+    if value is None or value == "":
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        pass
+    try:
+        return int(float(value))
+    except (ValueError, TypeError):
+        return None
+
+
+class RouteModel:
+    """
+    Compiled, read-only view of a loaded route.
+
+    Built once when a route is loaded. Parses the string cells of the internal
+    route rows into typed columns and keeps prefix sums for jumps and distance,
+    so jumps left, distance left and percent complete at any offset are O(1)
+    lookups instead of walks over the remaining rows.
+
+    Also indexes the system names: a forward-filled resolved name per row (Road to
+    Riches body rows leave the system name empty), a lowercase name -> row indices
+    map, and the boundaries of each run of rows sharing a system, so locating the
+    current system and stepping between waypoints do not scan the route.
+
+    Column layout of the internal route rows per route type:
+        neutron:      [System Name, Distance To Arrival, Distance Remaining, Jumps]
+        fleetcarrier: [System Name, Distance, Distance Remaining, ...] (1 jump per row)
+        galaxy:       [System Name, Refuel, Distance, Distance Remaining, ...] (1 jump per row)
+        other:        [System Name, Jumps, Distance To Arrival, Distance Remaining, ...]
+    """
+
+    def __init__(self, route: List[list], neutron: bool = False, fleetcarrier: bool = False,
+                 galaxy: bool = False, roadtoriches: bool = False):
+        """
+        Compile the given route rows.
+
+        Args:
+            route: Internal route rows (list of lists, as stored in GalaxyGPS.route)
+            neutron: True for neutron plotter routes
+            fleetcarrier: True for fleet carrier routes
+            galaxy: True for galaxy plotter routes
+            roadtoriches: True for Road to Riches routes (empty system names repeat the previous system)
+        """
+        # Keep a reference to the source rows so callers can detect a stale model
+        self.route = route
+        self.length = len(route)
+        self.route_flags = (neutron, fleetcarrier, galaxy, roadtoriches)
+
+        if neutron:
+            jumps_idx, distance_idx, remaining_idx = 3, 1, 2
+        elif fleetcarrier:
+            jumps_idx, distance_idx, remaining_idx = None, 1, 2
+        elif galaxy:
+            jumps_idx, distance_idx, remaining_idx = None, 2, 3
+        else:
+            jumps_idx, distance_idx, remaining_idx = 1, 2, 3
+
+        # Typed per-waypoint columns
+        self.jumps: List[int] = []
+        self.distances: List[Optional[float]] = []
+        self.distance_remaining: List[Optional[float]] = []
+
+        # Prefix sums: prefix[i] is the total over rows [0, i)
+        self.jumps_prefix: List[int] = [0]
+        self.distance_prefix: List[float] = [0.0]
+        # Number of rows without a usable value, so "all values present" checks stay O(1)
+        self.missing_jumps_prefix: List[int] = [0]
+        self.missing_distance_prefix: List[int] = [0]
+
+        for row in route:
+            if jumps_idx is None:
+                jumps = 1
+            else:
+                jumps = _parse_jumps(row[jumps_idx]) if len(row) > jumps_idx else None
+            distance = _parse_distance(row[distance_idx]) if len(row) > distance_idx else None
+            remaining = _parse_distance(row[remaining_idx]) if len(row) > remaining_idx else None
+
+            self.jumps.append(jumps if jumps is not None else 0)
+            self.distances.append(distance)
+            self.distance_remaining.append(remaining)
+
+            self.jumps_prefix.append(self.jumps_prefix[-1] + (jumps if jumps is not None else 0))
+            self.missing_jumps_prefix.append(self.missing_jumps_prefix[-1] + (1 if jumps is None else 0))
+            self.distance_prefix.append(self.distance_prefix[-1] + (distance if distance is not None else 0.0))
+            self.missing_distance_prefix.append(self.missing_distance_prefix[-1] + (1 if distance is None else 0))
+
+        self.total_jumps = self.jumps_prefix[-1]
+        self.total_distance = self.distance_prefix[-1]
+
+        self._build_name_index(roadtoriches)
+
+        # Widest cell text per route table column (lowercase field -> px), measured once on a
+        # background pass after the route is loaded; column_widths_key identifies the font metrics used
+        self.column_text_widths: Optional[Dict[str, int]] = None
+        self.column_widths_key = None
+
+    def _build_name_index(self, roadtoriches: bool) -> None:
+        """
+        Build the resolved system name array, the lowercase name index and the run boundaries.
+
+        Args:
+            roadtoriches: True if empty system names should repeat the previous system
+        """
+        # Resolved (stripped, forward-filled for Road to Riches) system name per row
+        self.resolved_names: List[Optional[str]] = []
+        # Lowercase system name -> ascending list of row indices
+        self.name_index: Dict[str, List[int]] = {}
+
+        last_name = None
+        for idx, row in enumerate(self.route):
+            raw_name = row[0] if len(row) > 0 else ""
+            name = str(raw_name).strip() if raw_name else ""
+            if name:
+                last_name = name
+                resolved = name
+            elif roadtoriches:
+                resolved = last_name
+            else:
+                resolved = None
+            self.resolved_names.append(resolved)
+            if resolved:
+                self.name_index.setdefault(resolved.lower(), []).append(idx)
+
+        # next_different[i]: first index after i with a different system name (length if none)
+        # prev_different[i]: last index before i with a different system name (-1 if none)
+        self.next_different: List[int] = [self.length] * self.length
+        self.prev_different: List[int] = [-1] * self.length
+        keys = [name or "" for name in self.resolved_names]
+        for idx in range(self.length - 2, -1, -1):
+            if keys[idx + 1] != keys[idx]:
+                self.next_different[idx] = idx + 1
+            else:
+                self.next_different[idx] = self.next_different[idx + 1]
+        for idx in range(1, self.length):
+            if keys[idx - 1] != keys[idx]:
+                self.prev_different[idx] = idx - 1
+            else:
+                self.prev_different[idx] = self.prev_different[idx - 1]
+
+    def is_current(self, route: List[list], neutron: bool = False, fleetcarrier: bool = False,
+                   galaxy: bool = False, roadtoriches: bool = False) -> bool:
+        """
+        Check whether this model was compiled from the given route rows and route type.
+
+        Args:
+            route: Internal route rows
+            neutron: True for neutron plotter routes
+            fleetcarrier: True for fleet carrier routes
+            galaxy: True for galaxy plotter routes
+            roadtoriches: True for Road to Riches routes
+
+        Returns:
+            True if the model still describes the route
+        """
+        return (route is self.route and len(route) == self.length
+                and self.route_flags == (neutron, fleetcarrier, galaxy, roadtoriches))
+
+    def system_name_at(self, idx: int) -> Optional[str]:
+        """
+        Get the resolved system name at a route index.
+
+        Args:
+            idx: Route index
+
+        Returns:
+            System name, or None if out of range or unknown
+        """
+        if idx < 0 or idx >= self.length:
+            return None
+        return self.resolved_names[idx]
+
+    def indices_of(self, system_name: str) -> List[int]:
+        """
+        Get all route indices whose resolved system name matches (case-insensitive).
+
+        Args:
+            system_name: System name to look up
+
+        Returns:
+            Ascending list of indices (empty if the system is not on the route)
+        """
+        if not system_name:
+            return []
+        return self.name_index.get(system_name.strip().lower(), [])
+
+    def last_index_of(self, system_name: str) -> int:
+        """
+        Get the last route index whose resolved system name matches (case-insensitive).
+
+        Args:
+            system_name: System name to look up
+
+        Returns:
+            Route index, or -1 if the system is not on the route
+        """
+        indices = self.indices_of(system_name)
+        return indices[-1] if indices else -1
+
+    def _clamp(self, offset: int) -> int:
+        return max(0, min(offset, self.length))
+
+    def jumps_left(self, offset: int) -> int:
+        """
+        Get the estimated jumps left from a waypoint, including the waypoint itself.
+
+        Args:
+            offset: Route index of the next waypoint
+
+        Returns:
+            Sum of jumps for rows [offset, end)
+        """
+        return self.total_jumps - self.jumps_prefix[self._clamp(offset)]
+
+    def jumps_after(self, offset: int, require_all: bool = False) -> Optional[int]:
+        """
+        Get the jumps after a waypoint, excluding the waypoint itself.
+
+        Args:
+            offset: Route index of the next waypoint
+            require_all: If True, return None when any following row has no jump value
+
+        Returns:
+            Sum of jumps for rows (offset, end), or None
+        """
+        start = self._clamp(offset + 1)
+        if require_all and self.missing_jumps_prefix[-1] - self.missing_jumps_prefix[start] > 0:
+            return None
+        return self.total_jumps - self.jumps_prefix[start]
+
+    def distance_after(self, offset: int) -> Optional[float]:
+        """
+        Get the summed jump distance of all rows after a waypoint.
+
+        Args:
+            offset: Route index of the next waypoint
+
+        Returns:
+            Total distance in LY, or None if any following row has no distance
+        """
+        start = self._clamp(offset + 1)
+        if self.missing_distance_prefix[-1] - self.missing_distance_prefix[start] > 0:
+            return None
+        return self.total_distance - self.distance_prefix[start]
+
+    def distance_left(self, offset: int) -> Optional[float]:
+        """
+        Get the distance left from a waypoint.
+        Prefers the route's own Distance Remaining column, falls back to summed jump distances.
+
+        Args:
+            offset: Route index of the next waypoint
+
+        Returns:
+            Distance in LY, or None if unknown
+        """
+        if 0 <= offset < self.length and self.distance_remaining[offset] is not None:
+            return self.distance_remaining[offset]
+        return self.distance_after(offset)
+
+    def percent_complete(self, offset: int) -> float:
+        """
+        Get route progress at a waypoint.
+        Weighted by jumps when the route has jump counts, by waypoints otherwise.
+
+        Args:
+            offset: Route index of the next waypoint
+
+        Returns:
+            Percentage complete (0-100)
+        """
+        if self.total_jumps > 0:
+            return (self.total_jumps - self.jumps_left(offset)) / self.total_jumps * 100
+        if self.length > 0:
+            return self._clamp(offset) / self.length * 100
+        return 0.0
@@ -3,10 +3,11 @@ import logging
 import os
 import traceback
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from config import appname  # type: ignore
 
+from .CsvExporter import CsvExporter
 # We need a name of plugin dir, not StoredModulesManager.py dir
 plugin_name = os.path.basename(os.path.dirname(os.path.dirname(__file__)))
 logger = logging.getLogger(f'{appname}.{plugin_name}')
@@ -35,25 +36,41 @@ class StoredModulesManager:
         'Last Updated'
     ]
     
-    def __init__(self, plugin_dir: str):
+    def __init__(self, plugin_dir: str, store=None):
         """
         Initialize the StoredModulesManager.
         
         Args:
             plugin_dir: Directory where the plugin is installed
+            store: Optional CarrierStore holding the data; the CSV file is then
+                   still exported on every save for other tools
         """
         self.plugin_dir = plugin_dir
         self.modules_file = os.path.join(plugin_dir, 'fleet_carrier_modules.csv')
+        self._csv_exporter = CsvExporter(self.modules_file, self.CSV_HEADERS)
         # Keyed by callsign, value is dict of StorageSlot -> module data
         self.modules: Dict[str, Dict[str, Dict]] = {}
         
+        self.store = store
+        
         # Load existing modules data
         self.load_modules()
+        if self.store is not None and not self.store.is_migrated('modules'):
+            # First start with the store: carry over the CSV data
+            self.store.migrate('modules', [item for items in self.modules.values() for item in items.values()])
     
     def load_modules(self) -> None:
         """
-        Load stored modules data from CSV file.
+        Load stored modules data from the store, or from CSV file.
         """
+        if self.store is not None and self.store.is_migrated('modules'):
+            for row in self.store.load_rows('modules'):
+                if row['callsign'] and row['storage_slot']:
+                    self.modules.setdefault(row['callsign'], {})[row['storage_slot']] = row
+            total_entries = sum(len(items) for items in self.modules.values())
+            logger.info(f"Loaded stored modules for {len(self.modules)} carrier(s), {total_entries} total modules from database")
+            return
+        
         if not os.path.exists(self.modules_file):
             logger.debug("No existing fleet carrier modules file found")
             return
@@ -92,40 +109,55 @@ class StoredModulesManager:
         except Exception:
             logger.warning('!! Error loading stored modules: ' + traceback.format_exc(), exc_info=False)
     
-    def save_modules(self) -> None:
+    def save_modules(self, callsigns: Optional[Iterable[str]] = None) -> None:
         """
-        Save stored modules data to CSV file.
+        Save stored modules data to the store (if any) and the CSV file.
+        
+        Args:
+            callsigns: Carriers whose modules changed; None for all. With a store only
+                       their rows are replaced, the CSV is always exported whole
+                       (in the background, see CsvExporter).
         """
-        try:
-            with open(self.modules_file, 'w', encoding='utf-8', newline='') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=self.CSV_HEADERS)
-                writer.writeheader()
-                
-                # Flatten nested dict structure for CSV output
-                for callsign in sorted(self.modules.keys()):
-                    for storage_slot in sorted(self.modules[callsign].keys(), key=lambda x: int(x) if x.isdigit() else 0):
-                        module = self.modules[callsign][storage_slot]
-                        writer.writerow({
-                            'Callsign': module.get('callsign', ''),
-                            'Storage Slot': module.get('storage_slot', ''),
-                            'Module Name': module.get('module_name', ''),
-                            'Module Name Localized': module.get('module_name_localized', ''),
-                            'Buy Price': module.get('buy_price', '0'),
-                            'Hot': module.get('hot', ''),
-                            'Star System': module.get('star_system', ''),
-                            'Market ID': module.get('market_id', ''),
-                            'Engineered': module.get('engineered', ''),
-                            'Engineer': module.get('engineer', ''),
-                            'Level': module.get('level', ''),
-                            'Quality': module.get('quality', ''),
-                            'Last Updated': module.get('last_updated', '')
-                        })
-            
-            total_modules = sum(len(mods) for mods in self.modules.values())
-            logger.debug(f"Saved stored modules for {len(self.modules)} carrier(s), {total_modules} total modules")
+        if self.store is not None:
+            callsigns = list(self.modules.keys()) if callsigns is None else list(callsigns)
+            try:
+                self.store.replace_items('modules', {
+                    callsign: list(self.modules.get(callsign, {}).values()) for callsign in callsigns
+                })
+                logger.debug(f"Saved stored modules for {', '.join(callsigns)} to database")
+            except Exception:
+                logger.warning('!! Error saving stored modules: ' + traceback.format_exc(), exc_info=False)
         
-        except Exception:
-            logger.warning('!! Error saving stored modules: ' + traceback.format_exc(), exc_info=False)
+        # Exported in the background: one carrier's update does not wait for a rewrite of every carrier's rows
+        self._csv_exporter.schedule(self._csv_rows())
+    
+    def _csv_rows(self) -> List[Dict]:
+        """Snapshot the stored modules as CSV row dicts, sorted by callsign."""
+        rows = []
+        # Flatten nested dict structure for CSV output
+        for callsign in sorted(self.modules.keys()):
+            for storage_slot in sorted(self.modules[callsign].keys(), key=lambda x: int(x) if x.isdigit() else 0):
+                module = self.modules[callsign][storage_slot]
+                rows.append({
+                    'Callsign': module.get('callsign', ''),
+                    'Storage Slot': module.get('storage_slot', ''),
+                    'Module Name': module.get('module_name', ''),
+                    'Module Name Localized': module.get('module_name_localized', ''),
+                    'Buy Price': module.get('buy_price', '0'),
+                    'Hot': module.get('hot', ''),
+                    'Star System': module.get('star_system', ''),
+                    'Market ID': module.get('market_id', ''),
+                    'Engineered': module.get('engineered', ''),
+                    'Engineer': module.get('engineer', ''),
+                    'Level': module.get('level', ''),
+                    'Quality': module.get('quality', ''),
+                    'Last Updated': module.get('last_updated', '')
+                })
+        return rows
+    
+    def flush_csv(self) -> None:
+        """Write a CSV export still waiting for its quiet period (called at plugin stop)."""
+        self._csv_exporter.flush()
     
     def _extract_callsign_from_station(self, station_name: str) -> Optional[str]:
         """
@@ -240,7 +272,7 @@ class StoredModulesManager:
                 logger.info(f"Updated stored modules for carrier {callsign}: {len(self.modules[callsign])} modules")
             
             if updated_carriers:
-                self.save_modules()
+                self.save_modules(updated_carriers)
                 return True
             
             return False
@@ -311,7 +343,7 @@ class StoredModulesManager:
         """
         if callsign in self.modules:
             del self.modules[callsign]
-            self.save_modules()
+            self.save_modules([callsign])
             logger.info(f"Cleared stored modules for carrier {callsign}")
             return True
         return False
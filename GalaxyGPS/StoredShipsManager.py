@@ -3,10 +3,11 @@ import logging
 import os
 import traceback
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional
 
 from config import appname  # type: ignore
 
+from .CsvExporter import CsvExporter
 # We need a name of plugin dir, not StoredShipsManager.py dir
 plugin_name = os.path.basename(os.path.dirname(os.path.dirname(__file__)))
 logger = logging.getLogger(f'{appname}.{plugin_name}')
@@ -30,25 +31,44 @@ class StoredShipsManager:
         'Last Updated'
     ]
     
-    def __init__(self, plugin_dir: str):
+    def __init__(self, plugin_dir: str, store=None):
         """
         Initialize the StoredShipsManager.
         
         Args:
             plugin_dir: Directory where the plugin is installed
+            store: Optional CarrierStore holding the data; the CSV file is then
+                   still exported on every save for other tools
         """
         self.plugin_dir = plugin_dir
         self.ships_file = os.path.join(plugin_dir, 'fleet_carrier_ships.csv')
+        self._csv_exporter = CsvExporter(self.ships_file, self.CSV_HEADERS)
         # Keyed by callsign, value is dict of ShipID -> ship data
         self.ships: Dict[str, Dict[str, Dict]] = {}
         
+        self.store = store
+        self.data_version = 0  # Bumped on every change to self.ships (see save_ships)
+        # Called with each changed callsign (None for all) after every change
+        self.change_listener: Optional[Callable[[Optional[str]], None]] = None
+        
         # Load existing ships data
         self.load_ships()
+        if self.store is not None and not self.store.is_migrated('ships'):
+            # First start with the store: carry over the CSV data
+            self.store.migrate('ships', [item for items in self.ships.values() for item in items.values()])
     
     def load_ships(self) -> None:
         """
-        Load stored ships data from CSV file.
+        Load stored ships data from the store, or from CSV file.
         """
+        if self.store is not None and self.store.is_migrated('ships'):
+            for row in self.store.load_rows('ships'):
+                if row['callsign'] and row['ship_id']:
+                    self.ships.setdefault(row['callsign'], {})[row['ship_id']] = row
+            total_entries = sum(len(items) for items in self.ships.values())
+            logger.info(f"Loaded stored ships for {len(self.ships)} carrier(s), {total_entries} total ships from database")
+            return
+        
         if not os.path.exists(self.ships_file):
             logger.debug("No existing fleet carrier ships file found")
             return
@@ -82,35 +102,56 @@ class StoredShipsManager:
         except Exception:
             logger.warning('!! Error loading stored ships: ' + traceback.format_exc(), exc_info=False)
     
-    def save_ships(self) -> None:
+    def save_ships(self, callsigns: Optional[Iterable[str]] = None) -> None:
         """
-        Save stored ships data to CSV file.
+        Save stored ships data to the store (if any) and the CSV file.
+        
+        Args:
+            callsigns: Carriers whose ships changed; None for all. With a store only
+                       their rows are replaced, the CSV is always exported whole
+                       (in the background, see CsvExporter).
         """
-        try:
-            with open(self.ships_file, 'w', encoding='utf-8', newline='') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=self.CSV_HEADERS)
-                writer.writeheader()
-                
-                # Flatten nested dict structure for CSV output
-                for callsign in sorted(self.ships.keys()):
-                    for ship_id in sorted(self.ships[callsign].keys()):
-                        ship = self.ships[callsign][ship_id]
-                        writer.writerow({
-                            'Callsign': ship.get('callsign', ''),
-                            'Ship Type': ship.get('ship_type', ''),
-                            'Ship ID': ship.get('ship_id', ''),
-                            'Ship Name': ship.get('ship_name', ''),
-                            'Star System': ship.get('star_system', ''),
-                            'Ship Market ID': ship.get('ship_market_id', ''),
-                            'Location Type': ship.get('location_type', ''),
-                            'Last Updated': ship.get('last_updated', '')
-                        })
-            
-            total_ships = sum(len(ships) for ships in self.ships.values())
-            logger.debug(f"Saved stored ships for {len(self.ships)} carrier(s), {total_ships} total ships")
+        self.data_version += 1
+        if callsigns is not None:
+            callsigns = list(callsigns)
+        if self.change_listener is not None:
+            for callsign in (callsigns if callsigns is not None else [None]):
+                self.change_listener(callsign)
+        if self.store is not None:
+            callsigns = list(self.ships.keys()) if callsigns is None else callsigns
+            try:
+                self.store.replace_items('ships', {
+                    callsign: list(self.ships.get(callsign, {}).values()) for callsign in callsigns
+                })
+                logger.debug(f"Saved stored ships for {', '.join(callsigns)} to database")
+            except Exception:
+                logger.warning('!! Error saving stored ships: ' + traceback.format_exc(), exc_info=False)
         
-        except Exception:
-            logger.warning('!! Error saving stored ships: ' + traceback.format_exc(), exc_info=False)
+        # Exported in the background: one carrier's update does not wait for a rewrite of every carrier's rows
+        self._csv_exporter.schedule(self._csv_rows())
+    
+    def _csv_rows(self) -> List[Dict]:
+        """Snapshot the stored ships as CSV row dicts, sorted by callsign."""
+        rows = []
+        # Flatten nested dict structure for CSV output
+        for callsign in sorted(self.ships.keys()):
+            for ship_id in sorted(self.ships[callsign].keys()):
+                ship = self.ships[callsign][ship_id]
+                rows.append({
+                    'Callsign': ship.get('callsign', ''),
+                    'Ship Type': ship.get('ship_type', ''),
+                    'Ship ID': ship.get('ship_id', ''),
+                    'Ship Name': ship.get('ship_name', ''),
+                    'Star System': ship.get('star_system', ''),
+                    'Ship Market ID': ship.get('ship_market_id', ''),
+                    'Location Type': ship.get('location_type', ''),
+                    'Last Updated': ship.get('last_updated', '')
+                })
+        return rows
+    
+    def flush_csv(self) -> None:
+        """Write a CSV export still waiting for its quiet period (called at plugin stop)."""
+        self._csv_exporter.flush()
     
     def _extract_callsign_from_station(self, station_name: str) -> Optional[str]:
         """
@@ -213,7 +254,7 @@ class StoredShipsManager:
             
             if updated:
                 logger.info(f"Updated stored ships from StoredShips event for carrier {current_callsign}")
-                self.save_ships()
+                self.save_ships([current_callsign])
             
             return updated
         
@@ -263,7 +304,7 @@ class StoredShipsManager:
         """
         if callsign in self.ships:
             del self.ships[callsign]
-            self.save_ships()
+            self.save_ships([callsign])
             logger.info(f"Cleared stored ships for carrier {callsign}")
             return True
         return False
@@ -0,0 +1,175 @@
+import json
+import logging
+import os
+import threading
+import time
+import traceback
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from config import appname  # type: ignore
+
+from .file_helpers import atomic_open
+
+# We need a name of plugin dir, not SystemNameCache.py dir
+plugin_name = os.path.basename(os.path.dirname(os.path.dirname(__file__)))
+logger = logging.getLogger(f'{appname}.{plugin_name}')
+
+# Bump when the file layout changes
+SYSTEM_NAME_CACHE_VERSION = 1
+# Most recently used prefixes kept
+SYSTEM_NAME_CACHE_MAX_ENTRIES = 2000
+# Cached results expire after a week (new systems get discovered)
+SYSTEM_NAME_CACHE_TTL = 7 * 24 * 3600
+
+
+class SystemNameCache:
+    """
+    LRU cache of Spansh system-name autocomplete results, keyed by lowercase prefix.
+
+    Entries expire after a TTL. A prefix that was never looked up can still be
+    answered from a shorter cached prefix by filtering its results, as long as the
+    shorter result set was complete: Spansh caps the number of results, so a set
+    smaller than the largest one seen so far holds every matching system.
+
+    Shared by the source and destination AutoCompleters. Lookups run on the Tk thread
+    (AutoCompleter._request_query) and stores on the query workers, so all access is
+    locked. The cache is persisted as JSON in the plugin directory and loaded in the
+    background once the GUI is up.
+    """
+
+    def __init__(self, path: str, max_entries: int = SYSTEM_NAME_CACHE_MAX_ENTRIES,
+                 ttl: float = SYSTEM_NAME_CACHE_TTL):
+        """
+        Args:
+            path: JSON file the cache is persisted to
+            max_entries: Maximum number of cached prefixes
+            ttl: Seconds a cached result stays valid
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # prefix -> (timestamp, results)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        # Largest result set seen from the API, i.e. its result cap (0 while unknown)
+        self._result_limit = 0
+        self._dirty = False
+        self._loaded = False  # load() finished (the file is read in the background after start)
+        self._lock = threading.Lock()
+
+    def _fresh(self, entry, now: float) -> bool:
+        return now - entry[0] <= self.ttl
+
+    def lookup(self, prefix: str) -> Optional[List[str]]:
+        """
+        Get cached results for a prefix, from the prefix itself or a complete shorter prefix.
+
+        Args:
+            prefix: Text typed so far
+
+        Returns:
+            List of system names, or None if the API has to be asked
+        """
+        key = prefix.strip().lower()
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if self._fresh(entry, now):
+                    self._entries.move_to_end(key)
+                    return list(entry[1])
+                del self._entries[key]
+                self._dirty = True
+
+            if not self._result_limit:
+                # Result cap not known yet, so no cached set can be trusted to be complete
+                return None
+            for length in range(len(key) - 1, 0, -1):
+                entry = self._entries.get(key[:length])
+                if entry is None or not self._fresh(entry, now):
+                    continue
+                if len(entry[1]) >= self._result_limit:
+                    # Truncated result set, longer prefixes may have matches it does not list
+                    return None
+                self._entries.move_to_end(key[:length])
+                return [name for name in entry[1] if name.lower().startswith(key)]
+        return None
+
+    def store(self, prefix: str, results: List[str]) -> None:
+        """
+        Cache the API results for a prefix.
+
+        Args:
+            prefix: Prefix that was looked up
+            results: System names returned by the API
+        """
+        key = prefix.strip().lower()
+        if not key or not isinstance(results, list):
+            return
+        with self._lock:
+            self._entries[key] = (time.time(), [str(name) for name in results])
+            self._entries.move_to_end(key)
+            self._result_limit = max(self._result_limit, len(results))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._dirty = True
+
+    def _read(self) -> Optional[Dict]:
+        """Read the persisted cache file; None if missing, unreadable or of another version."""
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, 'r', encoding='utf-8') as cache_fh:
+                data = json.load(cache_fh)
+        except Exception:
+            logger.warning('!! Error reading system name cache: ' + traceback.format_exc(), exc_info=False)
+            return None
+        if not isinstance(data, dict) or data.get('version') != SYSTEM_NAME_CACHE_VERSION:
+            return None
+        return data
+
+    def load(self) -> None:
+        """
+        Load the persisted cache, dropping expired entries.
+
+        Called in the background after start, so entries stored in the meantime are
+        kept: they are newer than the file's.
+        """
+        data = self._read()
+        now = time.time()
+        with self._lock:
+            self._loaded = True
+            if data is None:
+                return
+            # Stored least recently used first; entries of this session stay the most recent
+            entries: "OrderedDict[str, tuple]" = OrderedDict()
+            for key, timestamp, results in data.get('entries', []):
+                entry = (timestamp, results)
+                if key not in self._entries and self._fresh(entry, now):
+                    entries[key] = entry
+            entries.update(self._entries)
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+            self._entries = entries
+            self._result_limit = max(self._result_limit, int(data.get('result_limit', 0)))
+        logger.debug(f"Loaded {len(self._entries)} cached autocomplete prefixes")
+
+    def save(self) -> None:
+        """Write the cache to disk if it changed since it was loaded or last saved."""
+        if not self._loaded:
+            # Stopped before the background load: merge the file first so its entries are kept
+            self.load()
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {
+                'version': SYSTEM_NAME_CACHE_VERSION,
+                'result_limit': self._result_limit,
+                'entries': [[key, entry[0], entry[1]] for key, entry in self._entries.items()],
+            }
+            self._dirty = False
+        try:
+            with atomic_open(self.path, 'w', encoding='utf-8') as cache_fh:
+                json.dump(data, cache_fh, separators=(',', ':'))
+        except Exception:
+            logger.warning('!! Error writing system name cache: ' + traceback.format_exc(), exc_info=False)
@@ -19,13 +19,21 @@ Usage from other plugins:
         # GalaxyGPS plugin not installed
         pass
 
-API Version: 1.0.0
+Route waypoints, carriers, cargo and ships are returned as read-only snapshots
+(tuples and read-only mappings) that are shared between callers and only rebuilt
+when GalaxyGPS's data changes. The *_snapshot() functions also return a version
+number, so a caller polling them can skip its own work while nothing changed.
+Instead of polling, callers can also subscribe() to change events.
+
+API Version: 2.2.0
 Stability: Stable - Breaking changes will increment major version
 """
 
 import logging
-from typing import Dict, List, Optional, Any
-from copy import deepcopy
+import threading
+import traceback
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Tuple
 
 from config import appname  # type: ignore
 
@@ -33,11 +41,61 @@ from config import appname  # type: ignore
 _galaxy_gps_instance = None
 
 # API version following semantic versioning
-API_VERSION = "1.0.0"
+API_VERSION = "2.2.0"
 
 logger = logging.getLogger(f'{appname}.EDMC_GalaxyGPS.api')
 
 
+class Snapshot(NamedTuple):
+    """
+    Read-only view of GalaxyGPS data, shared by every caller until the data changes.
+
+    Attributes:
+        version: Increases whenever the data changes; equal versions mean equal data
+        data: The data (tuples and read-only mappings), or None if there is none
+    """
+    version: int
+    data: Any
+
+
+# Snapshot name -> (source key the snapshot was built from, Snapshot)
+_snapshots: Dict[str, Tuple[tuple, Snapshot]] = {}
+_snapshot_lock = threading.Lock()
+
+
+def _freeze_record(record: Mapping) -> Mapping:
+    """Read-only copy of a carrier, cargo or ship row (the values are plain strings and numbers)."""
+    return MappingProxyType(dict(record))
+
+
+def _get_snapshot(name: str, source_key: tuple, build: Callable[[], Any]) -> Snapshot:
+    """
+    Get a cached snapshot, rebuilding it if its source changed.
+
+    Args:
+        name: Snapshot name
+        source_key: Identifies the source data (its owning objects and their change counters);
+                    the snapshot is rebuilt when it differs from the key it was built from
+        build: Builds the snapshot data from the source
+
+    Returns:
+        Snapshot; its version only increases if the rebuilt data differs from the previous data
+    """
+    with _snapshot_lock:
+        cached = _snapshots.get(name)
+        if cached is not None and cached[0] == source_key:
+            return cached[1]
+        data = build()
+        if cached is None:
+            snapshot = Snapshot(1, data)
+        elif cached[1].data == data:
+            snapshot = cached[1]
+        else:
+            snapshot = Snapshot(cached[1].version + 1, data)
+        _snapshots[name] = (source_key, snapshot)
+        return snapshot
+
+
 def _get_instance():
     """
     Internal function to get the GalaxyGPS instance.
@@ -60,6 +118,8 @@ def register_instance(instance):
     """
     global _galaxy_gps_instance
     _galaxy_gps_instance = instance
+    with _snapshot_lock:
+        _snapshots.clear()
     logger.info(f"[GalaxyGPS API] Registered instance, API version {API_VERSION}")
 
 
@@ -158,32 +218,168 @@ def get_route_info() -> Optional[Dict[str, Any]]:
         return None
 
 
-def get_route_waypoints() -> Optional[List[str]]:
+def get_route_snapshot() -> Optional[Snapshot]:
     """
-    Get list of system names in the current route.
+    Get a versioned snapshot of the current route's waypoints.
     
     Returns:
-        List of system names (strings) or None if no route loaded.
-        Returns a copy to prevent external modification.
+        Snapshot whose data is a tuple of route rows (each a tuple starting with the
+        system name), or None if no route loaded or error. The version changes when
+        a different route is loaded.
+        
+    Example:
+        snapshot = galaxygps_api.get_route_snapshot()
+        if snapshot and snapshot.version != last_version:
+            last_version = snapshot.version
+            redraw(snapshot.data)
+    """
+    instance = _get_instance()
+    if not instance or not hasattr(instance, 'route') or not instance.route:
+        return None
+    
+    try:
+        route = instance.route
+        # The compiled route model is rebuilt whenever the route is replaced
+        model = instance._get_route_model() if hasattr(instance, '_get_route_model') else None
+        return _get_snapshot(
+            'route', (model, route, len(route)),
+            lambda: tuple(tuple(row) for row in route)
+        )
+    except Exception as e:
+        logger.error(f"[GalaxyGPS API] Error getting route snapshot: {e}")
+        return None
+
+
+def get_route_waypoints() -> Optional[Tuple[tuple, ...]]:
+    """
+    Get the rows of the current route.
+    
+    Returns:
+        Tuple of route rows (each a tuple starting with the system name) or None if
+        no route loaded. The tuple is shared read-only (see get_route_snapshot).
         
     Example:
         waypoints = galaxygps_api.get_route_waypoints()
         if waypoints:
             print(f"Route has {len(waypoints)} waypoints")
-            print(f"First waypoint: {waypoints[0]}")
+            print(f"First waypoint: {waypoints[0][0]}")
+    """
+    snapshot = get_route_snapshot()
+    return snapshot.data if snapshot else None
+
+
+def get_route_waypoints_range(start: int, end: Optional[int] = None) -> Optional[Tuple[tuple, ...]]:
+    """
+    Get the route rows from index start up to (not including) end.
+    
+    Only the requested rows are copied, so this stays cheap on long routes.
+    
+    Args:
+        start: First row index (0-based)
+        end: Index after the last row; None for the end of the route
+        
+    Returns:
+        Tuple of route rows (each a tuple starting with the system name; empty if the
+        range is outside the route), or None if no route loaded or error
+        
+    Example:
+        rows = galaxygps_api.get_route_waypoints_range(100, 110)
+        if rows:
+            print(f"Rows 100-109 start at {rows[0][0]}")
     """
     instance = _get_instance()
     if not instance or not hasattr(instance, 'route') or not instance.route:
         return None
     
     try:
-        # Return a copy to prevent external modification
-        return deepcopy(instance.route)
+        route = instance.route
+        start = max(0, start)
+        end = len(route) if end is None else min(end, len(route))
+        return tuple(tuple(route[idx]) for idx in range(start, end))
     except Exception as e:
-        logger.error(f"[GalaxyGPS API] Error getting route waypoints: {e}")
+        logger.error(f"[GalaxyGPS API] Error getting route waypoints {start}-{end}: {e}")
         return None
 
 
+def get_upcoming_waypoints(count: int = 10, before: int = 0) -> Optional[Dict[str, Any]]:
+    """
+    Get a window of route rows around the current position, e.g. for a lookahead strip.
+    
+    Args:
+        count: Rows from the current position (the next waypoint) onwards
+        before: Rows before the current position to include as well
+        
+    Returns:
+        Dictionary or None if no route loaded or error:
+        {
+            'start_index': int,            # Route index of the first row in 'waypoints'
+            'offset': int,                 # Current position in route (0-based)
+            'waypoints': tuple             # Route rows (tuples starting with the system name)
+        }
+        
+    Example:
+        window = galaxygps_api.get_upcoming_waypoints(5)
+        if window:
+            for row in window['waypoints']:
+                print(row[0])
+    """
+    instance = _get_instance()
+    if not instance or not hasattr(instance, 'route') or not instance.route:
+        return None
+    
+    try:
+        offset = instance.offset if hasattr(instance, 'offset') else 0
+        start = max(0, offset - max(0, before))
+        waypoints = get_route_waypoints_range(start, offset + max(0, count))
+        if waypoints is None:
+            return None
+        return {
+            'start_index': start,
+            'offset': offset,
+            'waypoints': waypoints
+        }
+    except Exception as e:
+        logger.error(f"[GalaxyGPS API] Error getting upcoming waypoints: {e}")
+        return None
+
+
+def iter_route_data(columns: Optional[Iterable[str]] = None, start: int = 0,
+                    end: Optional[int] = None) -> Iterator[Any]:
+    """
+    Iterate lazily over the full route data (every column of the imported or plotted route).
+    
+    Rows are produced one at a time as the caller advances, nothing is copied up
+    front. The iterator keeps reading the route that was loaded when it started.
+    
+    Args:
+        columns: Column names to return (case-insensitive, e.g. ["System Name", "Jumps"]);
+                 None for all columns
+        start: First row index (0-based)
+        end: Index after the last row; None for the end of the route
+        
+    Yields:
+        Tuple of the requested column values ('' if a row lacks the column), or a
+        read-only mapping of column name -> value when columns is None.
+        Nothing if no route loaded.
+        
+    Example:
+        for system, jumps in galaxygps_api.iter_route_data(["System Name", "Jumps"], 0, 50):
+            print(system, jumps)
+    """
+    instance = _get_instance()
+    rows = getattr(instance, 'route_full_data', None) if instance else None
+    if not rows:
+        return
+    keys = None if columns is None else tuple(column.strip().lower() for column in columns)
+    end = len(rows) if end is None else min(end, len(rows))
+    for idx in range(max(0, start), end):
+        row = rows[idx]
+        if keys is None:
+            yield MappingProxyType(dict(row))
+        else:
+            yield tuple(row.get(key, '') for key in keys)
+
+
 def get_current_waypoint() -> Optional[str]:
     """
     Get the current/next waypoint system name.
@@ -234,10 +430,17 @@ def get_route_progress() -> Optional[Dict[str, Any]]:
         current_waypoint = instance.route[offset] if 0 <= offset < total else None
         next_waypoint = instance.route[offset + 1] if offset + 1 < total else None
         
+        # Jump-weighted progress from the compiled route model (O(1) prefix-sum lookup)
+        model = instance._get_route_model() if hasattr(instance, '_get_route_model') else None
+        if model:
+            percent_complete = model.percent_complete(offset)
+        else:
+            percent_complete = (offset / total * 100) if total > 0 else 0.0
+        
         return {
             'current_index': offset,
             'total_waypoints': total,
-            'percent_complete': (offset / total * 100) if total > 0 else 0.0,
+            'percent_complete': percent_complete,
             'waypoints_remaining': max(0, total - offset),
             'current_waypoint': current_waypoint,
             'next_waypoint': next_waypoint
@@ -251,13 +454,56 @@ def get_route_progress() -> Optional[Dict[str, Any]]:
 # FLEET CARRIER API
 # =============================================================================
 
-def get_fleet_carriers() -> Optional[List[Dict[str, Any]]]:
+def get_fleet_carriers_snapshot() -> Optional[Snapshot]:
+    """
+    Get a versioned snapshot of all tracked fleet carriers.
+    
+    Returns:
+        Snapshot whose data is a tuple of read-only carrier mappings (see
+        get_fleet_carriers for the keys), or None if error. The version changes
+        whenever a carrier is added, updated or removed.
+        
+    Example:
+        snapshot = galaxygps_api.get_fleet_carriers_snapshot()
+        if snapshot and snapshot.version != last_version:
+            last_version = snapshot.version
+            for carrier in snapshot.data:
+                print(f"{carrier['callsign']}: {carrier['current_system']}")
+    """
+    instance = _get_instance()
+    if not instance or not getattr(instance, 'fleet_carrier_manager', None):
+        return None
+    
+    try:
+        manager = instance.fleet_carrier_manager
+        return _get_snapshot(
+            'carriers', (manager, manager.data_version),
+            lambda: tuple(_freeze_record(carrier) for carrier in manager.get_all_carriers())
+        )
+    except Exception as e:
+        logger.error(f"[GalaxyGPS API] Error getting fleet carriers snapshot: {e}")
+        return None
+
+
+def _find_carrier(callsign: str) -> Optional[Mapping[str, Any]]:
+    """Look up a carrier in the carriers snapshot."""
+    snapshot = get_fleet_carriers_snapshot()
+    if not snapshot or not callsign:
+        return None
+    for carrier in snapshot.data:
+        if carrier.get('callsign') == callsign:
+            return carrier
+    return None
+
+
+def get_fleet_carriers() -> Optional[Tuple[Mapping[str, Any], ...]]:
     """
     Get list of all tracked fleet carriers.
     
     Returns:
-        List of dictionaries containing carrier information, or None if error.
-        Returns a deep copy to prevent external modification.
+        Tuple of read-only mappings containing carrier information, or None if error.
+        The tuple is shared read-only (see get_fleet_carriers_snapshot); use
+        dict(carrier) for a modifiable copy.
         
         Each carrier dictionary contains:
         {
@@ -276,7 +522,8 @@ def get_fleet_carriers() -> Optional[List[Dict[str, Any]]]:
             'tritium_in_cargo': int,       # Tritium in cargo hold
             'icy_rings': bool,             # Has icy rings nearby
             'pristine': bool,              # Has pristine reserves nearby
-            'last_updated': str,           # Last update timestamp
+            'last_updated': str,           # Last update timestamp (ISO 8601, UTC)
+            'last_updated_epoch': int,     # Same time in epoch seconds (None if unknown)
             'source_galaxy': str           # Galaxy (Live/Legacy/Beta)
         }
         
@@ -286,24 +533,11 @@ def get_fleet_carriers() -> Optional[List[Dict[str, Any]]]:
             for carrier in carriers:
                 print(f"{carrier['callsign']}: {carrier['name']}")
     """
-    instance = _get_instance()
-    if not instance or not hasattr(instance, 'fleet_carrier_manager'):
-        return None
-    
-    try:
-        carriers_dict = instance.fleet_carrier_manager.get_all_carriers()
-        if not carriers_dict:
-            return []
-        
-        # Convert dict to list and return deep copy
-        carriers_list = list(carriers_dict.values())
-        return deepcopy(carriers_list)
-    except Exception as e:
-        logger.error(f"[GalaxyGPS API] Error getting fleet carriers: {e}")
-        return None
+    snapshot = get_fleet_carriers_snapshot()
+    return snapshot.data if snapshot else None
 
 
-def get_fleet_carrier(callsign: str) -> Optional[Dict[str, Any]]:
+def get_fleet_carrier(callsign: str) -> Optional[Mapping[str, Any]]:
     """
     Get information for a specific fleet carrier.
     
@@ -311,35 +545,28 @@ def get_fleet_carrier(callsign: str) -> Optional[Dict[str, Any]]:
         callsign: Fleet carrier callsign (e.g., "ABC-123")
         
     Returns:
-        Dictionary containing carrier information (see get_fleet_carriers for format),
+        Read-only mapping containing carrier information (see get_fleet_carriers for format),
         or None if carrier not found or error.
-        Returns a deep copy to prevent external modification.
         
     Example:
         carrier = galaxygps_api.get_fleet_carrier("ABC-123")
         if carrier:
             print(f"Carrier location: {carrier['current_system']}")
     """
-    instance = _get_instance()
-    if not instance or not hasattr(instance, 'fleet_carrier_manager'):
-        return None
-    
     try:
-        carrier = instance.fleet_carrier_manager.get_carrier(callsign)
-        return deepcopy(carrier) if carrier else None
+        return _find_carrier(callsign)
     except Exception as e:
         logger.error(f"[GalaxyGPS API] Error getting fleet carrier {callsign}: {e}")
         return None
 
 
-def get_selected_fleet_carrier() -> Optional[Dict[str, Any]]:
+def get_selected_fleet_carrier() -> Optional[Mapping[str, Any]]:
     """
     Get the currently selected fleet carrier in the GalaxyGPS UI.
     
     Returns:
-        Dictionary containing carrier information (see get_fleet_carriers for format),
+        Read-only mapping containing carrier information (see get_fleet_carriers for format),
         or None if no carrier selected or error.
-        Returns a deep copy to prevent external modification.
         
     Example:
         carrier = galaxygps_api.get_selected_fleet_carrier()
@@ -355,14 +582,40 @@ def get_selected_fleet_carrier() -> Optional[Dict[str, Any]]:
         if not callsign:
             return None
         
-        carrier = instance.fleet_carrier_manager.get_carrier(callsign)
-        return deepcopy(carrier) if carrier else None
+        return _find_carrier(callsign)
     except Exception as e:
         logger.error(f"[GalaxyGPS API] Error getting selected fleet carrier: {e}")
         return None
 
 
-def get_fleet_carrier_cargo(callsign: str) -> Optional[List[Dict[str, Any]]]:
+def get_fleet_carrier_cargo_snapshot(callsign: str) -> Optional[Snapshot]:
+    """
+    Get a versioned snapshot of the cargo of a specific fleet carrier.
+    
+    Args:
+        callsign: Fleet carrier callsign (e.g., "ABC-123")
+        
+    Returns:
+        Snapshot whose data is a tuple of read-only cargo mappings (see
+        get_fleet_carrier_cargo for the keys), or None if error. The version
+        changes when this carrier's cargo changes.
+    """
+    instance = _get_instance()
+    if not instance or not getattr(instance, 'cargo_manager', None):
+        return None
+    
+    try:
+        manager = instance.cargo_manager
+        return _get_snapshot(
+            f'cargo:{callsign}', (manager, manager.data_version),
+            lambda: tuple(_freeze_record(item) for item in manager.get_cargo_for_carrier(callsign))
+        )
+    except Exception as e:
+        logger.error(f"[GalaxyGPS API] Error getting cargo snapshot for {callsign}: {e}")
+        return None
+
+
+def get_fleet_carrier_cargo(callsign: str) -> Optional[Tuple[Mapping[str, Any], ...]]:
     """
     Get cargo details for a specific fleet carrier.
     
@@ -370,8 +623,8 @@ def get_fleet_carrier_cargo(callsign: str) -> Optional[List[Dict[str, Any]]]:
         callsign: Fleet carrier callsign (e.g., "ABC-123")
         
     Returns:
-        List of dictionaries containing cargo information, or None if error.
-        Returns a deep copy to prevent external modification.
+        Tuple of read-only mappings containing cargo information, or None if error.
+        The tuple is shared read-only (see get_fleet_carrier_cargo_snapshot).
         
         Each cargo dictionary contains:
         {
@@ -387,19 +640,38 @@ def get_fleet_carrier_cargo(callsign: str) -> Optional[List[Dict[str, Any]]]:
             for item in cargo:
                 print(f"{item['localized_name']}: {item['quantity']}")
     """
+    snapshot = get_fleet_carrier_cargo_snapshot(callsign)
+    return snapshot.data if snapshot else None
+
+
+def get_fleet_carrier_ships_snapshot(callsign: str) -> Optional[Snapshot]:
+    """
+    Get a versioned snapshot of the ships stored on a specific fleet carrier.
+    
+    Args:
+        callsign: Fleet carrier callsign (e.g., "ABC-123")
+        
+    Returns:
+        Snapshot whose data is a tuple of read-only ship mappings (see
+        get_fleet_carrier_ships for the keys), or None if error. The version
+        changes when this carrier's stored ships change.
+    """
     instance = _get_instance()
-    if not instance or not hasattr(instance, 'cargo_manager'):
+    if not instance or not getattr(instance, 'ships_manager', None):
         return None
     
     try:
-        cargo = instance.cargo_manager.get_cargo_for_carrier(callsign)
-        return deepcopy(cargo) if cargo else []
+        manager = instance.ships_manager
+        return _get_snapshot(
+            f'ships:{callsign}', (manager, manager.data_version),
+            lambda: tuple(_freeze_record(ship) for ship in manager.get_ships_for_carrier(callsign))
+        )
     except Exception as e:
-        logger.error(f"[GalaxyGPS API] Error getting cargo for {callsign}: {e}")
+        logger.error(f"[GalaxyGPS API] Error getting ships snapshot for {callsign}: {e}")
         return None
 
 
-def get_fleet_carrier_ships(callsign: str) -> Optional[List[Dict[str, Any]]]:
+def get_fleet_carrier_ships(callsign: str) -> Optional[Tuple[Mapping[str, Any], ...]]:
     """
     Get stored ships for a specific fleet carrier.
     
@@ -407,8 +679,8 @@ def get_fleet_carrier_ships(callsign: str) -> Optional[List[Dict[str, Any]]]:
         callsign: Fleet carrier callsign (e.g., "ABC-123")
         
     Returns:
-        List of dictionaries containing ship information, or None if error.
-        Returns a deep copy to prevent external modification.
+        Tuple of read-only mappings containing ship information, or None if error.
+        The tuple is shared read-only (see get_fleet_carrier_ships_snapshot).
         
         Each ship dictionary contains:
         {
@@ -423,16 +695,8 @@ def get_fleet_carrier_ships(callsign: str) -> Optional[List[Dict[str, Any]]]:
         if ships:
             print(f"Carrier has {len(ships)} ships stored")
     """
-    instance = _get_instance()
-    if not instance or not hasattr(instance, 'ships_manager'):
-        return None
-    
-    try:
-        ships = instance.ships_manager.get_ships_for_carrier(callsign)
-        return deepcopy(ships) if ships else []
-    except Exception as e:
-        logger.error(f"[GalaxyGPS API] Error getting ships for {callsign}: {e}")
-        return None
+    snapshot = get_fleet_carrier_ships_snapshot(callsign)
+    return snapshot.data if snapshot else None
 
 
 # =============================================================================
@@ -495,6 +759,155 @@ def is_docked() -> bool:
     return bool(instance.station)
 
 
+# =============================================================================
+# CHANGE NOTIFICATIONS
+# =============================================================================
+
+# Event names passed to subscribe(); callbacks get (event, payload) with the payload keys listed
+EVENT_ROUTE_LOADED = 'route_loaded'          # A route was loaded or its rows changed: total_waypoints, route_type
+EVENT_ROUTE_CLEARED = 'route_cleared'        # The route was cleared: (no keys)
+EVENT_WAYPOINT_CHANGED = 'waypoint_changed'  # The next waypoint changed: offset, next_stop
+EVENT_CARRIER_UPDATED = 'carrier_updated'    # A carrier was added or updated: callsign (None: all carriers)
+EVENT_CARRIER_REMOVED = 'carrier_removed'    # A carrier was removed: callsign
+EVENT_CARGO_CHANGED = 'cargo_changed'        # A carrier's cargo changed: callsign (None: all carriers)
+EVENT_SHIPS_CHANGED = 'ships_changed'        # A carrier's stored ships changed: callsign (None: all carriers)
+EVENTS = (EVENT_ROUTE_LOADED, EVENT_ROUTE_CLEARED, EVENT_WAYPOINT_CHANGED, EVENT_CARRIER_UPDATED,
+          EVENT_CARRIER_REMOVED, EVENT_CARGO_CHANGED, EVENT_SHIPS_CHANGED)
+
+# Tk virtual event used to hand notifications raised on worker threads to the Tk thread
+_NOTIFY_VIRTUAL_EVENT = '<<GalaxyGPSApiNotify>>'
+
+_subscribers: Dict[str, List[Callable[[str, Mapping[str, Any]], None]]] = {}
+_pending_events: List[Tuple[str, Mapping[str, Any]]] = []
+_dispatch_scheduled = False
+_notify_widget = None
+_notify_lock = threading.Lock()
+
+
+def subscribe(event: str, callback: Callable[[str, Mapping[str, Any]], None]) -> bool:
+    """
+    Call a function whenever GalaxyGPS data changes.
+    
+    Callbacks run on the Tk (main) thread, batched: changes made in one go (e.g. a
+    CAPI update touching a carrier and its cargo) are delivered together once
+    GalaxyGPS is idle, and repeats of the same event in a batch are delivered once.
+    An exception raised by a callback is logged and does not affect other subscribers.
+    
+    Args:
+        event: One of the EVENT_* names
+        callback: Called as callback(event, payload); payload is a read-only mapping
+                  (see the EVENT_* definitions for its keys)
+        
+    Returns:
+        True if subscribed, False if the event name is unknown
+        
+    Example:
+        def on_carrier(event, payload):
+            carrier = galaxygps_api.get_fleet_carrier(payload['callsign'])
+        
+        galaxygps_api.subscribe(galaxygps_api.EVENT_CARRIER_UPDATED, on_carrier)
+    """
+    if event not in EVENTS or not callable(callback):
+        logger.warning(f"[GalaxyGPS API] Cannot subscribe to unknown event {event!r}")
+        return False
+    with _notify_lock:
+        callbacks = _subscribers.setdefault(event, [])
+        if callback not in callbacks:
+            callbacks.append(callback)
+    return True
+
+
+def unsubscribe(event: str, callback: Callable[[str, Mapping[str, Any]], None]) -> bool:
+    """
+    Stop calling a function subscribed with subscribe().
+    
+    Args:
+        event: Event name it was subscribed to
+        callback: The subscribed function
+        
+    Returns:
+        True if it was subscribed, False otherwise
+    """
+    with _notify_lock:
+        callbacks = _subscribers.get(event)
+        if not callbacks or callback not in callbacks:
+            return False
+        callbacks.remove(callback)
+    return True
+
+
+def attach_tk(widget) -> None:
+    """
+    Set the Tk widget notifications are dispatched through.
+    
+    This is called internally by load.py once the plugin frame exists (notifications
+    raised before are held until then). Other plugins should NOT call this function.
+    
+    Args:
+        widget: Tk widget of the GalaxyGPS frame
+    """
+    global _notify_widget, _dispatch_scheduled
+    widget.bind(_NOTIFY_VIRTUAL_EVENT, lambda event: _dispatch_pending(), add='+')
+    with _notify_lock:
+        _notify_widget = widget
+        pending = bool(_pending_events) and not _dispatch_scheduled
+        if pending:
+            _dispatch_scheduled = True
+    if pending:
+        widget.after_idle(_dispatch_pending)
+
+
+def _notify(event: str, **payload) -> None:
+    """
+    Queue a change notification for subscribers (called by GalaxyGPS, from any thread).
+    
+    Args:
+        event: One of the EVENT_* names
+        **payload: Event details
+    """
+    global _dispatch_scheduled
+    with _notify_lock:
+        if not _subscribers.get(event):
+            return
+        item = (event, MappingProxyType(payload))
+        if item in _pending_events:
+            return
+        _pending_events.append(item)
+        if _dispatch_scheduled or _notify_widget is None:
+            return
+        _dispatch_scheduled = True
+        widget = _notify_widget
+    try:
+        if threading.current_thread() is threading.main_thread():
+            widget.after_idle(_dispatch_pending)
+        else:
+            # Tk calls are only safe from the main thread; a virtual event is queued for it instead
+            widget.event_generate(_NOTIFY_VIRTUAL_EVENT, when='tail')
+    except Exception:
+        # Widget gone (shutting down); drop what is queued
+        logger.debug(f"[GalaxyGPS API] Could not schedule notifications: {traceback.format_exc()}")
+        with _notify_lock:
+            _pending_events.clear()
+            _dispatch_scheduled = False
+
+
+def _dispatch_pending() -> None:
+    """Deliver queued notifications to subscribers (Tk thread)."""
+    global _dispatch_scheduled
+    with _notify_lock:
+        batch = list(_pending_events)
+        _pending_events.clear()
+        _dispatch_scheduled = False
+        callbacks_by_event = {event: list(callbacks) for event, callbacks in _subscribers.items()}
+    for event, payload in batch:
+        for callback in callbacks_by_event.get(event, ()):
+            try:
+                callback(event, payload)
+            except Exception:
+                logger.warning(f'!! [GalaxyGPS API] Error in {event} subscriber: ' + traceback.format_exc(),
+                               exc_info=False)
+
+
 # =============================================================================
 # UTILITY FUNCTIONS
 # =============================================================================
@@ -0,0 +1,102 @@
+import logging
+import os
+import string
+import traceback
+from typing import Dict, Iterable, List, Sequence
+
+from config import appname  # type: ignore
+
+# We need a name of plugin dir, not column_widths.py dir
+plugin_name = os.path.basename(os.path.dirname(os.path.dirname(__file__)))
+logger = logging.getLogger(f'{appname}.{plugin_name}')
+
+# Font used for route table cells (see ui/route_table.py)
+ROUTE_TABLE_FONT_FAMILY = "Arial"
+ROUTE_TABLE_FONT_SIZE = 9
+
+
+class CharWidthTable:
+    """
+    Pixel widths of the printable ASCII characters in one font.
+
+    Built once on the Tk main thread with tkfont.Font.measure. Text width is then
+    the sum of its character widths, which needs no Tk calls and can run on a worker
+    thread. Characters outside the table count as the widest known character, so
+    the estimate errs on the wide side.
+    """
+
+    def __init__(self, font):
+        """
+        Measure every printable character.
+
+        Args:
+            font: tkfont.Font to measure with (main thread only)
+        """
+        self.widths: Dict[str, int] = {
+            char: font.measure(char) for char in string.printable if char not in '\t\n\r\x0b\x0c'
+        }
+        self.fallback = max(self.widths.values()) if self.widths else 0
+        # Changes when the font or the display scaling changes, invalidating cached widths
+        self.key = (font.actual('family'), font.actual('size'), sum(self.widths.values()))
+
+    def measure(self, text: str) -> int:
+        """
+        Estimate the pixel width of a text.
+
+        Args:
+            text: Text to measure
+
+        Returns:
+            Width in pixels
+        """
+        widths = self.widths
+        fallback = self.fallback
+        return sum(widths.get(char, fallback) for char in text)
+
+
+def measure_column_text_widths(route_data: Sequence[Dict], fields: Iterable[str],
+                               char_table: CharWidthTable) -> Dict[str, int]:
+    """
+    Get the widest cell text of each column of a route.
+
+    Args:
+        route_data: Route rows as dicts keyed by lowercase field name
+        fields: Lowercase field names to measure
+        char_table: Character width table of the table font
+
+    Returns:
+        Dict of lowercase field name -> widest text in pixels (without padding)
+    """
+    fields = list(fields)
+    column_widths = {field: 0 for field in fields}
+    # Columns repeat a lot of values (body subtypes, yes/no, jumps), so measure each distinct value once
+    seen: Dict[str, set] = {field: set() for field in fields}
+
+    for route_entry in route_data:
+        for field in fields:
+            raw_value = route_entry.get(field)
+            if raw_value is None:
+                continue
+            value = str(raw_value).strip()
+            if not value or value.lower() == 'none' or value in seen[field]:
+                continue
+            seen[field].add(value)
+            width = char_table.measure(value)
+            if width > column_widths[field]:
+                column_widths[field] = width
+
+    return column_widths
+
+
+def run_column_width_worker(route_data: List[Dict], fields: List[str], char_table: CharWidthTable,
+                            result_queue) -> None:
+    """
+    Worker: measure route table column widths off the main thread.
+
+    Puts {'type': 'done', 'widths': {...}} or {'type': 'error'} on result_queue.
+    """
+    try:
+        result_queue.put({'type': 'done', 'widths': measure_column_text_widths(route_data, fields, char_table)})
+    except Exception:
+        logger.warning('!! ' + traceback.format_exc(), exc_info=False)
+        result_queue.put({'type': 'error'})
@@ -0,0 +1,40 @@
+import os
+import tempfile
+from contextlib import contextmanager
+
+
+@contextmanager
+def atomic_open(path, mode='w', **kwargs):
+    """
+    Open a file for writing so that it is replaced atomically.
+
+    Data is written to a temporary file in the same directory, flushed to disk,
+    and renamed over the target when the block exits without an exception. If
+    EDMC is killed mid-write, the previous file stays intact instead of being
+    left truncated. On error the temporary file is removed and the exception
+    re-raised.
+
+    Args:
+        path: Target file path
+        mode: 'w' or 'wb'
+        **kwargs: Passed to open() (encoding, newline, ...)
+
+    Example:
+        with atomic_open(self.carriers_file, 'w', encoding='utf-8', newline='') as csvfile:
+            writer = csv.writer(csvfile)
+            ...
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix='.' + os.path.basename(path) + '.', suffix='.tmp', dir=directory)
+    try:
+        with open(fd, mode, **kwargs) as fh:
+            yield fh
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,116 @@
+import logging
+import os
+import threading
+import traceback
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests  # type: ignore
+from requests.adapters import HTTPAdapter  # type: ignore
+from urllib3.util.retry import Retry  # type: ignore
+
+from config import appname, user_agent  # type: ignore
+import timeout_session  # type: ignore
+
+# We need a name of plugin dir, not http_client.py dir
+plugin_name = os.path.basename(os.path.dirname(os.path.dirname(__file__)))
+logger = logging.getLogger(f'{appname}.{plugin_name}')
+
+# Timeout for requests that do not pass their own
+HTTP_TIMEOUT_S = 10
+# Hosts whose connections are kept alive, and connections kept per host
+HTTP_POOL_HOSTS = 8
+HTTP_POOL_SIZE = 4
+# Requests running at once against the same host
+HTTP_MAX_PER_HOST = 4
+# Retries of idempotent requests after connection errors and these statuses,
+# waiting HTTP_RETRY_BACKOFF_S * 2^n between attempts (Retry-After is honoured)
+HTTP_RETRIES = 2
+HTTP_RETRY_BACKOFF_S = 0.5
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+_host_limits: Dict[str, threading.BoundedSemaphore] = {}
+
+
+def _new_session() -> requests.Session:
+    session = timeout_session.new_session()
+    session.headers['User-Agent'] = user_agent + ' GalaxyGPS'
+    retry = Retry(
+        total=HTTP_RETRIES,
+        backoff_factor=HTTP_RETRY_BACKOFF_S,
+        status_forcelist=HTTP_RETRY_STATUSES,
+        allowed_methods=frozenset(['GET', 'HEAD']),  # never resubmit a POST (Spansh route jobs)
+        raise_on_status=False,  # hand the last response to the caller, which checks status codes
+    )
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_HOSTS, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Get the plugin's shared HTTP session, creating it on first use.
+
+    Returns:
+        requests.Session with the GalaxyGPS User-Agent, pooled keep-alive connections
+        and retries of idempotent requests
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = _new_session()
+        return _session
+
+
+def _host_limit(url: str) -> threading.BoundedSemaphore:
+    host = urlsplit(url).netloc.lower()
+    with _session_lock:
+        limit = _host_limits.get(host)
+        if limit is None:
+            limit = _host_limits[host] = threading.BoundedSemaphore(HTTP_MAX_PER_HOST)
+        return limit
+
+
+def request(method: str, url: str, **kwargs) -> requests.Response:
+    """
+    Send a request through the shared session, waiting for a free slot for its host.
+
+    Args:
+        method: HTTP method
+        url: Request URL
+        **kwargs: Passed to requests.Session.request (timeout defaults to HTTP_TIMEOUT_S)
+
+    Returns:
+        Response (the body is read before the host slot is released)
+
+    Raises:
+        requests.RequestException: On connection errors and timeouts, after retries
+    """
+    kwargs.setdefault('timeout', HTTP_TIMEOUT_S)
+    with _host_limit(url):
+        return get_session().request(method, url, **kwargs)
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """GET url through the shared session (see request)."""
+    return request('GET', url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    """POST to url through the shared session (see request); POSTs are never retried."""
+    return request('POST', url, **kwargs)
+
+
+def close() -> None:
+    """Close the pooled connections; the next request opens a new session."""
+    global _session
+    with _session_lock:
+        session, _session = _session, None
+    if session is not None:
+        try:
+            session.close()
+        except Exception:
+            logger.warning('!! Error closing HTTP session: ' + traceback.format_exc(), exc_info=False)
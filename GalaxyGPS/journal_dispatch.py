@@ -0,0 +1,216 @@
+import logging
+import os
+import traceback
+from typing import Callable, Dict, Iterable, List
+
+from config import appname  # type: ignore
+
+# We need a name of plugin dir, not journal_dispatch.py dir
+plugin_name = os.path.basename(os.path.dirname(os.path.dirname(__file__)))
+logger = logging.getLogger(f'{appname}.{plugin_name}')
+
+# Handler signature: handler(plugin, entry, state)
+JournalHandler = Callable[[object, Dict, Dict], None]
+
+# Source galaxy of journal data; the journal does not say, so carriers updated from it count as Live
+JOURNAL_SOURCE_GALAXY = 'Live'
+
+
+class JournalDispatcher:
+    """
+    Map of journal event names to the handlers interested in them.
+
+    Built once at plugin start; every journal line then costs one dict lookup, and
+    events no subsystem registered for return immediately.
+    """
+
+    def __init__(self, plugin):
+        """
+        Args:
+            plugin: GalaxyGPS instance passed to every handler
+        """
+        self.plugin = plugin
+        self._handlers: Dict[str, List[JournalHandler]] = {}
+
+    def register(self, event_names: Iterable[str], handler: JournalHandler) -> None:
+        """
+        Register a handler for one or more event names.
+
+        Handlers of one event run in registration order.
+
+        Args:
+            event_names: Journal event names ('event' field)
+            handler: Called as handler(plugin, entry, state)
+        """
+        for event_name in event_names:
+            self._handlers.setdefault(event_name, []).append(handler)
+
+    def dispatch(self, entry: Dict, state: Dict) -> None:
+        """
+        Run the handlers registered for a journal entry's event.
+
+        A failing handler is logged and does not stop the others.
+
+        Args:
+            entry: Journal entry
+            state: EDMC monitor state
+        """
+        handlers = self._handlers.get(entry.get('event'))
+        if not handlers:
+            return
+        for handler in handlers:
+            try:
+                handler(self.plugin, entry, state)
+            except Exception:
+                logger.warning('!! ' + traceback.format_exc(), exc_info=False)
+
+
+def _is_at_carrier(entry: Dict, state: Dict) -> bool:
+    """Check if the player is docked at a fleet carrier (for Location/Cargo events)."""
+    station_type = state.get('StationType', '') if state else ''
+    station_name = state.get('StationName', '') if state else entry.get('StationName', '')
+    return bool((station_type and 'fleetcarrier' in station_type.lower()) or (
+        station_name and 'FC' in station_name.upper()
+    ))
+
+
+# -- Route --
+
+def _on_route_system_event(plugin, entry, state):
+    # Arrived at (or scanned) the next waypoint
+    if entry["StarSystem"].lower() == plugin.next_stop.lower():
+        plugin.update_route()
+        plugin.set_source_ac(entry["StarSystem"])
+
+
+def _on_route_discovery_scan(plugin, entry, state):
+    if entry['SystemName'] == plugin.next_stop:
+        plugin.update_route()
+
+
+def register_route_handlers(dispatcher: JournalDispatcher) -> None:
+    dispatcher.register(['FSDJump', 'Location', 'SupercruiseEntry', 'SupercruiseExit'], _on_route_system_event)
+    dispatcher.register(['FSSDiscoveryScan'], _on_route_discovery_scan)
+
+
+# -- Stored ships and modules --
+
+def _on_stored_ships(plugin, entry, state):
+    if plugin.ships_manager and plugin.fleet_carrier_manager:
+        # Get list of known carrier callsigns
+        known_carriers = list(plugin.fleet_carrier_manager.carriers.keys())
+        plugin.ships_manager.update_from_journal_event(entry, known_carriers)
+
+
+def _on_stored_modules(plugin, entry, state):
+    if plugin.modules_manager and plugin.fleet_carrier_manager:
+        # Get list of known carrier callsigns
+        known_carriers = list(plugin.fleet_carrier_manager.carriers.keys())
+        plugin.modules_manager.update_from_journal_event(entry, known_carriers)
+
+
+def register_ships_handlers(dispatcher: JournalDispatcher) -> None:
+    dispatcher.register(['StoredShips'], _on_stored_ships)
+
+
+def register_modules_handlers(dispatcher: JournalDispatcher) -> None:
+    dispatcher.register(['StoredModules'], _on_stored_modules)
+
+
+# -- Fleet carriers (journal fallback to CAPI) --
+
+def _on_carrier_event(plugin, entry, state):
+    if not plugin.fleet_carrier_manager:
+        return
+    # Always update for carrier-specific events
+    updated = plugin.fleet_carrier_manager.update_carrier_from_journal(
+        entry['event'], entry, state, JOURNAL_SOURCE_GALAXY
+    )
+    # Update GUI if carrier was updated
+    if updated:
+        plugin.request_fleet_carrier_refresh()
+
+
+def _on_carrier_cargo(plugin, entry, state):
+    # Only update cargo if we're at a fleet carrier station
+    if not plugin.fleet_carrier_manager or not _is_at_carrier(entry, state):
+        return
+    updated = plugin.fleet_carrier_manager.update_carrier_from_journal(
+        'Cargo', entry, state, JOURNAL_SOURCE_GALAXY
+    )
+    # Update GUI if carrier was updated
+    if updated:
+        plugin.request_fleet_carrier_refresh('dropdown', 'system', 'rings', 'tritium', 'balance')
+
+
+def _on_carrier_location(plugin, entry, state):
+    # Location event when docked at carrier - update location if carrier moved
+    if not plugin.fleet_carrier_manager or not entry.get('Docked') or not _is_at_carrier(entry, state):
+        return
+    # Only update if we have a new system (carrier may have jumped)
+    new_system = entry.get('StarSystem', '')
+    if not new_system:
+        return
+    # Find carrier by station name pattern
+    callsign = plugin.fleet_carrier_manager.find_carrier_for_journal_event(entry, state)
+    if not callsign:
+        return
+    carrier = plugin.fleet_carrier_manager.get_carrier(callsign)
+    if carrier and carrier.get('current_system', '').lower() != new_system.lower():
+        # Carrier location changed - update it
+        station_name = state.get('StationName', '') if state else entry.get('StationName', '')
+        location_event_data = {
+            'StationName': entry.get('StationName', station_name),
+            'StarSystem': new_system,
+            'SystemAddress': str(entry.get('SystemAddress', ''))
+        }
+        updated = plugin.fleet_carrier_manager.update_carrier_from_journal(
+            'CarrierJump', location_event_data, state, JOURNAL_SOURCE_GALAXY
+        )
+        # Update GUI if carrier location was updated
+        if updated:
+            plugin.request_fleet_carrier_refresh()
+
+
+def register_carrier_handlers(dispatcher: JournalDispatcher) -> None:
+    dispatcher.register(['CarrierJump', 'CarrierDepositFuel', 'CarrierStats'], _on_carrier_event)
+    dispatcher.register(['Cargo'], _on_carrier_cargo)
+    dispatcher.register(['Location'], _on_carrier_location)
+
+
+# -- Carrier cargo details --
+
+def _on_cargo(plugin, entry, state):
+    # Detailed cargo cache (fallback when CAPI not available), only while docked at a carrier
+    if not plugin.cargo_manager or not plugin.fleet_carrier_manager or not _is_at_carrier(entry, state):
+        return
+    callsign = plugin.fleet_carrier_manager.find_carrier_for_journal_event(entry, state)
+    if callsign:
+        inventory = entry.get('Inventory', [])
+        if isinstance(inventory, list):
+            # Pass journal timestamp for proper comparison
+            event_timestamp = entry.get('timestamp', '')
+            plugin.cargo_manager.update_cargo_from_journal(callsign, inventory, JOURNAL_SOURCE_GALAXY, event_timestamp)
+
+
+def register_cargo_handlers(dispatcher: JournalDispatcher) -> None:
+    dispatcher.register(['Cargo'], _on_cargo)
+
+
+def build_journal_dispatcher(plugin) -> JournalDispatcher:
+    """
+    Build the journal dispatcher with every subsystem's handlers.
+
+    Args:
+        plugin: GalaxyGPS instance
+
+    Returns:
+        JournalDispatcher
+    """
+    dispatcher = JournalDispatcher(plugin)
+    register_route_handlers(dispatcher)
+    register_ships_handlers(dispatcher)
+    register_modules_handlers(dispatcher)
+    register_carrier_handlers(dispatcher)
+    register_cargo_handlers(dispatcher)
+    return dispatcher
@@ -0,0 +1,86 @@
+import json
+import logging
+import os
+import threading
+import time
+from typing import Callable, Optional
+
+import requests  # type: ignore
+
+from config import appname  # type: ignore
+
+from . import http_client
+
+# We need a name of plugin dir, not spansh_jobs.py dir
+plugin_name = os.path.basename(os.path.dirname(os.path.dirname(__file__)))
+logger = logging.getLogger(f'{appname}.{plugin_name}')
+
+SPANSH_RESULTS_URL = "https://spansh.co.uk/api/results/{job}"
+# First wait before asking for a job's result, growing by SPANSH_JOB_POLL_BACKOFF
+# after every "still running" answer up to SPANSH_JOB_POLL_MAX_S
+SPANSH_JOB_POLL_INITIAL_S = 0.5
+SPANSH_JOB_POLL_BACKOFF = 1.5
+SPANSH_JOB_POLL_MAX_S = 5.0
+# Give up on a job that is still running after this long (long neutron plots can take minutes)
+SPANSH_JOB_BUDGET_S = 300.0
+# Timeout of a single result request
+SPANSH_JOB_REQUEST_TIMEOUT_S = 10
+
+
+class SpanshJobCancelled(Exception):
+    """The job was cancelled by the user before Spansh finished it."""
+
+
+class SpanshJobTimeout(Exception):
+    """Spansh was still working on the job when the time budget ran out."""
+
+
+def wait_for_spansh_job(job: str, cancel_event: threading.Event, budget_s: float = SPANSH_JOB_BUDGET_S,
+                        on_progress: Optional[Callable[[float, str], None]] = None) -> requests.Response:
+    """
+    Poll Spansh for the result of a job until it is done (called on a worker thread).
+
+    The interval between polls starts short, so quick jobs return quickly, and
+    grows while Spansh keeps answering 202 (still working), so long jobs do not
+    hammer the API. The cancel event is checked while waiting between polls.
+
+    Args:
+        job: Job ID returned when the job was submitted
+        cancel_event: Set to abandon the job
+        budget_s: Seconds to wait for the job before giving up
+        on_progress: Called after every "still running" answer as
+                     on_progress(elapsed seconds, Spansh job status or '')
+
+    Returns:
+        The final (non-202) response; the caller checks its status code
+
+    Raises:
+        SpanshJobCancelled: cancel_event was set
+        SpanshJobTimeout: The job did not finish within budget_s
+        requests.RequestException: A poll failed (after the HTTP client's retries)
+    """
+    url = SPANSH_RESULTS_URL.format(job=job)
+    started = time.monotonic()
+    interval = SPANSH_JOB_POLL_INITIAL_S
+    while True:
+        elapsed = time.monotonic() - started
+        remaining = budget_s - elapsed
+        if remaining <= 0:
+            raise SpanshJobTimeout(f"Spansh job {job} still running after {elapsed:.0f}s")
+        if cancel_event.wait(min(interval, remaining)):
+            raise SpanshJobCancelled(f"Spansh job {job} cancelled")
+
+        response = http_client.get(url, timeout=SPANSH_JOB_REQUEST_TIMEOUT_S)
+        if cancel_event.is_set():
+            raise SpanshJobCancelled(f"Spansh job {job} cancelled")
+        if response.status_code != 202:
+            return response
+
+        status = ''
+        try:
+            status = str(json.loads(response.content).get('status', ''))
+        except (json.JSONDecodeError, ValueError, AttributeError):
+            pass
+        if on_progress is not None:
+            on_progress(time.monotonic() - started, status)
+        interval = min(interval * SPANSH_JOB_POLL_BACKOFF, SPANSH_JOB_POLL_MAX_S)
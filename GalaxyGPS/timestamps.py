@@ -0,0 +1,87 @@
+import calendar
+import time
+from typing import Optional, Tuple
+
+# Journal / CAPI timestamp format, used for every stored carrier and cargo timestamp
+ISO_TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+# Format older versions wrote for carriers ("2024-01-31 12:00:00 UTC"), migrated on load
+LEGACY_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S UTC'
+
+
+def timestamp_to_epoch(timestamp) -> Optional[int]:
+    """
+    Convert a stored or incoming timestamp to seconds since the epoch (UTC).
+
+    Accepts ISO 8601 ("2024-01-31T12:00:00Z") and the legacy "2024-01-31 12:00:00 UTC"
+    format. Both have fixed field positions, so the fields are sliced out directly
+    instead of going through strptime.
+
+    Args:
+        timestamp: Timestamp string
+
+    Returns:
+        Epoch seconds, or None if the value is empty or not in either format
+    """
+    if not isinstance(timestamp, str):
+        return None
+    length = len(timestamp)
+    if length == 20 and timestamp[10] == 'T' and timestamp[19] == 'Z':
+        pass
+    elif length == 23 and timestamp[10] == ' ' and timestamp[19:] == ' UTC':
+        pass
+    else:
+        return None
+    if timestamp[4] != '-' or timestamp[7] != '-' or timestamp[13] != ':' or timestamp[16] != ':':
+        return None
+    try:
+        fields = (int(timestamp[0:4]), int(timestamp[5:7]), int(timestamp[8:10]),
+                  int(timestamp[11:13]), int(timestamp[14:16]), int(timestamp[17:19]))
+    except ValueError:
+        return None
+    year, month, day, hour, minute, second = fields
+    if not (1 <= month <= 12 and 1 <= day <= 31 and hour <= 23 and minute <= 59 and second <= 60):
+        return None
+    return calendar.timegm(fields)
+
+
+def epoch_to_timestamp(epoch: int) -> str:
+    """
+    Format epoch seconds as an ISO 8601 UTC timestamp.
+
+    Args:
+        epoch: Seconds since the epoch
+
+    Returns:
+        Timestamp like "2024-01-31T12:00:00Z"
+    """
+    return time.strftime(ISO_TIMESTAMP_FORMAT, time.gmtime(epoch))
+
+
+def utc_now_timestamp() -> Tuple[str, int]:
+    """
+    Get the current time as a stored timestamp.
+
+    Returns:
+        (ISO 8601 timestamp, epoch seconds)
+    """
+    epoch = int(time.time())
+    return epoch_to_timestamp(epoch), epoch
+
+
+def normalize_timestamp(timestamp) -> Tuple[str, Optional[int]]:
+    """
+    Normalize a timestamp for storage: legacy values are rewritten in ISO 8601.
+
+    Args:
+        timestamp: Timestamp string as loaded or received
+
+    Returns:
+        (timestamp to store, epoch seconds or None if it could not be parsed;
+        unparseable values are returned unchanged)
+    """
+    epoch = timestamp_to_epoch(timestamp)
+    if epoch is None:
+        return timestamp, None
+    if timestamp[10] != 'T':
+        return epoch_to_timestamp(epoch), epoch
+    return timestamp, epoch
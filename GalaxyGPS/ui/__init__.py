@@ -5,6 +5,8 @@ UI components for GalaxyGPS plugin.
 from .window_manager import create_themed_window, restore_window_position
 from .widget_styler import style_scrollbars
 from .message_dialog import showinfo, showwarning, showerror, askyesno, askokcancel
+from .route_table import VirtualRouteTable
 
 __all__ = ['create_themed_window', 'restore_window_position', 'style_scrollbars',
-           'showinfo', 'showwarning', 'showerror', 'askyesno', 'askokcancel']
+           'showinfo', 'showwarning', 'showerror', 'askyesno', 'askokcancel',
+           'VirtualRouteTable']
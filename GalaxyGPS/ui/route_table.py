@@ -0,0 +1,458 @@
+"""
+Virtualized route table for the Route View window.
+"""
+
+import math
+import tkinter as tk
+import tkinter.ttk as ttk
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from theme import theme  # type: ignore
+from ttkHyperlinkLabel import HyperlinkLabel  # type: ignore
+
+from ..ui_helpers import ThemeSafeCanvas
+
+# Background of the row for the current next waypoint
+HIGHLIGHT_BG = "#fff9c4"
+
+# Numeric columns that are displayed rounded UP to the nearest hundredth
+ROUNDED_FIELDS = ("distance to arrival", "distance remaining", "distance", "fuel used", "fuel left")
+
+# Rows scrolled per mousewheel notch
+WHEEL_SCROLL_ROWS = 3
+
+# Pooled rows beyond the ones that fit exactly, so a partially visible last row is rendered
+EXTRA_POOL_ROWS = 1
+
+CELL_PADX = 2
+CELL_PADY = 5
+
+
+def _cell_text(route_entry: Dict, field_lower: str) -> str:
+    """Get a display string from a route row, treating None/"None" as empty."""
+    raw_value = route_entry.get(field_lower, '')
+    if raw_value is None or str(raw_value).strip().lower() == 'none':
+        return ''
+    return str(raw_value).strip() if isinstance(raw_value, str) else str(raw_value)
+
+
+class _PooledRow:
+    """Widgets of one grid row that get re-bound to different route rows while scrolling."""
+
+    def __init__(self, grid_row: int):
+        self.grid_row = grid_row
+        self.cells: List[Dict] = []
+        self.separators: List[ttk.Separator] = []
+        self.visible = True
+        self.data_idx: Optional[int] = None
+
+
+class VirtualRouteTable:
+    """
+    Route table that only creates widgets for the rows that fit in the viewport.
+
+    The header stays in grid row 0 and a small pool of rows below it is re-bound to
+    the route rows at the current scroll position. Scrolling reconfigures the pooled
+    widgets (text, colors, dots) instead of creating or moving widgets, so the widget
+    count depends on the window height and not on the route length.
+
+    Columns are (kind, field, header) tuples, where kind is one of:
+        'step':     1-based row number
+        'edsm':     EDSM button for the system of the row
+        'system':   system name, hyperlinked to Inara
+        'checkbox': yes/no field drawn as a colored dot
+        'numeric':  right-aligned value
+        'text':     left-aligned value
+    """
+
+    def __init__(self, table_frame: tk.Frame, canvas: tk.Canvas, route_data: Sequence[Dict],
+                 columns: List[Tuple[str, str, str]], row_colors: Tuple[str, str],
+                 system_field: str, roadtoriches: bool = False,
+                 open_edsm: Optional[Callable[[str], None]] = None,
+                 open_inara: Optional[Callable[[str], None]] = None,
+                 yscrollcommand: Optional[Callable[[float, float], None]] = None):
+        """
+        Create the header and the first pooled row.
+
+        Args:
+            table_frame: Frame the table is gridded into (inside the scrolling canvas)
+            canvas: Canvas hosting the table, used for the viewport height and horizontal scrolling
+            route_data: Route rows as dicts keyed by lowercase field name
+            columns: Column specs as (kind, lowercase field name, header text)
+            row_colors: Alternating (even, odd) row backgrounds; empty strings use the theme background
+            system_field: Lowercase name of the system name field
+            roadtoriches: True to blank repeated system names (body rows of the same system)
+            open_edsm: Called with the system name when an EDSM button is clicked
+            open_inara: Called with the system name when a system name is clicked
+            yscrollcommand: Called with (first, last) fractions whenever the visible rows change
+        """
+        self.table_frame = table_frame
+        self.canvas = canvas
+        self.route_data = route_data
+        # Fixed at creation: column widths were measured for these rows
+        self.row_count = len(route_data)
+        self.columns = columns
+        self.row_colors = row_colors
+        self.system_field = system_field
+        self.roadtoriches = roadtoriches
+        self.open_edsm = open_edsm
+        self.open_inara = open_inara
+        self.yscrollcommand = yscrollcommand
+
+        self.highlighted_rows: Set[int] = set()
+        self.first_row = 0
+        # Rows that fit completely in the viewport, and pooled rows in use (one more for a partial row)
+        self.fully_visible = 1
+        self.visible_count = 1
+        self.pool: List[_PooledRow] = []
+
+        self.default_bg = table_frame.cget('bg')
+        self.text_fg = None
+        self.button_fg = None
+
+        self._create_header()
+        self._grow_pool(1)
+        self.table_frame.update_idletasks()
+        self.header_height = max(
+            (widget.winfo_reqheight() for widget in self.header_widgets), default=0
+        ) + 2 * CELL_PADY
+        self.row_height = max(1, self._measure_row_height(self.pool[0]))
+
+    def _create_header(self) -> None:
+        self.header_widgets = []
+        last_col = len(self.columns) - 1
+        for col_idx, (kind, _field, header) in enumerate(self.columns):
+            # Right-align numeric columns, center EDSM and indicator columns, left-align the rest
+            if kind in ('edsm', 'checkbox'):
+                anchor, sticky = "c", tk.EW
+            elif kind == 'numeric':
+                anchor, sticky = "e", tk.E
+            else:
+                anchor, sticky = "w", tk.W
+            label = tk.Label(self.table_frame, text=header, font=("Arial", 9, "bold"), anchor=anchor)
+            label.grid(row=0, column=col_idx*2, padx=CELL_PADX, pady=CELL_PADY, sticky=sticky)
+            theme.update(label)
+            self.header_widgets.append(label)
+            if col_idx < last_col:
+                separator = ttk.Separator(self.table_frame, orient=tk.VERTICAL)
+                separator.grid(row=0, column=col_idx*2+1, padx=0, pady=2, sticky=tk.NS)
+                theme.update(separator)
+
+    def _label(self, **kwargs) -> tk.Label:
+        label = tk.Label(self.table_frame, **kwargs)
+        if self.row_colors[0]:
+            label.configure(bg=self.row_colors[0])
+        theme.update(label)
+        if self.text_fg is None:
+            self.text_fg = label.cget('foreground')
+        return label
+
+    def _create_row(self, grid_row: int) -> _PooledRow:
+        """Create the widgets of one pooled row in the given grid row."""
+        pooled = _PooledRow(grid_row)
+        last_col = len(self.columns) - 1
+        row_bg = self.row_colors[0]
+
+        for col_idx, (kind, field_lower, _header) in enumerate(self.columns):
+            column = col_idx * 2
+            cell = {'kind': kind, 'field': field_lower}
+
+            if kind == 'edsm':
+                # The button and an empty label share the cell; only one is gridded at a time
+                button = tk.Button(self.table_frame, text="EDSM",
+                                   command=lambda c=cell: self._on_edsm_click(c))
+                if row_bg:
+                    button.configure(bg=row_bg)
+                button.grid(row=grid_row, column=column, padx=CELL_PADX, pady=CELL_PADY, sticky=tk.W)
+                theme.update(button)
+                if self.button_fg is None:
+                    self.button_fg = button.cget('foreground')
+                empty = self._label(text="")
+                empty.grid(row=grid_row, column=column, padx=CELL_PADX, pady=CELL_PADY, sticky=tk.W)
+                empty.grid_remove()
+                cell.update(link=button, empty=empty, link_shown=True, system=None)
+            elif kind == 'system':
+                link = HyperlinkLabel(
+                    self.table_frame,
+                    text="",
+                    url=lambda text: self.open_inara(text) if text and self.open_inara else None,
+                    popup_copy=True,
+                    anchor="w"
+                )
+                link.grid(row=grid_row, column=column, padx=CELL_PADX, pady=CELL_PADY, sticky=tk.W)
+                theme.update(link)
+                empty = self._label(text="", anchor="w")
+                empty.grid(row=grid_row, column=column, padx=CELL_PADX, pady=CELL_PADY, sticky=tk.W)
+                empty.grid_remove()
+                cell.update(link=link, empty=empty, link_shown=True)
+            elif kind == 'checkbox':
+                # Frame centers the dot canvas within the column
+                frame = tk.Frame(self.table_frame)
+                if row_bg:
+                    frame.configure(bg=row_bg)
+                frame.grid(row=grid_row, column=column, padx=CELL_PADX, pady=CELL_PADY, sticky=tk.EW)
+                theme.update(frame)
+                dot_canvas = ThemeSafeCanvas(frame, width=40, height=40, highlightthickness=0)
+                if row_bg:
+                    dot_canvas.configure(bg=row_bg)
+                dot_canvas.pack(anchor=tk.CENTER)
+                oval = dot_canvas.create_oval(10, 10, 30, 30, outline="lightgray", width=2)
+                # Neutron Star uses light blue, others use red
+                if field_lower == 'neutron star':
+                    dot_colors = ("lightblue", "blue")
+                else:
+                    dot_colors = ("red", "darkred")
+                cell.update(frame=frame, canvas=dot_canvas, oval=oval, dot_colors=dot_colors)
+            else:
+                anchor, sticky = ("e", tk.E) if kind == 'numeric' else ("w", tk.W)
+                label = self._label(text="", anchor=anchor)
+                label.grid(row=grid_row, column=column, padx=CELL_PADX, pady=CELL_PADY, sticky=sticky)
+                cell['label'] = label
+
+            pooled.cells.append(cell)
+
+            if col_idx < last_col:
+                separator = ttk.Separator(self.table_frame, orient=tk.VERTICAL)
+                separator.grid(row=grid_row, column=column+1, padx=0, pady=2, sticky=tk.NS)
+                theme.update(separator)
+                pooled.separators.append(separator)
+
+        self._bind_mousewheel_to_row(pooled)
+        return pooled
+
+    def _on_edsm_click(self, cell: Dict) -> None:
+        # The cell's system changes as the row is re-bound, so it is looked up on click
+        if cell.get('system') and self.open_edsm:
+            self.open_edsm(cell['system'])
+
+    def _row_widgets(self, pooled: _PooledRow) -> List[tk.Widget]:
+        widgets: List[tk.Widget] = list(pooled.separators)
+        for cell in pooled.cells:
+            for key in ('link', 'empty', 'label', 'frame'):
+                if key in cell:
+                    widgets.append(cell[key])
+        return widgets
+
+    def _measure_row_height(self, pooled: _PooledRow) -> int:
+        height = 0
+        for cell in pooled.cells:
+            for key in ('link', 'label', 'frame'):
+                if key in cell:
+                    height = max(height, cell[key].winfo_reqheight())
+        return height + 2 * CELL_PADY
+
+    def _bind_mousewheel_to_row(self, pooled: _PooledRow) -> None:
+        for widget in self._row_widgets(pooled):
+            self.bind_mousewheel(widget)
+        for cell in pooled.cells:
+            if 'canvas' in cell:
+                self.bind_mousewheel(cell['canvas'])
+
+    def bind_mousewheel(self, widget: tk.Widget) -> None:
+        """
+        Route mousewheel events of a widget to the table.
+
+        Args:
+            widget: Widget to bind
+        """
+        widget.bind("<MouseWheel>", self.on_mousewheel)
+        widget.bind("<Shift-MouseWheel>", self.on_shift_mousewheel)
+
+    def _grow_pool(self, size: int) -> None:
+        while len(self.pool) < size:
+            self.pool.append(self._create_row(len(self.pool) + 1))
+
+    def _set_row_visible(self, pooled: _PooledRow, visible: bool) -> None:
+        if pooled.visible == visible:
+            return
+        pooled.visible = visible
+        widgets: List[tk.Widget] = list(pooled.separators)
+        for cell in pooled.cells:
+            if 'link' in cell:
+                widgets.append(cell['link'] if cell['link_shown'] else cell['empty'])
+            elif 'frame' in cell:
+                widgets.append(cell['frame'])
+            else:
+                widgets.append(cell['label'])
+        for widget in widgets:
+            if visible:
+                # grid() without options restores the options saved by grid_remove()
+                widget.grid()
+            else:
+                widget.grid_remove()
+        if not visible:
+            pooled.data_idx = None
+
+    def _show_link(self, cell: Dict, show_link: bool) -> None:
+        if cell['link_shown'] == show_link:
+            return
+        cell['link_shown'] = show_link
+        if show_link:
+            cell['empty'].grid_remove()
+            cell['link'].grid()
+        else:
+            cell['link'].grid_remove()
+            cell['empty'].grid()
+
+    def _system_names(self, idx: int) -> Tuple[str, Optional[str]]:
+        """
+        Get the system name displayed in a row and the system its EDSM button opens.
+
+        Road to Riches routes list several bodies per system; only the first row of
+        a system shows the name and the EDSM button.
+        """
+        value = _cell_text(self.route_data[idx], self.system_field)
+        if self.roadtoriches and value and idx > 0:
+            prev_value = _cell_text(self.route_data[idx - 1], self.system_field)
+            if prev_value and prev_value.lower() == value.lower():
+                return "", None
+        return value, (value or None)
+
+    def _render_row(self, pooled: _PooledRow, idx: int) -> None:
+        """Bind a pooled row to route row idx and update its widgets."""
+        route_entry = self.route_data[idx]
+        if idx in self.highlighted_rows:
+            row_bg = HIGHLIGHT_BG
+            text_fg = "black"
+            button_fg = "black"
+        else:
+            row_bg = self.row_colors[idx % 2] or self.default_bg
+            text_fg = self.text_fg
+            button_fg = self.button_fg
+
+        for cell in pooled.cells:
+            kind = cell['kind']
+            if kind == 'step':
+                cell['label'].configure(text=str(idx + 1), bg=row_bg, foreground=text_fg)
+            elif kind == 'edsm':
+                system_name, edsm_system = self._system_names(idx)
+                cell['system'] = edsm_system
+                self._show_link(cell, bool(edsm_system))
+                if edsm_system:
+                    cell['link'].configure(bg=row_bg, foreground=button_fg)
+                else:
+                    cell['empty'].configure(bg=row_bg)
+            elif kind == 'system':
+                system_name, _edsm_system = self._system_names(idx)
+                self._show_link(cell, bool(system_name))
+                if system_name:
+                    cell['link'].configure(text=system_name)
+                else:
+                    cell['empty'].configure(bg=row_bg)
+            elif kind == 'checkbox':
+                checked = _cell_text(route_entry, cell['field']).lower() == 'yes'
+                cell['frame'].configure(bg=row_bg)
+                cell['canvas'].configure(bg=row_bg)
+                if checked:
+                    fill, outline = cell['dot_colors']
+                else:
+                    fill, outline = row_bg, "lightgray"
+                cell['canvas'].itemconfigure(cell['oval'], fill=fill, outline=outline)
+            else:
+                display_value = _cell_text(route_entry, cell['field'])
+                if display_value and kind == 'numeric' and cell['field'] in ROUNDED_FIELDS:
+                    try:
+                        display_value = f"{math.ceil(float(display_value) * 100) / 100:.2f}"
+                    except (ValueError, TypeError):
+                        pass  # Keep original value if not a number
+                cell['label'].configure(text=display_value, bg=row_bg, foreground=text_fg)
+
+        pooled.data_idx = idx
+
+    def render(self) -> None:
+        """Re-bind all pooled rows to the rows at the current scroll position."""
+        self._clamp_first_row()
+        for pool_idx, pooled in enumerate(self.pool):
+            idx = self.first_row + pool_idx
+            if pool_idx < self.visible_count and idx < self.row_count:
+                self._set_row_visible(pooled, True)
+                self._render_row(pooled, idx)
+            else:
+                self._set_row_visible(pooled, False)
+        self._update_scrollbar()
+
+    def set_highlighted_rows(self, rows: Set[int]) -> None:
+        """
+        Change the highlighted rows, re-rendering only the shown rows whose highlight changed.
+
+        Args:
+            rows: Row indices to highlight
+        """
+        changed = self.highlighted_rows ^ rows
+        self.highlighted_rows = set(rows)
+        for pooled in self.pool:
+            if pooled.visible and pooled.data_idx in changed:
+                self._render_row(pooled, pooled.data_idx)
+
+    def scroll_to_row(self, idx: int) -> None:
+        """
+        Scroll so that a row is fully visible, if it is not already.
+
+        Args:
+            idx: Row index
+        """
+        if self.first_row <= idx < self.first_row + self.fully_visible:
+            return
+        # Keep one row above it for context
+        self.first_row = idx - 1
+        self.render()
+
+    def _clamp_first_row(self) -> None:
+        # Keep the last page full
+        max_first = max(0, self.row_count - self.fully_visible)
+        self.first_row = max(0, min(self.first_row, max_first))
+
+    def _update_scrollbar(self) -> None:
+        if not self.yscrollcommand:
+            return
+        if self.row_count == 0:
+            self.yscrollcommand(0.0, 1.0)
+            return
+        first = self.first_row / self.row_count
+        last = min(self.row_count, self.first_row + self.fully_visible) / self.row_count
+        self.yscrollcommand(first, last)
+
+    def fit_to_height(self, viewport_height: int) -> None:
+        """
+        Resize the row pool to the viewport and re-render.
+
+        Args:
+            viewport_height: Height of the canvas in pixels
+        """
+        rows_height = max(0, viewport_height - self.header_height - 2 * CELL_PADY)
+        self.fully_visible = max(1, rows_height // self.row_height)
+        self.visible_count = min(self.fully_visible + EXTRA_POOL_ROWS, max(1, self.row_count))
+        self._grow_pool(self.visible_count)
+        self.render()
+
+    def scroll_rows(self, delta: int) -> None:
+        """
+        Scroll by a number of rows.
+
+        Args:
+            delta: Rows to scroll (negative scrolls up)
+        """
+        old_first = self.first_row
+        self.first_row += delta
+        self._clamp_first_row()
+        if self.first_row != old_first:
+            self.render()
+
+    def yview(self, *args) -> None:
+        """Scrollbar command: handles 'moveto fraction' and 'scroll n units|pages'."""
+        if not args:
+            return
+        if args[0] == 'moveto' and len(args) > 1:
+            self.first_row = int(round(float(args[1]) * self.row_count))
+            self.render()
+        elif args[0] == 'scroll' and len(args) > 2:
+            amount = int(args[1])
+            if args[2] == 'pages':
+                amount *= self.fully_visible
+            self.scroll_rows(amount)
+
+    def on_mousewheel(self, event) -> None:
+        self.scroll_rows(int(-1 * (event.delta / 120)) * WHEEL_SCROLL_ROWS)
+
+    def on_shift_mousewheel(self, event) -> None:
+        self.canvas.xview_scroll(int(-1 * (event.delta / 120)), "units")
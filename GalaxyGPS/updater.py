@@ -4,8 +4,9 @@ import os
 import traceback
 import zipfile
 
-from config import appname, user_agent  # type: ignore
-import timeout_session  # type: ignore
+from config import appname  # type: ignore
+
+from . import http_client
 
 # We need a name of plugin dir, not GalaxyGPS.py dir
 plugin_name = os.path.basename(os.path.dirname(os.path.dirname(__file__)))
@@ -28,9 +29,7 @@ class SpanshUpdater():
         url = f'https://github.com/{github_repo}/releases/download/v{self.version}/{self.zip_name}'
 
         try:
-            session = timeout_session.new_session()
-            session.headers['User-Agent'] = user_agent + ' GalaxyGPS'
-            r = session.get(url, timeout=60)
+            r = http_client.get(url, timeout=60)
             if r.status_code == 200:
                 with open(self.zip_path, 'wb') as f:
                     logger.info(f"Downloading GalaxyGPS to {self.zip_path}")
@@ -63,9 +62,7 @@ class SpanshUpdater():
         
         url = f"https://api.github.com/repos/{github_repo}/releases/latest"
         try:
-            session = timeout_session.new_session()
-            session.headers['User-Agent'] = user_agent + ' GalaxyGPS'
-            r = session.get(url, timeout=2)
+            r = http_client.get(url, timeout=2)
             if r.status_code == 200:
                 # Get the changelog and replace all breaklines with simple ones
                 changelogs = json.loads(r.content)["body"]
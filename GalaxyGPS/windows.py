@@ -1,6 +1,5 @@
 import csv
 import logging
-import math
 import os
 import traceback
 from typing import Dict, List, Tuple
@@ -21,6 +20,7 @@ from .ui_helpers import ThemeSafeCanvas
 from .ui.window_manager import create_themed_window, restore_window_position
 from .ui.widget_styler import style_scrollbars
 from .ui.message_dialog import showinfo, showwarning, showerror
+from .ui.route_table import VirtualRouteTable
 
 # Use same logger format as GalaxyGPS.py
 plugin_name = os.path.basename(os.path.dirname(os.path.dirname(__file__)))
@@ -1185,7 +1185,9 @@ def _refresh_route_window(plugin):
         # Save window position and scroll position before rebuilding
         saved_window_pos = None
         saved_scroll_x = 0.0
-        saved_scroll_y = 0.0
+        # Vertical position is the first row shown by the route table
+        old_table = getattr(window, '_route_table', None)
+        saved_first_row = old_table.first_row if old_table else 0
         try:
             # Save window position (x, y, width, height)
             window.update_idletasks()
@@ -1206,7 +1208,7 @@ def _refresh_route_window(plugin):
             for child in main_frame.winfo_children():
                 if isinstance(child, tk.Canvas):
                     canvas = child
-                    # Get current scroll position as fraction (0.0 to 1.0)
+                    # Get current horizontal scroll position as fraction (0.0 to 1.0)
                     try:
                         # Get scroll region to calculate proper fraction
                         scroll_region = canvas.cget('scrollregion')
@@ -1214,11 +1216,8 @@ def _refresh_route_window(plugin):
                             coords = scroll_region.split()
                             if len(coords) == 4:
                                 scroll_width = float(coords[2]) - float(coords[0])
-                                scroll_height = float(coords[3]) - float(coords[1])
                                 if scroll_width > 0:
                                     saved_scroll_x = canvas.canvasx(0) / scroll_width
-                                if scroll_height > 0:
-                                    saved_scroll_y = canvas.canvasy(0) / scroll_height
                     except Exception:
                         pass
                     break
@@ -1252,7 +1251,12 @@ def _refresh_route_window(plugin):
             return
         
         # Restore scroll position after window is rebuilt
-        if saved_scroll_x > 0 or saved_scroll_y > 0:
+        if saved_first_row > 0:
+            new_table = getattr(plugin.route_window_ref, '_route_table', None)
+            if new_table:
+                new_table.first_row = saved_first_row
+                new_table.render()
+        if saved_scroll_x > 0:
             try:
                 window = plugin.route_window_ref
                 if window and window.winfo_exists():
@@ -1266,7 +1270,6 @@ def _refresh_route_window(plugin):
                             # Restore scroll position
                             try:
                                 canvas.xview_moveto(max(0.0, min(1.0, saved_scroll_x)))
-                                canvas.yview_moveto(max(0.0, min(1.0, saved_scroll_y)))
                             except Exception:
                                 pass
                             break
@@ -1283,6 +1286,84 @@ def _refresh_route_window(plugin):
             plugin._refreshing_route_window = False
 
 
+def _get_current_next_waypoint(plugin):
+    """
+    Get the system name of the current next waypoint for highlighting in the route window.
+
+    Args:
+        plugin: The plugin instance
+
+    Returns:
+        System name, or None if no waypoint
+    """
+    # Use the same helper method that the plugin uses to get the system name
+    # This ensures consistency between navigation and display
+    # IMPORTANT: Don't modify plugin state - only read from it
+    current_next_waypoint = None
+    if hasattr(plugin, 'offset') and plugin.offset is not None and hasattr(plugin, 'route') and plugin.route:
+        try:
+            # Ensure offset is valid before using it
+            if plugin.offset >= 0 and plugin.offset < len(plugin.route):
+                # Use the plugin's helper method to get the system name at the current offset
+                # This handles empty system names for Road to Riches correctly
+                if hasattr(plugin, '_get_system_name_at_index'):
+                    current_next_waypoint = plugin._get_system_name_at_index(plugin.offset)
+                else:
+                    # Fallback to next_stop if helper method doesn't exist
+                    current_next_waypoint = getattr(plugin, 'next_stop', None)
+            else:
+                # Offset is out of bounds, use next_stop as fallback
+                current_next_waypoint = getattr(plugin, 'next_stop', None)
+        except Exception:
+            # Fallback to next_stop on any error
+            current_next_waypoint = getattr(plugin, 'next_stop', None)
+    else:
+        current_next_waypoint = getattr(plugin, 'next_stop', None)
+
+    if current_next_waypoint and current_next_waypoint == "No route planned":
+        current_next_waypoint = None
+    return current_next_waypoint
+
+
+def _get_highlighted_route_rows(plugin, route_data, current_next_waypoint):
+    """
+    Get the route rows to highlight for the current next waypoint.
+
+    For Road to Riches only the first row of the system is highlighted (the row that
+    actually has the system name, not its body rows). For other route types every row
+    with the system name is highlighted.
+
+    Args:
+        plugin: The plugin instance
+        route_data: Route rows shown in the route window
+        current_next_waypoint: System name of the next waypoint (or None)
+
+    Returns:
+        Set of row indices
+    """
+    if not current_next_waypoint:
+        return set()
+
+    # Use the compiled route's name index when it describes the same rows
+    model = plugin._get_route_model() if hasattr(plugin, '_get_route_model') else None
+    if model is not None and model.length == len(route_data):
+        indices = model.indices_of(current_next_waypoint)
+        if plugin.roadtoriches:
+            return set(indices[:1])
+        return set(indices)
+
+    target = current_next_waypoint.strip().lower()
+    system_field_lower = plugin.system_header.lower()
+    highlighted = set()
+    for idx, route_entry in enumerate(route_data):
+        system_name_in_row = (route_entry.get(system_field_lower, '') or '').strip()
+        if system_name_in_row and system_name_in_row.lower() == target:
+            highlighted.add(idx)
+            if plugin.roadtoriches:
+                break
+    return highlighted
+
+
 def show_route_window(plugin, skip_refresh_check=False):
     """
     Open a window displaying the current route as an easy-to-read list.
@@ -1512,9 +1593,6 @@ def show_route_window(plugin, skip_refresh_check=False):
                     display_columns.append(translated_display_name)
             logger.debug(f"[show_route_window] Display columns from keys: {display_columns}")
 
-        # For Road to Riches, track previous system name to avoid repetition
-        prev_system_name = None
-
         # Create new window with custom themed title bar
         # Initialize window_positions if it doesn't exist
         if not hasattr(plugin, 'window_positions'):
@@ -1612,15 +1690,14 @@ def show_route_window(plugin, skip_refresh_check=False):
                     # Scrolling needed, show scrollbar
                     v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y, before=canvas)
 
-        # Create canvas with both scrollbars
+        # Create canvas with horizontal scrolling only
+        # Vertical scrolling is done by the route table, which re-binds its pooled rows instead of moving them
         canvas = ThemeSafeCanvas(main_frame,
-                        xscrollcommand=safe_h_scrollbar_set,
-                        yscrollcommand=safe_v_scrollbar_set)
+                        xscrollcommand=safe_h_scrollbar_set)
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         theme.update(canvas)
 
         h_scrollbar.config(command=canvas.xview)
-        v_scrollbar.config(command=canvas.yview)
 
         # Style scrollbars to match EDMC theme
         style_scrollbars(h_scrollbar, v_scrollbar, main_frame)
@@ -1711,62 +1788,20 @@ def show_route_window(plugin, skip_refresh_check=False):
 
         headers = ["#"] + display_columns_with_edsm
         # Calculate column widths based on both header and data content using pixel measurements
-        # Get fonts for accurate width calculation
+        # Headers are measured here; the widest data text per column is measured once per loaded
+        # route and cached on the compiled route, so no cell is measured when the window opens
         header_font_route = tkfont.Font(family="Arial", size=9, weight="bold")
         data_font_route = tkfont.Font(family="Arial", size=9)
-        
-        # Start with header widths (in pixels)
-        column_widths_px_route = [header_font_route.measure("#") + 20]  # Step number column
-        for h in display_columns_with_edsm:
-            if h == "EDSM":
-                column_widths_px_route.append(header_font_route.measure("EDSM") + 20)
-            else:
-                column_widths_px_route.append(header_font_route.measure(h) + 20)
-
-        # Now check all data rows to find maximum content width for each column
-        # Iterate through headers (skip step number "#" at index 0)
-        # For Road to Riches, this nested loop can be expensive, so yield to event loop periodically
-        yield_interval_width = 500 if plugin.roadtoriches else 1000  # Yield more frequently for Road to Riches
-
-        for header_idx, (data_col_name, display_col_name) in enumerate(zip(data_columns_with_edsm, display_columns_with_edsm), start=1):
-            # Skip EDSM column (it's fixed width based on header)
-            if data_col_name == "EDSM":
-                continue
+        column_text_widths = plugin.get_route_column_widths(route_data)
 
-            # Use original English name for data lookup
-            field_lower = data_col_name.lower()
-
-            # Check all route entries for this column
-            for idx, route_entry in enumerate(route_data):
-                # Get value from route_entry using original English field name
-                raw_value = route_entry.get(field_lower, '')
-                if raw_value is None or str(raw_value).strip().lower() == 'none':
-                    value = ''
-                else:
-                    value = str(raw_value).strip() if isinstance(raw_value, str) else str(raw_value)
-
-                # For Road to Riches, handle system name repetition
-                # This adds extra dictionary lookups which can be expensive in the nested loop
-                if plugin.roadtoriches and field_lower == plugin.system_header.lower():
-                    # Use previous system name if current is empty
-                    if not value and idx > 0:
-                        prev_entry = route_data[idx - 1]
-                        if field_lower in prev_entry:
-                            value = prev_entry.get(field_lower, '').strip()
-
-                # Calculate pixel width needed for this value (add 20px padding)
-                if value:
-                    value_width_px = data_font_route.measure(str(value)) + 20
-                    # Update column width if this value is wider
-                    # header_idx corresponds to column_widths_px_route index (header_idx already accounts for step number)
-                    if header_idx < len(column_widths_px_route):
-                        column_widths_px_route[header_idx] = max(column_widths_px_route[header_idx], value_width_px)
-                
-                # Periodically yield to event loop during column width calculation (especially important for Road to Riches)
-                # This prevents blocking during the nested loop iteration
-                total_iterations = header_idx * len(route_data) + idx
-                if total_iterations > 0 and total_iterations % yield_interval_width == 0 and plugin.parent:
-                    plugin.parent.update_idletasks()
+        # Step number column: header or the largest row number, whichever is wider
+        column_widths_px_route = [max(header_font_route.measure("#"), data_font_route.measure(str(len(route_data)))) + 20]
+        for data_col_name, display_col_name in zip(data_columns_with_edsm, display_columns_with_edsm):
+            width_px = header_font_route.measure(display_col_name) + 20
+            # EDSM column is fixed width based on header
+            if data_col_name != "EDSM":
+                width_px = max(width_px, column_text_widths.get(data_col_name.lower(), 0) + 20)
+            column_widths_px_route.append(width_px)
 
         # Calculate required width based on actual pixel measurements
         # Account for separators (one between each column, ~2px each)
@@ -1800,66 +1835,26 @@ def show_route_window(plugin, skip_refresh_check=False):
                 if any(keyword in field_lower for keyword in ['distance', 'fuel used', 'fuel left', 'estimated scan value', 'estimated mapping value', 'jumps']):
                     numeric_columns.add(field_lower)
 
-        # Header row (row 0) - styled with grey background and bold text
-        header_row = 0
-        for i, header in enumerate(headers):
-            # Grid column configuration handles width, just create label with proper anchor
-            # Right-align numeric columns, left-align text columns, center-align checkbox columns
-            header_lower = header.lower()
-            if i == 0:  # Step number - left align
-                anchor = "w"
-                sticky_val = tk.W
-            elif header_lower == "edsm":  # EDSM button column - center align
-                anchor = "c"
-                sticky_val = tk.EW
-            elif header_lower in checkbox_columns:
-                anchor = "c"  # Center-align for indicator columns (colored dots)
-                sticky_val = tk.EW  # Expand to fill column width for centering
-            elif header_lower in numeric_columns:
-                anchor = "e"  # Right-align for numeric columns
-                sticky_val = tk.E
+        # Column specs for the route table: (kind, lowercase field name, header text)
+        system_field_lower = plugin.system_header.lower()
+        table_columns = [('step', '', "#")]
+        for data_col_name, display_col_name in zip(data_columns_with_edsm, display_columns_with_edsm):
+            field_lower = data_col_name.lower()
+            if data_col_name == "EDSM":
+                kind = 'edsm'
+                field_lower = system_field_lower
+            elif field_lower == system_field_lower:
+                kind = 'system'
+            elif field_lower in checkbox_columns:
+                kind = 'checkbox'  # Colored dot indicator
+            elif field_lower in numeric_columns:
+                kind = 'numeric'
             else:
-                anchor = "w"  # Left-align for text columns
-                sticky_val = tk.W
-            # Header label with grey background and bold text
-            label = tk.Label(table_frame, text=header, font=("Arial", 9, "bold"), anchor=anchor)
-            label.grid(row=header_row, column=i*2, padx=2, pady=5, sticky=sticky_val)
-            theme.update(label)
-            # Add vertical separator after each column (except the last)
-            if i < len(headers) - 1:
-                separator = ttk.Separator(table_frame, orient=tk.VERTICAL)
-                separator.grid(row=header_row, column=i*2+1, padx=0, pady=2, sticky=tk.NS)
-                theme.update(separator)
-                # ttk.Separator needs additional styling via ttk.Style
-                # We'll configure this after all widgets are created
+                kind = 'text'
+            table_columns.append((kind, field_lower, display_col_name))
 
         # Get current next waypoint system name for highlighting
-        # Use the same helper method that the plugin uses to get the system name
-        # This ensures consistency between navigation and display
-        # IMPORTANT: Don't modify plugin state - only read from it
-        current_next_waypoint = None
-        if hasattr(plugin, 'offset') and plugin.offset is not None and hasattr(plugin, 'route') and plugin.route:
-            try:
-                # Ensure offset is valid before using it
-                if plugin.offset >= 0 and plugin.offset < len(plugin.route):
-                    # Use the plugin's helper method to get the system name at the current offset
-                    # This handles empty system names for Road to Riches correctly
-                    if hasattr(plugin, '_get_system_name_at_index'):
-                        current_next_waypoint = plugin._get_system_name_at_index(plugin.offset)
-                    else:
-                        # Fallback to next_stop if helper method doesn't exist
-                        current_next_waypoint = getattr(plugin, 'next_stop', None)
-                else:
-                    # Offset is out of bounds, use next_stop as fallback
-                    current_next_waypoint = getattr(plugin, 'next_stop', None)
-            except Exception:
-                # Fallback to next_stop on any error
-                current_next_waypoint = getattr(plugin, 'next_stop', None)
-        else:
-            current_next_waypoint = getattr(plugin, 'next_stop', None)
-        
-        if current_next_waypoint and current_next_waypoint == "No route planned":
-            current_next_waypoint = None
+        current_next_waypoint = _get_current_next_waypoint(plugin)
 
         # Calculate alternating row colors for better readability
         table_frame.update_idletasks()
@@ -1927,337 +1922,34 @@ def show_route_window(plugin, skip_refresh_check=False):
             base_row_bg = ""
             alt_row_bg = ""
 
-        # Route data rows (rows 1+) - use same grid as header for perfect alignment
-        # Track which system we've already highlighted to avoid highlighting multiple rows for the same system
-        highlighted_system = None
-        
-        # For Road to Riches files (which can have many rows), yield to event loop periodically
-        # to prevent blocking GUI updates. Process in batches and call update_idletasks() every N rows.
-        yield_interval = 50 if plugin.roadtoriches else 100  # Yield more frequently for Road to Riches
-
-        for idx, route_entry in enumerate(route_data):
-            data_row = idx + 1  # Start from row 1 (row 0 is header)
-
-            # Get system name from this row for comparison
-            # For Road to Riches, we need to track the actual system name even if it's not displayed
-            system_name_in_row = None
-            system_field_lower = plugin.system_header.lower()
-            if system_field_lower in route_entry:
-                system_name_in_row = route_entry.get(system_field_lower, '').strip()
-
-            # For Road to Riches, if system name is empty in this row, use previous system name
-            # BUT only for display purposes - for highlighting, we only highlight rows that actually have the system name
-            display_system_name = system_name_in_row
-            if plugin.roadtoriches and not system_name_in_row and idx > 0:
-                # Check previous entry for system name (for display only)
-                prev_entry = route_data[idx - 1]
-                if system_field_lower in prev_entry:
-                    display_system_name = prev_entry.get(system_field_lower, '').strip()
-
-            # Check if this row matches the current next waypoint
-            # For Road to Riches: Only highlight the FIRST row that has the system name (not rows with empty system names)
-            # This ensures we highlight the system location, not individual bodies
-            is_current_waypoint = False
-            if current_next_waypoint:
-                # For Road to Riches, only highlight if this row actually has the system name (not empty)
-                if plugin.roadtoriches:
-                    if system_name_in_row and system_name_in_row.lower() == current_next_waypoint.lower():
-                        # Only highlight if we haven't already highlighted this system
-                        if highlighted_system != current_next_waypoint.lower():
-                            is_current_waypoint = True
-                            highlighted_system = current_next_waypoint.lower()
-                else:
-                    # For other route types, use the display system name
-                    if display_system_name and display_system_name.lower() == current_next_waypoint.lower():
-                        is_current_waypoint = True
-
-            # Get row background color from theme AFTER theme.update() has been applied
-            # Highlight current waypoint with yellow background - text color handled by theme
-            # Use alternating colors for better readability when not highlighted
-            if is_current_waypoint:
-                # Always use yellow highlight - theme system will adjust text color for readability
-                row_bg = "#fff9c4"  # Light yellow highlight for current waypoint
-            else:
-                # Alternate row background color for better readability
-                row_bg = base_row_bg if idx % 2 == 0 else alt_row_bg
-
-            col_idx = 0
-
-            # Step number
-            label_kwargs = {"master": table_frame, "text": str(idx + 1), "anchor": "w"}
-            if row_bg:
-                label_kwargs["bg"] = row_bg
-            step_label = tk.Label(**label_kwargs)
-            step_label.grid(row=data_row, column=col_idx*2, padx=2, pady=5, sticky=tk.W)
-            theme.update(step_label)
-            # For highlighted rows, set text to black for readability (except URLs which stay blue)
-            if is_current_waypoint:
-                step_label.config(foreground="black")
-            # Add separator after step number
-            if col_idx < len(headers) - 1:
-                separator_step = ttk.Separator(table_frame, orient=tk.VERTICAL)
-                separator_step.grid(row=data_row, column=col_idx*2+1, padx=0, pady=2, sticky=tk.NS)
-                theme.update(separator_step)
-            col_idx += 1
-
-            # Display each column - use column_widths to match header widths
-            # Note: We iterate through data_columns (original English names) for data lookup
-            for field_idx, (data_field_name, display_field_name) in enumerate(zip(data_columns, display_columns)):
-                field_lower = data_field_name.lower()  # Use original English name for lookup
-                # Get value from route_entry (which uses lowercase keys)
-                raw_value = route_entry.get(field_lower, '')
-                # Convert to string and handle None/"None" values
-                if raw_value is None or str(raw_value).strip().lower() == 'none':
-                    value = ''
-                else:
-                    value = str(raw_value).strip() if isinstance(raw_value, str) else str(raw_value)
-
-                # Special handling: Add EDSM button before System Name
-                if field_lower == plugin.system_header.lower():
-                    # EDSM column comes right before System Name in headers
-                    # Add EDSM button first
-
-                    # Get the system name value for EDSM button
-                    system_name_for_edsm = None
-                    if plugin.roadtoriches:
-                        current_system = value
-                        system_name_for_edsm = current_system if current_system and current_system.lower() != prev_system_name else None
-                    else:
-                        system_name_for_edsm = value if value else None
-
-                    if system_name_for_edsm:
-                        btn_kwargs = {"master": table_frame, "text": "EDSM", "command": lambda s=system_name_for_edsm: plugin.open_edsm_system(s)}
-                        if row_bg:
-                            btn_kwargs["bg"] = row_bg
-                        edsm_btn = tk.Button(**btn_kwargs)
-                        edsm_btn.grid(row=data_row, column=col_idx*2, padx=2, pady=5, sticky=tk.W)
-                        theme.update(edsm_btn)
-                    else:
-                        # Empty cell if no system name
-                        label_kwargs = {"master": table_frame, "text": ""}
-                        if row_bg:
-                            label_kwargs["bg"] = row_bg
-                        empty_label = tk.Label(**label_kwargs)
-                        empty_label.grid(row=data_row, column=col_idx*2, padx=2, pady=5, sticky=tk.W)
-                        theme.update(empty_label)
-                        # For highlighted rows, set text to black for readability
-                        if is_current_waypoint:
-                            empty_label.config(foreground="black")
-                    if col_idx < len(headers) - 1:
-                        separator_edsm = ttk.Separator(table_frame, orient=tk.VERTICAL)
-                        separator_edsm.grid(row=data_row, column=col_idx*2+1, padx=0, pady=2, sticky=tk.NS)
-                        theme.update(separator_edsm)
-                    col_idx += 1
-
-                    # Now add System Name at the next column position
-
-                    # Handle System Name display
-                    # For Road to Riches, check if system name repeats
-                    if plugin.roadtoriches:
-                        current_system = value
-                        if current_system and current_system.lower() == prev_system_name:
-                            # System name repeats, show empty
-                            label_kwargs = {"master": table_frame, "text": "", "anchor": "w"}
-                            if row_bg:
-                                label_kwargs["bg"] = row_bg
-                            system_label = tk.Label(**label_kwargs)
-                            system_label.grid(row=data_row, column=col_idx*2, padx=2, pady=5, sticky=tk.W)
-                            theme.update(system_label)
-                            # For highlighted rows, set text to black for readability
-                            if is_current_waypoint:
-                                system_label.config(foreground="black")
-                        else:
-                            # New system name, display it (with right-click copy)
-                            if current_system:
-                                system_label = HyperlinkLabel(
-                                    table_frame,
-                                    text=current_system,
-                                    url=lambda e, s=current_system: plugin.open_inara_system(s),
-                                    popup_copy=True,
-                                    anchor="w"
-                                )
-                                system_label.grid(row=data_row, column=col_idx*2, padx=2, pady=5, sticky=tk.W)
-                                theme.update(system_label)
-                            else:
-                                label_kwargs = {"master": table_frame, "text": "", "anchor": "w"}
-                                if row_bg:
-                                    label_kwargs["bg"] = row_bg
-                                empty_label = tk.Label(**label_kwargs)
-                                empty_label.grid(row=data_row, column=col_idx*2, padx=2, pady=5, sticky=tk.W)
-                                theme.update(empty_label)
-                                # For highlighted rows, set text to black for readability
-                                if is_current_waypoint:
-                                    empty_label.config(foreground="black")
-                        prev_system_name = current_system.lower() if current_system else None
-                    else:
-                        # Normal system name display (clickable to Inara, right-click to copy)
-                        if value:
-                            system_label = HyperlinkLabel(
-                                table_frame,
-                                text=value,
-                                url=lambda e, s=value: plugin.open_inara_system(s),
-                                popup_copy=True,
-                                anchor="w"
-                            )
-                            system_label.grid(row=data_row, column=col_idx*2, padx=2, pady=5, sticky=tk.W)
-                            theme.update(system_label)
-                        else:
-                            label_kwargs = {"master": table_frame, "text": "", "anchor": "w"}
-                            if row_bg:
-                                label_kwargs["bg"] = row_bg
-                            empty_label = tk.Label(**label_kwargs)
-                            empty_label.grid(row=data_row, column=col_idx*2, padx=2, pady=5, sticky=tk.W)
-                            theme.update(empty_label)
-                            # For highlighted rows, set text to black for readability
-                            if is_current_waypoint:
-                                empty_label.config(foreground="black")
-
-                    # Add separator after System Name and move to next column
-                    if col_idx < len(headers) - 1:
-                        separator_system = ttk.Separator(table_frame, orient=tk.VERTICAL)
-                        separator_system.grid(row=data_row, column=col_idx*2+1, padx=0, pady=2, sticky=tk.NS)
-                        theme.update(separator_system)
-                    col_idx += 1
-                    continue  # Skip the rest of the loop for System Name since we've handled it
-
-                # Checkbox columns (yes/no fields) - display as colored dot indicator
-                if field_lower in checkbox_columns:
-                    # Strip whitespace and convert to lowercase for comparison
-                    checkbox_value_str = str(value).strip().lower() if value else ''
-                    checkbox_value = checkbox_value_str == 'yes'
-
-                    # Determine dot color based on field type
-                    # Neutron Star uses light blue, others use red
-                    if field_lower == 'neutron star':
-                        dot_color = "lightblue"
-                        dot_outline = "blue"
-                    else:
-                        dot_color = "red"
-                        dot_outline = "darkred"
-
-                    # Create a frame to center the canvas within the column
-                    frame_kwargs = {"master": table_frame}
-                    if row_bg:
-                        frame_kwargs["bg"] = row_bg
-                    checkbox_frame = tk.Frame(**frame_kwargs)
-                    checkbox_frame.grid(row=data_row, column=col_idx*2, padx=2, pady=5, sticky=tk.EW)
-                    theme.update(checkbox_frame)
-
-                    # Create a canvas to draw a colored dot (centered in frame)
-                    canvas_kwargs = {"master": checkbox_frame, "width": 40, "height": 40, "highlightthickness": 0}
-                    if row_bg:
-                        canvas_kwargs["bg"] = row_bg
-                    checkbox_canvas = ThemeSafeCanvas(**canvas_kwargs)
-                    checkbox_canvas.pack(anchor=tk.CENTER)  # Center the canvas in the frame
-
-                    if checkbox_value:
-                        # Draw a filled circle for "yes" (light blue for neutron star, red for others)
-                        checkbox_canvas.create_oval(10, 10, 30, 30, fill=dot_color, outline=dot_outline, width=2)
-                    else:
-                        # Draw an empty circle for "no" (or leave blank)
-                        checkbox_canvas.create_oval(10, 10, 30, 30, fill=row_bg, outline="lightgray", width=2)
-
-                # Regular text columns - right-align numeric columns, left-align others
-                else:
-                    # Determine if this is a numeric column
-                    is_numeric = field_lower in numeric_columns
-
-                    # Process the value - handle None, "None", empty strings
-                    display_value = value if value else ""
-                    if display_value is None or str(display_value).strip().lower() == 'none':
-                        display_value = ""
-
-                    # Round distance and fuel columns UP to nearest hundredth if they're numeric
-                    if is_numeric and field_lower in ["distance to arrival", "distance remaining", "distance", "fuel used", "fuel left"]:
-                        if display_value:  # Only process if not empty
-                            try:
-                                val_float = float(display_value)
-                                # Round UP to nearest hundredth: multiply by 100, ceil, divide by 100
-                                rounded = math.ceil(val_float * 100) / 100
-                                display_value = f"{rounded:.2f}"
-                            except (ValueError, TypeError):
-                                pass  # Keep original value if not a number
-
-                    anchor = "e" if is_numeric else "w"
-                    sticky = tk.E if is_numeric else tk.W
-                    # Use col_width which now matches header width calculation exactly
-                    label_kwargs = {"master": table_frame, "text": display_value, "anchor": anchor}
-                    if row_bg:
-                        label_kwargs["bg"] = row_bg
-                    value_label = tk.Label(**label_kwargs)
-                    value_label.grid(row=data_row, column=col_idx*2, padx=2, pady=5, sticky=sticky)
-                    theme.update(value_label)
-                    # For highlighted rows, set text to black for readability (except URLs which stay blue)
-                    if is_current_waypoint:
-                        # Don't change foreground if it's a URL/link (blue color)
-                        try:
-                            current_fg = value_label.cget('foreground')
-                            if current_fg and current_fg.lower() not in ['blue', '#0000ff', '#0000ff']:
-                                value_label.config(foreground="black")
-                        except Exception:
-                            value_label.config(foreground="black")
-
-                # Add separator after each column (except the last)
-                if col_idx < len(headers) - 1:
-                    separator = ttk.Separator(table_frame, orient=tk.VERTICAL)
-                    separator.grid(row=data_row, column=col_idx*2+1, padx=0, pady=2, sticky=tk.NS)
-                    theme.update(separator)
-
-                col_idx += 1
-            
-            # Periodically yield to event loop to prevent blocking (especially important for Road to Riches)
-            # This allows button updates and other GUI events to process during window creation
-            if (idx + 1) % yield_interval == 0:
-                table_frame.update_idletasks()
-                if plugin.parent:
-                    plugin.parent.update_idletasks()
-                    if hasattr(plugin, 'waypoint_btn') and hasattr(plugin, 'next_stop'):
-                        try:
-                            current_button_text = plugin.waypoint_btn.cget('text')
-                            expected_text = plugin.next_wp_label + '\n' + (plugin.next_stop if plugin.next_stop else "")
-                            if current_button_text != expected_text:
-                                logger.warning(f'[show_route_window] Button text mismatch at row {idx + 1}: expected="{expected_text[:50]}...", actual="{current_button_text[:50]}..."')
-                        except Exception:
-                            pass
+        # Route data rows (rows 1+) - only the rows that fit in the viewport get widgets,
+        # the pooled rows are re-bound to other route rows while scrolling
+        route_table = VirtualRouteTable(
+            table_frame,
+            canvas,
+            route_data,
+            table_columns,
+            (base_row_bg, alt_row_bg),
+            system_field_lower,
+            roadtoriches=plugin.roadtoriches,
+            open_edsm=plugin.open_edsm_system,
+            open_inara=plugin.open_inara_system,
+            yscrollcommand=safe_v_scrollbar_set
+        )
+        route_table.highlighted_rows = _get_highlighted_route_rows(plugin, route_data, current_next_waypoint)
+        route_window._route_table = route_table
+        v_scrollbar.config(command=route_table.yview)
 
         # Apply theme recursively to entire table_frame after all widgets are created
-        # This ensures any widgets we missed get themed properly
-        # theme.update() will automatically apply correct foreground colors based on current theme
+        # Row backgrounds and black text for the highlighted row are applied when rows are rendered
         theme.update(table_frame)
+        route_table.fit_to_height(700)
 
-        # For highlighted rows, override theme colors with black text for readability (except URLs which stay blue)
-        # This must be done AFTER theme.update() to override theme colors
-        def set_highlighted_text_black():
-            """Set text to black for all labels in highlighted rows, preserving blue URLs."""
-            # Find the highlighted row by looking for labels with yellow background
-            for widget in table_frame.winfo_children():
-                try:
-                    if isinstance(widget, tk.Label):
-                        widget_bg = widget.cget('bg')
-                        # Check if this label has the yellow highlight background
-                        if widget_bg and widget_bg.lower() in ['#fff9c4', '#fff9c4']:
-                            # This is a highlighted row - set text to black unless it's a URL
-                            current_fg = widget.cget('foreground')
-                            current_cursor = widget.cget('cursor')
-                            # Keep blue links as blue, set everything else to black
-                            if current_fg and current_fg.lower() in ['blue', '#0000ff', '#0000ff']:
-                                pass  # Keep blue URLs
-                            elif current_cursor == 'hand2':
-                                pass  # Keep links (hand2 cursor indicates clickable)
-                            else:
-                                widget.config(foreground="black")
-                    elif isinstance(widget, tk.Button):
-                        # Check buttons too - but only their text/foreground
-                        widget_bg = widget.cget('bg')
-                        if widget_bg and widget_bg.lower() in ['#fff9c4', '#fff9c4']:
-                            current_fg = widget.cget('foreground')
-                            if current_fg and current_fg.lower() not in ['blue', '#0000ff', '#0000ff']:
-                                widget.config(foreground="black")
-                except Exception:
-                    pass
+        # Grow or shrink the row pool when the viewport height changes
+        def on_canvas_resize(event):
+            route_table.fit_to_height(event.height)
 
-        # Apply black text to highlighted rows AFTER theme.update()
-        set_highlighted_text_black()
+        canvas.bind('<Configure>', on_canvas_resize, add='+')
 
         # Style ttk.Separator widgets - they need special handling via ttk.Style
         # Separators don't automatically get themed, so we style them to match theme foreground color
@@ -2291,22 +1983,13 @@ def show_route_window(plugin, skip_refresh_check=False):
         final_width = min(final_width, screen_width - 20)
         final_width = max(final_width, 800)  # Minimum 800px
 
-        # Bind mousewheel scrolling after all widgets are created
-        def on_mousewheel(event):
-            # Scroll vertically with mousewheel
-            canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-        
-        def on_shift_mousewheel(event):
-            # Scroll horizontally with Shift+mousewheel
-            canvas.xview_scroll(int(-1 * (event.delta / 120)), "units")
-        
-        # Recursively bind mousewheel to all widgets in the window
+        # Recursively bind mousewheel to all widgets in the window after all widgets are created
+        # Mousewheel scrolls the table by rows, Shift+mousewheel scrolls the canvas horizontally
         def bind_mousewheel_recursive(widget):
-            widget.bind("<MouseWheel>", on_mousewheel)
-            widget.bind("<Shift-MouseWheel>", on_shift_mousewheel)
+            route_table.bind_mousewheel(widget)
             for child in widget.winfo_children():
                 bind_mousewheel_recursive(child)
-        
+
         bind_mousewheel_recursive(route_window)
 
         # Restore window position or center on screen
@@ -2370,18 +2053,46 @@ def show_route_window(plugin, skip_refresh_check=False):
         showerror(plugin.parent, plugin_tl("Error"), plugin_tl("Failed to display route."))
 
 
+def _update_route_window_highlight(plugin):
+    """
+    Move the route window highlight to the current next waypoint without rebuilding the window.
+    Re-renders only the previously and newly highlighted rows, and scrolls to the new row if it is not visible.
+
+    Args:
+        plugin: The plugin instance
+
+    Returns:
+        True if the highlight was updated, False if the window shows another route and must be rebuilt
+    """
+    table = getattr(plugin.route_window_ref, '_route_table', None)
+    if (table is None or not plugin.route_full_data
+            or table.route_data is not plugin.route_full_data
+            or table.row_count != len(plugin.route_full_data)
+            or table.roadtoriches != plugin.roadtoriches):
+        return False
+
+    highlighted_rows = _get_highlighted_route_rows(plugin, table.route_data, _get_current_next_waypoint(plugin))
+    table.set_highlighted_rows(highlighted_rows)
+    if highlighted_rows:
+        offset = getattr(plugin, 'offset', None)
+        table.scroll_to_row(offset if offset in highlighted_rows else min(highlighted_rows))
+    return True
+
+
 def refresh_route_window_if_open(plugin):
     """
     Refresh the route window if it's currently open.
     This is called when the next waypoint changes to update the highlight.
-    The window will be rebuilt with the current waypoint highlighted, preserving scroll position.
+    The highlight is moved in place; the window is only rebuilt (preserving scroll position)
+    when it shows a different route than the one loaded.
     """
     if hasattr(plugin, 'route_window_ref') and plugin.route_window_ref:
         try:
             # Check if window still exists
             if plugin.route_window_ref.winfo_exists():
-                # Use seamless refresh that preserves scroll position
-                _refresh_route_window(plugin)
+                if not _update_route_window_highlight(plugin):
+                    # Use seamless refresh that preserves scroll position
+                    _refresh_route_window(plugin)
         except Exception:
             # Window was closed, clear reference
             plugin.route_window_ref = None
@@ -55,8 +55,11 @@ except ImportError:
     if _plugin_dir not in sys.path:
         sys.path.insert(0, _plugin_dir)
     from GalaxyGPS import GalaxyGPS
+from GalaxyGPS import http_client
+from GalaxyGPS.journal_dispatch import build_journal_dispatcher
 
 galaxy_gps = None
+_journal_dispatcher = None  # JournalDispatcher built in plugin_start
 _update_check_queue = queue.Queue()
 
 # Export plugin_tl for use in other modules
@@ -93,8 +96,9 @@ def plugin_start3(plugin_dir):
 
 
 def plugin_start(plugin_dir):
-    global galaxy_gps
+    global galaxy_gps, _journal_dispatcher
     galaxy_gps = GalaxyGPS(plugin_dir)
+    _journal_dispatcher = build_journal_dispatcher(galaxy_gps)
     
     # Register instance with public API for other plugins
     try:
@@ -110,7 +114,18 @@ def plugin_stop():
     global galaxy_gps
     if not galaxy_gps:
         return
-    galaxy_gps.save_route()
+    # Write pending offset and (only if it changed) the route
+    galaxy_gps.flush_route_persistence()
+    # Write carrier changes still waiting for the write-behind quiet period
+    if galaxy_gps.fleet_carrier_manager:
+        galaxy_gps.fleet_carrier_manager.flush_carriers()
+    galaxy_gps.flush_carrier_csv_exports()
+    if galaxy_gps.carrier_store:
+        galaxy_gps.carrier_store.close()
+    # Keep autocomplete results for the next session
+    galaxy_gps.system_name_cache.save()
+    galaxy_gps.ring_prefetcher.stop()
+    galaxy_gps.ring_cache.save()
     if galaxy_gps.update_available:
         logger.info("Installing GalaxyGPS update, please wait...")
         def _run_install():
@@ -122,133 +137,14 @@ def plugin_stop():
         t = threading.Thread(target=_run_install)
         t.start()
         t.join()  # Wait for update to complete (EDMC compliant - recommended in PLUGINS.md)
+    # Release pooled keep-alive connections
+    http_client.close()
 
 
 def journal_entry(cmdr, is_beta, system, station, entry, state):
-    global galaxy_gps
-    if not galaxy_gps:
-        return
-    if (entry['event'] in ['FSDJump', 'Location', 'SupercruiseEntry', 'SupercruiseExit']
-            and entry["StarSystem"].lower() == galaxy_gps.next_stop.lower()):
-        galaxy_gps.update_route()
-        galaxy_gps.set_source_ac(entry["StarSystem"])
-    elif entry['event'] == 'FSSDiscoveryScan' and entry['SystemName'] == galaxy_gps.next_stop:
-        galaxy_gps.update_route()
-    
-    # Handle StoredShips and StoredModules events for cache managers
-    event_name = entry.get('event', '')
-    
-    if event_name == 'StoredShips' and galaxy_gps.ships_manager and galaxy_gps.fleet_carrier_manager:
-        # Get list of known carrier callsigns
-        known_carriers = list(galaxy_gps.fleet_carrier_manager.carriers.keys())
-        galaxy_gps.ships_manager.update_from_journal_event(entry, known_carriers)
-    
-    elif event_name == 'StoredModules' and galaxy_gps.modules_manager and galaxy_gps.fleet_carrier_manager:
-        # Get list of known carrier callsigns
-        known_carriers = list(galaxy_gps.fleet_carrier_manager.carriers.keys())
-        galaxy_gps.modules_manager.update_from_journal_event(entry, known_carriers)
-    
-    # Update fleet carrier data from journal events (fallback to CAPI)
-    if galaxy_gps.fleet_carrier_manager:
-        # Determine source galaxy from state or default to Live
-        source_galaxy = 'Live'
-        if hasattr(state, 'get'):
-            # Could check state for galaxy info if available
-            pass
-        
-        # Handle fleet carrier journal events
-        event_name = entry.get('event', '')
-        
-        # Check if player is docked at a fleet carrier (for Location/Cargo events)
-        station_type = state.get('StationType', '') if state else ''
-        station_name = state.get('StationName', '') if state else entry.get('StationName', '')
-        is_at_carrier = (station_type and 'fleetcarrier' in station_type.lower()) or (
-            station_name and 'FC' in station_name.upper()
-        )
-        
-        if event_name in ['CarrierJump', 'CarrierDepositFuel', 'CarrierStats']:
-            # Always update for carrier-specific events
-            updated = galaxy_gps.fleet_carrier_manager.update_carrier_from_journal(
-                event_name, entry, state, source_galaxy
-            )
-            # Update GUI if carrier was updated
-            if updated:
-                if hasattr(galaxy_gps, 'update_fleet_carrier_dropdown'):
-                    galaxy_gps.update_fleet_carrier_dropdown()
-                if hasattr(galaxy_gps, 'update_fleet_carrier_system_display'):
-                    galaxy_gps.update_fleet_carrier_system_display()
-                if hasattr(galaxy_gps, 'update_fleet_carrier_rings_status'):
-                    galaxy_gps.update_fleet_carrier_rings_status()
-                if hasattr(galaxy_gps, 'update_fleet_carrier_tritium_display'):
-                    galaxy_gps.update_fleet_carrier_tritium_display()
-                if hasattr(galaxy_gps, 'update_fleet_carrier_balance_display'):
-                    galaxy_gps.update_fleet_carrier_balance_display()
-                if hasattr(galaxy_gps, 'check_fleet_carrier_restock_warning'):
-                    galaxy_gps.check_fleet_carrier_restock_warning()
-        
-        elif event_name == 'Cargo' and is_at_carrier:
-            # Only update cargo if we're at a fleet carrier station
-            updated = galaxy_gps.fleet_carrier_manager.update_carrier_from_journal(
-                event_name, entry, state, source_galaxy
-            )
-            
-            # Also update detailed cargo cache (fallback when CAPI not available)
-            if galaxy_gps.cargo_manager:
-                callsign = galaxy_gps.fleet_carrier_manager.find_carrier_for_journal_event(entry, state)
-                if callsign:
-                    inventory = entry.get('Inventory', [])
-                    if isinstance(inventory, list):
-                        # Pass journal timestamp for proper comparison
-                        event_timestamp = entry.get('timestamp', '')
-                        galaxy_gps.cargo_manager.update_cargo_from_journal(callsign, inventory, source_galaxy, event_timestamp)
-            
-            # Update GUI if carrier was updated
-            if updated:
-                if hasattr(galaxy_gps, 'update_fleet_carrier_dropdown'):
-                    galaxy_gps.update_fleet_carrier_dropdown()
-                if hasattr(galaxy_gps, 'update_fleet_carrier_system_display'):
-                    galaxy_gps.update_fleet_carrier_system_display()
-                if hasattr(galaxy_gps, 'update_fleet_carrier_rings_status'):
-                    galaxy_gps.update_fleet_carrier_rings_status()
-                if hasattr(galaxy_gps, 'update_fleet_carrier_tritium_display'):
-                    galaxy_gps.update_fleet_carrier_tritium_display()
-                if hasattr(galaxy_gps, 'update_fleet_carrier_balance_display'):
-                    galaxy_gps.update_fleet_carrier_balance_display()
-        
-        elif event_name == 'Location' and is_at_carrier and entry.get('Docked'):
-            # Location event when docked at carrier - update location if carrier moved
-            # Only update if we have a new system (carrier may have jumped)
-            new_system = entry.get('StarSystem', '')
-            if new_system:
-                # Find carrier by station name pattern
-                callsign = galaxy_gps.fleet_carrier_manager.find_carrier_for_journal_event(entry, state)
-                if callsign:
-                    carrier = galaxy_gps.fleet_carrier_manager.get_carrier(callsign)
-                    if carrier and carrier.get('current_system', '').lower() != new_system.lower():
-                        # Carrier location changed - update it
-                        location_event_data = {
-                            'StationName': entry.get('StationName', station_name),
-                            'StarSystem': new_system,
-                            'SystemAddress': str(entry.get('SystemAddress', ''))
-                        }
-                        updated = galaxy_gps.fleet_carrier_manager.update_carrier_from_journal(
-                            'CarrierJump', location_event_data, state, source_galaxy
-                        )
-                        
-                        # Update GUI if carrier location was updated
-                        if updated:
-                            if hasattr(galaxy_gps, 'update_fleet_carrier_dropdown'):
-                                galaxy_gps.update_fleet_carrier_dropdown()
-                            if hasattr(galaxy_gps, 'update_fleet_carrier_system_display'):
-                                galaxy_gps.update_fleet_carrier_system_display()
-                            if hasattr(galaxy_gps, 'update_fleet_carrier_rings_status'):
-                                galaxy_gps.update_fleet_carrier_rings_status()
-                            if hasattr(galaxy_gps, 'update_fleet_carrier_tritium_display'):
-                                galaxy_gps.update_fleet_carrier_tritium_display()
-                            if hasattr(galaxy_gps, 'update_fleet_carrier_balance_display'):
-                                galaxy_gps.update_fleet_carrier_balance_display()
-                            if hasattr(galaxy_gps, 'check_fleet_carrier_restock_warning'):
-                                galaxy_gps.check_fleet_carrier_restock_warning()
+    # Route, carrier, cargo, ships and modules handlers are looked up by event name
+    if _journal_dispatcher:
+        _journal_dispatcher.dispatch(entry, state)
 
 
 def ask_for_update():
@@ -284,18 +180,17 @@ def plugin_app(parent):
             logger.error("init_gui returned None - plugin will not display")
             return None
         
+        # Deliver API change notifications through the plugin frame (Tk thread)
+        try:
+            from GalaxyGPS import api
+            api.attach_tk(frame)
+        except Exception as e:
+            logger.warning(f"Failed to attach API notifications: {e}")
         galaxy_gps.open_last_route()
         # Update fleet carrier status display if carrier data exists
-        if hasattr(galaxy_gps, 'update_fleet_carrier_dropdown'):
-            galaxy_gps.update_fleet_carrier_dropdown()
-        if hasattr(galaxy_gps, 'update_fleet_carrier_system_display'):
-            galaxy_gps.update_fleet_carrier_system_display()
-        if hasattr(galaxy_gps, 'update_fleet_carrier_rings_status'):
-            galaxy_gps.update_fleet_carrier_rings_status()
-        if hasattr(galaxy_gps, 'update_fleet_carrier_tritium_display'):
-            galaxy_gps.update_fleet_carrier_tritium_display()
-        if hasattr(galaxy_gps, 'update_fleet_carrier_balance_display'):
-            galaxy_gps.update_fleet_carrier_balance_display()
+        galaxy_gps.request_fleet_carrier_refresh()
+        # Load cargo, ships and modules caches in the background (otherwise loaded on first use)
+        galaxy_gps.start_carrier_cache_prefetch()
         # Run update check off main thread; poll queue and show dialog when done
         root = parent.winfo_toplevel()
         threading.Thread(target=_run_update_check, daemon=True).start()
@@ -367,26 +262,5 @@ def capi_fleetcarrier(data):
                 if isinstance(cargo_array, list):
                     galaxy_gps.cargo_manager.update_cargo_from_capi(callsign, cargo_array, source_galaxy)
         
-        # Update the status display in the GUI
-        if hasattr(galaxy_gps, 'update_fleet_carrier_dropdown'):
-            galaxy_gps.update_fleet_carrier_dropdown()
-        
-        # Update fleet carrier system display
-        if hasattr(galaxy_gps, 'update_fleet_carrier_system_display'):
-            galaxy_gps.update_fleet_carrier_system_display()
-        
-        # Update fleet carrier rings status (Icy Rings and Pristine)
-        if hasattr(galaxy_gps, 'update_fleet_carrier_rings_status'):
-            galaxy_gps.update_fleet_carrier_rings_status()
-        
-        # Update fleet carrier Tritium display
-        if hasattr(galaxy_gps, 'update_fleet_carrier_tritium_display'):
-            galaxy_gps.update_fleet_carrier_tritium_display()
-        
-        # Update fleet carrier balance display
-        if hasattr(galaxy_gps, 'update_fleet_carrier_balance_display'):
-            galaxy_gps.update_fleet_carrier_balance_display()
-        
-        # Update fleet carrier restock warning
-        if hasattr(galaxy_gps, 'check_fleet_carrier_restock_warning'):
-            galaxy_gps.check_fleet_carrier_restock_warning()
+        # Refresh dropdown, system, rings, Tritium, balance and restock warning in one idle pass
+        galaxy_gps.request_fleet_carrier_refresh()